@@ -0,0 +1,130 @@
+"""
+Checking the dependency changes of many projects at once.
+
+The changes of all projects are merged so that each package is researched once, covering the
+widest version range any project needs, and the results are sliced back into per-project reports.
+"""
+
+import dataclasses
+import logging
+from collections.abc import Hashable
+
+from distlib.version import NormalizedVersion, UnsupportedVersionError
+
+from .core import ChangelogChecker
+from .models import ChangelogEntry, ChangeType, DependencyChange, PackageReport
+from .parsers.requirements_parser import normalize_name
+
+logger = logging.getLogger("changelog_checker.batch")
+
+
+def _parse_version(version: str | None) -> NormalizedVersion | None:
+    if version is None:
+        return None
+    try:
+        return NormalizedVersion(version)
+    except UnsupportedVersionError:
+        return None
+
+
+def _merge_key(change: DependencyChange) -> Hashable:
+    """Key under which a change is merged with the changes of other projects."""
+    if (
+        change.change_type == ChangeType.UPDATED
+        and _parse_version(change.old_version) is not None
+        and _parse_version(change.new_version) is not None
+    ):
+        return normalize_name(change.name)
+    return (normalize_name(change.name), change.change_type, change.old_version, change.new_version)
+
+
+def _widen(merged: DependencyChange | None, change: DependencyChange) -> DependencyChange:
+    """Return an update covering the versions of both updates of a package."""
+    if merged is None or merged.change_type != ChangeType.UPDATED:
+        return change
+    old_version = merged.old_version
+    if NormalizedVersion(change.old_version) < NormalizedVersion(merged.old_version):
+        old_version = change.old_version
+    new_version = merged.new_version
+    if NormalizedVersion(change.new_version) > NormalizedVersion(merged.new_version):
+        new_version = change.new_version
+    return dataclasses.replace(merged, old_version=old_version, new_version=new_version)
+
+
+def merge_changes(projects: dict[str, list[DependencyChange]]) -> dict[Hashable, DependencyChange]:
+    """
+    Merge the dependency changes of several projects.
+
+    Updates of a package are merged into one update from the oldest to the newest version of any
+    project. Other changes are only merged when they are identical.
+
+    Args:
+        projects: Dependency changes by project name
+
+    Returns:
+        Merged changes by merge key, in the order they were first seen
+    """
+    merged: dict[Hashable, DependencyChange] = {}
+    for changes in projects.values():
+        for change in changes:
+            key = _merge_key(change)
+            merged[key] = _widen(merged.get(key), change)
+    return merged
+
+
+def _entry_in_range(entry: ChangelogEntry, change: DependencyChange) -> bool:
+    """Check if a changelog entry is newer than the old version of a change and not newer than its new version."""
+    version = _parse_version(entry.version)
+    old_version = _parse_version(change.old_version)
+    new_version = _parse_version(change.new_version)
+    if version is None or old_version is None or new_version is None:
+        return False
+    return bool(old_version < version <= new_version)
+
+
+def slice_report(report: PackageReport, change: DependencyChange) -> PackageReport:
+    """
+    Build the report of one project's change from the report of a merged change.
+
+    Args:
+        report: Report of the merged change
+        change: Change of the project, within the range of the merged change
+
+    Returns:
+        PackageReport with the changelog entries within the range of the project's change
+    """
+    if change == report.dependency_change:
+        entries = list(report.changelog_entries)
+    else:
+        entries = [entry for entry in report.changelog_entries if _entry_in_range(entry, change)]
+    package_info = report.package_info
+    if package_info is not None and package_info.changelog_found and not entries:
+        package_info = dataclasses.replace(package_info, changelog_found=False)
+    return PackageReport(
+        dependency_change=change,
+        package_info=package_info,
+        changelog_entries=entries,
+        error_message=report.error_message,
+        duration=report.duration,
+    )
+
+
+def check_projects(checker: ChangelogChecker, projects: dict[str, list[DependencyChange]]) -> dict[str, list[PackageReport]]:
+    """
+    Check the dependency changes of several projects, researching each package once.
+
+    Args:
+        checker: Changelog checker whose formatter shows the progress of the merged check
+        projects: Dependency changes by project name
+
+    Returns:
+        Reports by project name, in the order of each project's changes
+    """
+    merged = merge_changes(projects)
+    total_changes = sum(len(changes) for changes in projects.values())
+    logger.info(f"Checking {len(merged)} unique changes for {total_changes} changes in {len(projects)} projects")
+    reports = dict(zip(merged, checker.check_changes(list(merged.values())), strict=True))
+    return {
+        project: [slice_report(reports[_merge_key(change)], change) for change in changes]
+        for project, changes in projects.items()
+    }
@@ -0,0 +1,227 @@
+"""
+Cache for data reused within a run and, optionally, across runs.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+PRUNE_INTERVAL = 24 * 3600
+PRUNE_MARKER = ".last-prune"
+# Subdirectories of the cache directory written by changelog-checker. Prune and clear only touch
+# these, as the cache directory may be shared with other files.
+CACHE_NAMESPACES = ("changelog-blobs", "changelog-index", "github-releases", "rendered-html", "rendered-terminal")
+
+
+def get_default_cache_dir() -> Path:
+    """Return the default on-disk cache directory, respecting XDG_CACHE_HOME."""
+    base_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base_dir) / "changelog-checker"
+
+
+class Cache:
+    """Key-value cache kept in memory and, if a directory is given, persisted on disk."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_memory_entries: int = 0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Optional directory for persisting entries across runs. Memory only if not set.
+            max_age: Seconds an entry on disk is kept without being used, or 0 to keep entries until pruned by size
+            max_size: Total size in bytes of the entries on disk that prune keeps, or 0 for no limit
+            max_memory_entries: Number of entries kept in memory, the least recently used being dropped first,
+                or 0 for no limit
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_age = max_age
+        self.max_size = max_size
+        self.max_memory_entries = max_memory_entries
+        self.logger = logging.getLogger("changelog_checker.cache")
+        self._memory: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_bytes(self, namespace: str, key: str) -> bytes | None:
+        """Return cached bytes or None if not cached."""
+        found, data = self._recall(namespace, key)
+        if found:
+            self.hits += 1
+            return data
+        data = self._read(namespace, key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(namespace, key, data)
+        return data
+
+    def set_bytes(self, namespace: str, key: str, data: bytes) -> None:
+        """Store bytes in the cache."""
+        self._remember(namespace, key, data)
+        self._write(namespace, key, data)
+
+    def get_json(self, namespace: str, key: str) -> Any:
+        """Return a cached JSON-compatible value or None if not cached."""
+        found, value = self._recall(namespace, key)
+        if found:
+            self.hits += 1
+            return value
+        data = self._read(namespace, key)
+        if data is None:
+            self.misses += 1
+            return None
+        try:
+            value = json.loads(data)
+        except ValueError as e:
+            self.logger.debug(f"Ignoring corrupted cache entry {namespace}/{key}: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(namespace, key, value)
+        return value
+
+    def set_json(self, namespace: str, key: str, value: Any) -> None:
+        """Store a JSON-compatible value in the cache."""
+        self._remember(namespace, key, value)
+        self._write(namespace, key, json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def _recall(self, namespace: str, key: str) -> tuple[bool, Any]:
+        """Look up an entry kept in memory, marking it as recently used."""
+        with self._memory_lock:
+            if (namespace, key) not in self._memory:
+                return False, None
+            self._memory.move_to_end((namespace, key))
+            return True, self._memory[namespace, key]
+
+    def _remember(self, namespace: str, key: str, value: Any) -> None:
+        """Keep an entry in memory, dropping the least recently used entries beyond max_memory_entries."""
+        with self._memory_lock:
+            self._memory[namespace, key] = value
+            self._memory.move_to_end((namespace, key))
+            while self.max_memory_entries and len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, namespace: str, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / namespace / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _read(self, namespace: str, key: str) -> bytes | None:
+        path = self._path(namespace, key)
+        if path is None:
+            return None
+        try:
+            if self.max_age and time.time() - path.stat().st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                return None
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.debug(f"Failed to read cache entry {path}: {e}")
+            return None
+
+    def _write(self, namespace: str, key: str, data: bytes) -> None:
+        path = self._path(namespace, key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temp_file:
+                temp_file.write(data)
+            os.replace(temp_file.name, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache entry {path}: {e}")
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return []
+        entries = []
+        for namespace in CACHE_NAMESPACES:
+            for path in self.cache_dir.glob(f"{namespace}/*"):
+                with contextlib.suppress(OSError):
+                    entries.append((path, path.stat()))
+        return entries
+
+    def prune(self) -> int:
+        """
+        Remove the entries on disk that were not used for max_age, then the least recently used
+        entries until the remaining ones fit into max_size. Only the CACHE_NAMESPACES directories are pruned.
+
+        Returns:
+            Number of removed entries
+        """
+        now = time.time()
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime, reverse=True)
+        total_size = 0
+        removed = 0
+        for path, stat in entries:
+            expired = bool(self.max_age) and now - stat.st_mtime > self.max_age
+            if expired or (self.max_size and total_size + stat.st_size > self.max_size):
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                    removed += 1
+            else:
+                total_size += stat.st_size
+        if removed:
+            self.logger.debug(f"Pruned {removed} cache entries, keeping {total_size} bytes")
+        return removed
+
+    def prune_if_due(self) -> None:
+        """Prune the entries on disk if they were not pruned within the last PRUNE_INTERVAL seconds."""
+        if self.cache_dir is None:
+            return
+        marker = self.cache_dir / PRUNE_MARKER
+        try:
+            if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL:
+                return
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug(f"Failed to check cache prune marker {marker}: {e}")
+            return
+        self.prune()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError as e:
+            self.logger.debug(f"Failed to update cache prune marker {marker}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries from memory and the cache namespaces on disk, keeping other files."""
+        with self._memory_lock:
+            self._memory.clear()
+        if self.cache_dir is None:
+            return
+        for namespace in CACHE_NAMESPACES:
+            shutil.rmtree(self.cache_dir / namespace, ignore_errors=True)
+
+
+def make_cache_key(*parts: str) -> str:
+    """Build a fixed-length cache key identifying all of the given parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8", errors="surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -2,17 +2,397 @@
 Command-line interface for the changelog checker.
 """
 
+import itertools
+import logging
+import re
 import sys
-from typing import TextIO
+from collections.abc import Callable, Iterator, Sequence
+from functools import partial
+from pathlib import Path
+from typing import Any, NoReturn, TextIO
 
 import click
+from rich.console import Console
 
+from .batch import check_projects
+from .cache import Cache, get_default_cache_dir
 from .core import ChangelogChecker
-from .output import HTMLFormatter, RichFormatter
+from .git_range import diff_git_range
+from .models import DependencyChange, PackageReport
+from .output import HTMLDirFormatter, HTMLFormatter, JSONFormatter, MultiFormatter, RichFormatter
+from .output.json_formatter import STDOUT_PATH
+from .output.rendering import RENDER_TIMEOUT
+from .parsers import BaseParser
+from .parsers.registry import AUTO_PARSER, BUILTIN_PARSERS, get_parser_names
+from .research.changelog_finder import GITHUB_API_URL
+from .research.package_finder import PYPI_URL
+from .serialization import load_reports
+from .server_defaults import DEFAULT_HOST, DEFAULT_MEMORY_ENTRIES, DEFAULT_PORT, DEFAULT_REPORT_TTL
+from .sharding import Shard, merge_results
 from .utils import ChangelogCheckerError, NetworkError, ParserError, setup_logging
 
+DEFAULT_OUTPUT_FILES = {
+    "html": "changelog_report.html",
+    "html-dir": "changelog_report",
+    "json": "changelog_report.json",
+    "ndjson": "changelog_report.ndjson",
+}
+OUTPUT_FILE_SUFFIXES = {"html": ".html", "html-dir": "", "json": ".json", "ndjson": ".ndjson"}
 
-@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+
+def create_formatter(
+    output_format: str,
+    output_file: str | None,
+    cache: Cache,
+    render_workers: int = 0,
+    render_timeout: float = RENDER_TIMEOUT,
+    client_render: bool = False,
+) -> HTMLFormatter | RichFormatter | JSONFormatter:
+    """
+    Create the formatter for an output format.
+
+    Args:
+        output_format: Output format name
+        output_file: Output path, or None for the default path of the format
+        cache: Cache for rendered changelog content
+        render_workers: Number of worker processes for rendering changelog entries
+        render_timeout: Time budget in seconds for rendering one changelog entry
+        client_render: Render changelogs of HTML reports in the browser
+
+    Returns:
+        Formatter instance
+    """
+    output_file = output_file or DEFAULT_OUTPUT_FILES.get(output_format, "")
+    if output_format == "html":
+        return HTMLFormatter(
+            output_file=output_file,
+            cache=cache,
+            render_workers=render_workers,
+            render_timeout=render_timeout,
+            client_render=client_render,
+        )
+    if output_format == "html-dir":
+        output_path = Path(output_file)
+        return HTMLDirFormatter(
+            output_dir=str(output_path.with_suffix("") if output_path.suffix == ".html" else output_path),
+            cache=cache,
+            render_workers=render_workers,
+            render_timeout=render_timeout,
+            client_render=client_render,
+        )
+    if output_format in ("json", "ndjson"):
+        return JSONFormatter(output_file=output_file, ndjson=output_format == "ndjson")
+    return RichFormatter(cache=cache, render_workers=render_workers, render_timeout=render_timeout)
+
+
+def create_formatters(
+    output_formats: Sequence[str],
+    output_file: str | None,
+    cache: Cache,
+    render_workers: int = 0,
+    render_timeout: float = RENDER_TIMEOUT,
+    client_render: bool = False,
+) -> HTMLFormatter | RichFormatter | JSONFormatter | MultiFormatter:
+    """
+    Create the formatter for one or more output formats.
+
+    With several formats, the output file is used as a base path and each format gets its own
+    suffix, so "-o report -f html -f json" writes report.html and report.json.
+
+    Args:
+        output_formats: Output format names
+        output_file: Output path, or None for the default paths of the formats
+        cache: Cache for rendered changelog content, shared by all formatters
+        render_workers: Number of worker processes for rendering changelog entries
+        render_timeout: Time budget in seconds for rendering one changelog entry
+        client_render: Render changelogs of HTML reports in the browser
+
+    Returns:
+        Formatter instance
+    """
+    output_formats = list(dict.fromkeys(output_formats)) or ["terminal"]
+    if len(output_formats) == 1:
+        return create_formatter(output_formats[0], output_file, cache, render_workers, render_timeout, client_render)
+    if output_file == STDOUT_PATH:
+        raise click.UsageError("Writing to stdout is only supported with a single output format")
+    base_path = None
+    if output_file:
+        output_path = Path(output_file)
+        base_path = output_path.with_suffix("") if output_path.suffix in OUTPUT_FILE_SUFFIXES.values() else output_path
+    formatters = [
+        create_formatter(
+            output_format,
+            str(base_path) + OUTPUT_FILE_SUFFIXES.get(output_format, "") if base_path else None,
+            cache,
+            render_workers,
+            render_timeout,
+            client_render,
+        )
+        for output_format in output_formats
+    ]
+    return MultiFormatter(formatters)
+
+
+def get_project_output_file(output_file: str | None, output_formats: Sequence[str], project: str) -> str:
+    """
+    Build the output path of the report for one of several projects.
+
+    The project name, such as a lockfile path, is added to the name of the output path, so
+    "-o report.html" for "backend/uv.lock" gives "report-backend-uv-lock.html".
+
+    Args:
+        output_file: Output path, or None for the default path of the formats
+        output_formats: Output format names
+        project: Project name, such as the path of its lockfile or input file
+
+    Returns:
+        Output path for the project
+    """
+    if output_file == STDOUT_PATH:
+        return output_file
+    if output_file is None:
+        formats = set(output_formats)
+        output_file = DEFAULT_OUTPUT_FILES.get(formats.pop(), "changelog_report") if len(formats) == 1 else "changelog_report"
+    output_path = Path(output_file)
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", project).strip("-")
+    return str(output_path.with_name(f"{output_path.stem}-{slug}{output_path.suffix}"))
+
+
+def display_reports(
+    formatter: HTMLFormatter | RichFormatter | JSONFormatter | MultiFormatter,
+    reports: list[PackageReport],
+    save_results: str | None,
+) -> None:
+    """Complete the output of a formatter and optionally save the results."""
+    formatter.display_results(reports)
+    if save_results:
+        JSONFormatter(output_file=save_results).display_results(reports)
+
+
+def check_git_range(
+    git_range: str,
+    github_token: str | None,
+    cache: Cache,
+    make_formatter: Callable[[str | None], HTMLFormatter | RichFormatter | JSONFormatter | MultiFormatter],
+    output_formats: Sequence[str],
+    output_file: str | None,
+    save_results: str | None,
+    shard: Shard | None = None,
+) -> list[PackageReport]:
+    """
+    Check the dependency changes of the lockfiles changed in a git revision range.
+
+    Each changed lockfile gets its own output. When several lockfiles changed, the lockfile path
+    is added to the output paths.
+
+    Args:
+        git_range: Revision range, such as "main..HEAD"
+        github_token: Optional GitHub API token
+        cache: Cache shared by the checks of all lockfiles
+        make_formatter: Function creating the formatter for an output path
+        output_formats: Output format names
+        output_file: Output path, or None for the default path of the formats
+        save_results: Optional path for saving the results as JSON
+        shard: Optional shard of the run
+
+    Returns:
+        List of PackageReport objects of all lockfiles
+    """
+    logger = logging.getLogger("changelog_checker")
+    lockfile_changes = diff_git_range(git_range)
+    if not lockfile_changes:
+        logger.info(f"No lockfile changes found in {git_range}")
+        display_reports(make_formatter(output_file), [], save_results)
+        return []
+    several = len(lockfile_changes) > 1
+    all_reports = []
+    for lockfile_path, changes in lockfile_changes.items():
+        logger.info(f"Checking {len(changes)} dependency changes in {lockfile_path}")
+        formatter = make_formatter(
+            get_project_output_file(output_file, output_formats, lockfile_path) if several else output_file
+        )
+        formatter.display_progress(f"Checking {lockfile_path}")
+        checker = ChangelogChecker(github_token=github_token, formatter=formatter, cache=cache, shard=shard)
+        reports = checker.check_changes(changes)
+        lockfile_save_results = save_results
+        if save_results and several:
+            lockfile_save_results = get_project_output_file(save_results, ["json"], lockfile_path)
+        display_reports(formatter, reports, lockfile_save_results)
+        all_reports.extend(reports)
+    return all_reports
+
+
+def parse_shard(ctx: click.Context, param: click.Parameter, value: str | None) -> Shard | None:
+    """Parse the --shard option."""
+    if value is None:
+        return None
+    try:
+        return Shard.parse(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+def validate_parser_name(ctx: click.Context, param: click.Parameter, value: str) -> str:
+    """Check that a parser is registered under the given name, without importing it."""
+    if value in BUILTIN_PARSERS or value == AUTO_PARSER:
+        return value
+    names = [*get_parser_names(), AUTO_PARSER]
+    if value not in names:
+        raise click.BadParameter(f"{value!r} is not one of {', '.join(names)}")
+    return value
+
+
+def get_parser(parser_type: str, installed_file: TextIO | None) -> str | BaseParser:
+    """
+    Get the parser to pass to the checker for a parser type.
+
+    Args:
+        parser_type: Parser type name
+        installed_file: Optional installed packages to compare pip installation reports with
+
+    Returns:
+        Parser type name, or a parser instance if it needs options
+    """
+    if parser_type == "pip-report" and installed_file is not None:
+        from .parsers.pip_report_parser import PipReportParser, load_installed_versions
+
+        return PipReportParser(load_installed_versions(installed_file.read()))
+    return parser_type
+
+
+def read_input(input_file: TextIO | None) -> str | Iterator[str]:
+    """
+    Read package manager output from a file or stdin, exiting if there is none.
+
+    Stdin is read line by line, so dependency changes can be checked while the package manager is
+    still writing its output.
+
+    Args:
+        input_file: Input file, or None to read stdin
+
+    Returns:
+        Input text, or an iterator over the lines of stdin
+    """
+    logger = logging.getLogger("changelog_checker")
+    if input_file:
+        logger.debug(f"Reading input from file: {input_file.name}")
+        input_text = input_file.read()
+        if not input_text.strip():
+            exit_empty_input()
+        logger.debug(f"Input length: {len(input_text)} characters")
+        return input_text
+    if sys.stdin.isatty():
+        click.echo("Error: No input provided. Use --input-file or pipe input to stdin.")
+        click.echo("Example: uv sync -U 2>&1 | changelog-checker")
+        sys.exit(1)
+    logger.debug("Streaming input from stdin")
+    blank_lines: list[str] = []
+    for line in sys.stdin:
+        if line.strip():
+            return itertools.chain(blank_lines, [line], sys.stdin)
+        blank_lines.append(line)
+    exit_empty_input()
+
+
+def exit_empty_input() -> NoReturn:
+    """Report empty input and exit."""
+    logging.getLogger("changelog_checker").error("Empty input provided")
+    click.echo("Error: Empty input provided.")
+    sys.exit(1)
+
+
+def logging_options(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the logging options to a command."""
+    function = click.option(
+        "--verbose",
+        "-v",
+        is_flag=True,
+        help="Enable verbose output (equivalent to --log-level DEBUG)",
+    )(function)
+    return click.option(
+        "--log-level",
+        default="INFO",
+        type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"]),
+        help="Logging level (default: INFO)",
+    )(function)
+
+
+def open_cache(cache_dir: Path, no_cache: bool, max_memory_entries: int = 0) -> Cache:
+    """Create the cache of a command, pruning old entries from disk once a day."""
+    cache = Cache(None if no_cache else cache_dir, max_memory_entries=max_memory_entries)
+    cache.prune_if_due()
+    return cache
+
+
+def cache_options(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the cache options to a command."""
+    function = click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Do not persist cached data between runs",
+    )(function)
+    return click.option(
+        "--cache-dir",
+        envvar="CHANGELOG_CHECKER_CACHE_DIR",
+        default=get_default_cache_dir,
+        type=click.Path(file_okay=False, path_type=Path),
+        help="Directory for caching changelog data between runs (default: ~/.cache/changelog-checker)",
+    )(function)
+
+
+def output_options(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the report output options to a command."""
+    function = click.option(
+        "--render-timeout",
+        default=RENDER_TIMEOUT,
+        type=click.FloatRange(min=0),
+        help=(
+            "Seconds allowed for rendering one changelog entry before showing it as plain text, "
+            f"0 for no limit (default: {RENDER_TIMEOUT})"
+        ),
+    )(function)
+    function = click.option(
+        "--render-workers",
+        default=0,
+        type=click.IntRange(min=0),
+        help="Number of worker processes for rendering changelogs (default: 0, render in this process)",
+    )(function)
+    function = cache_options(function)
+    function = click.option(
+        "--client-render",
+        is_flag=True,
+        help=(
+            "Render changelogs in the browser when expanded instead of when generating HTML reports. "
+            "Only markdown is formatted, RST and plain text are shown as preformatted text"
+        ),
+    )(function)
+    function = click.option(
+        "--output-file",
+        "-o",
+        help=(
+            "Output file path, or directory for html-dir format without the .html suffix. "
+            "With several output formats, base path to which the suffix of each format is added. "
+            "Use - for stdout with json and ndjson formats "
+            "(default: changelog_report.html, changelog_report, changelog_report.json or changelog_report.ndjson)"
+        ),
+    )(function)
+    return click.option(
+        "--output-format",
+        "-f",
+        "output_formats",
+        multiple=True,
+        default=["terminal"],
+        type=click.Choice(["terminal", "html", "html-dir", "json", "ndjson"]),
+        help=(
+            "Output format: terminal (rich console), html (HTML file), html-dir "
+            "(directory with an index page and a page per package), json (single JSON document) "
+            "or ndjson (one JSON package report per line). Can be given several times to produce "
+            "several outputs from one run (default: terminal)"
+        ),
+    )(function)
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]}, invoke_without_command=True)
 @click.option(
     "--input-file",
     "-i",
@@ -23,48 +403,78 @@ from .utils import ChangelogCheckerError, NetworkError, ParserError, setup_loggi
     "--parser",
     "-p",
     default="uv",
-    type=click.Choice(["uv", "pip"]),
-    help="Parser type to use (default: uv)",
+    callback=validate_parser_name,
+    help=(
+        "Parser type to use: uv, pip, pip-report, a parser provided by a plugin, "
+        "or auto to detect it from the beginning of the input (default: uv)"
+    ),
 )
 @click.option(
-    "--log-level",
-    default="INFO",
-    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"]),
-    help="Logging level (default: INFO)",
+    "--installed-file",
+    type=click.File("r"),
+    help=(
+        "Installed packages to compare a pip-report installation report with, as pip list --format=json "
+        "or pip freeze output (default: packages installed in the current environment)"
+    ),
 )
 @click.option(
-    "--verbose",
-    "-v",
-    is_flag=True,
-    help="Enable verbose output (equivalent to --log-level DEBUG)",
+    "--lockfile-diff",
+    nargs=2,
+    type=click.File("r"),
+    metavar="OLD NEW",
+    help="Compare two uv.lock files instead of reading package manager output",
 )
+@click.option(
+    "--git-range",
+    metavar="RANGE",
+    help=(
+        "Compare the uv.lock, poetry.lock and requirements*.txt files committed in a git revision range, "
+        "such as main..HEAD, with one output per changed lockfile"
+    ),
+)
+@logging_options
 @click.option(
     "--github-token",
     "-t",
     envvar="GITHUB_TOKEN",
     help="GitHub API token for authentication (can also use GITHUB_TOKEN env var)",
 )
+@output_options
 @click.option(
-    "--output-format",
-    "-f",
-    default="terminal",
-    type=click.Choice(["terminal", "html"]),
-    help="Output format: terminal (rich console) or html (HTML file) (default: terminal)",
+    "--save-results",
+    type=click.Path(dir_okay=False),
+    help="Also save the results as JSON, to render them again later with the render command",
 )
 @click.option(
-    "--output-file",
-    "-o",
-    default="changelog_report.html",
-    help="Output file path for HTML format (default: changelog_report.html)",
+    "--shard",
+    metavar="I/N",
+    callback=parse_shard,
+    help=(
+        "Only check the I-th of N parts of the dependency changes, to split a run over N processes. "
+        "Packages are assigned to parts by name, the same way on every machine. "
+        "Combine the saved results of all parts with the merge command"
+    ),
 )
+@click.pass_context
 def main(
+    ctx: click.Context,
     input_file: TextIO | None,
     parser: str,
+    installed_file: TextIO | None,
+    lockfile_diff: tuple[TextIO, TextIO] | None,
+    git_range: str | None,
     log_level: str,
     verbose: bool,
     github_token: str | None,
-    output_format: str,
-    output_file: str,
+    output_formats: tuple[str, ...],
+    output_file: str | None,
+    client_render: bool,
+    cache_dir: Path,
+    no_cache: bool,
+    render_workers: int,
+    render_timeout: float,
+    save_results: str | None,
+    shard: Shard | None,
 ) -> None:
     """
     Changelog Checker - Analyze dependency updates and their changelogs.
@@ -78,35 +488,61 @@ def main(
 
         changelog-checker -i uv_output.txt
 
+        changelog-checker -p auto -i pip_outdated.txt
+
         changelog-checker -f html -o report.html -i uv_output.txt
+
+        pip install --dry-run -U -r requirements.txt --report - -q | changelog-checker -p pip-report
+
+        changelog-checker --lockfile-diff old/uv.lock uv.lock
+
+        changelog-checker --git-range main..HEAD -f html
+
+        changelog-checker -f html-dir -o report -i uv_output.txt
+
+        uv sync -U 2>&1 | changelog-checker -f ndjson -o - | jq .dependency_change.name
+
+        changelog-checker -f terminal -f html -f json -o report -i uv_output.txt
+
+        changelog-checker --save-results results.json -i uv_output.txt
+
+        changelog-checker render --from results.json -f html
+
+        changelog-checker --shard 1/4 -f json -o shard-1.json -i uv_output.txt
     """
+    if ctx.invoked_subcommand is not None:
+        return
     if verbose:
         log_level = "DEBUG"
     logger = setup_logging(log_level)
     logger.info(f"Starting changelog checker with log level: {log_level}")
+    cache = open_cache(cache_dir, no_cache)
+    make_formatter = partial(
+        create_formatters,
+        output_formats,
+        cache=cache,
+        render_workers=render_workers,
+        render_timeout=render_timeout,
+        client_render=client_render,
+    )
+    formatter = None if git_range else make_formatter(output_file)
     try:
-        if input_file:
-            logger.debug(f"Reading input from file: {input_file.name}")
-            input_text = input_file.read()
+        if git_range:
+            reports = check_git_range(
+                git_range, github_token, cache, make_formatter, output_formats, output_file, save_results, shard
+            )
         else:
-            if sys.stdin.isatty():
-                click.echo("Error: No input provided. Use --input-file or pipe input to stdin.")
-                click.echo("Example: uv sync -U 2>&1 | changelog-checker")
-                sys.exit(1)
-            logger.debug("Reading input from stdin")
-            input_text = sys.stdin.read()
-        if not input_text.strip():
-            logger.error("Empty input provided")
-            click.echo("Error: Empty input provided.")
-            sys.exit(1)
-        logger.debug(f"Input length: {len(input_text)} characters")
-        formatter: HTMLFormatter | RichFormatter = (
-            HTMLFormatter(output_file=output_file) if output_format == "html" else RichFormatter()
-        )
-        checker = ChangelogChecker(github_token=github_token, formatter=formatter)
-        reports = checker.check_dependencies(input_text, parser)
+            checker = ChangelogChecker(github_token=github_token, formatter=formatter, cache=cache, shard=shard)
+            if lockfile_diff:
+                from .parsers.uv_lock_parser import UVLockParser
+
+                old_lockfile, new_lockfile = lockfile_diff
+                logger.debug(f"Comparing lockfiles {old_lockfile.name} and {new_lockfile.name}")
+                reports = checker.check_changes(UVLockParser().diff(old_lockfile.read(), new_lockfile.read()))
+            else:
+                reports = checker.check_dependencies(read_input(input_file), get_parser(parser, installed_file))
+            display_reports(checker.formatter, reports, save_results)
         logger.info(f"Generated {len(reports)} package reports")
-        checker.formatter.display_results(reports)
         successful_reports = [r for r in reports if not r.error_message]
         error_reports = [r for r in reports if r.error_message]
         changelog_reports = [r for r in reports if r.changelog_entries]
@@ -114,6 +550,8 @@ def main(
             f"Summary: {len(successful_reports)} successful, {len(error_reports)} errors, "
             f"{len(changelog_reports)} with changelogs"
         )
+    except click.UsageError:
+        raise
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
         click.echo("\nOperation cancelled by user.")
@@ -138,5 +576,340 @@ def main(
         sys.exit(1)
 
 
+@main.command()
+@click.option(
+    "--from",
+    "results_file",
+    required=True,
+    type=click.File("r"),
+    help="Saved results from the json or ndjson output formats or --save-results",
+)
+@logging_options
+@output_options
+def render(
+    results_file: TextIO,
+    log_level: str,
+    verbose: bool,
+    output_formats: tuple[str, ...],
+    output_file: str | None,
+    client_render: bool,
+    cache_dir: Path,
+    no_cache: bool,
+    render_workers: int,
+    render_timeout: float,
+) -> None:
+    """
+    Render a report from saved results without fetching anything.
+
+    Example usage:
+
+        changelog-checker render --from results.json -f html -o report.html
+    """
+    if verbose:
+        log_level = "DEBUG"
+    logger = setup_logging(log_level)
+    try:
+        reports = load_reports(results_file.read())
+        logger.info(f"Loaded {len(reports)} package reports from {results_file.name}")
+        cache = open_cache(cache_dir, no_cache)
+        formatter = create_formatters(output_formats, output_file, cache, render_workers, render_timeout, client_render)
+        formatter.display_results(reports)
+    except ChangelogCheckerError as e:
+        logger.error(f"Changelog checker error: {e}")
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("results_files", metavar="RESULTS...", nargs=-1, required=True, type=click.File("r"))
+@logging_options
+@output_options
+def merge(
+    results_files: tuple[TextIO, ...],
+    log_level: str,
+    verbose: bool,
+    output_formats: tuple[str, ...],
+    output_file: str | None,
+    client_render: bool,
+    cache_dir: Path,
+    no_cache: bool,
+    render_workers: int,
+    render_timeout: float,
+) -> None:
+    """
+    Combine the saved results of the shards of a run into one report.
+
+    Example usage:
+
+        changelog-checker merge shard-1.json shard-2.json shard-3.json -f html -o report.html
+    """
+    if verbose:
+        log_level = "DEBUG"
+    logger = setup_logging(log_level)
+    try:
+        results = []
+        for results_file in results_files:
+            reports = load_reports(results_file.read())
+            logger.info(f"Loaded {len(reports)} package reports from {results_file.name}")
+            results.append(reports)
+        reports = merge_results(results)
+        logger.info(f"Merged {len(reports)} package reports from {len(results)} results files")
+        cache = open_cache(cache_dir, no_cache)
+        formatter = create_formatters(output_formats, output_file, cache, render_workers, render_timeout, client_render)
+        formatter.display_results(reports)
+    except ChangelogCheckerError as e:
+        logger.error(f"Changelog checker error: {e}")
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
+
+def read_projects(
+    checker: ChangelogChecker, inputs: Sequence[Path], parser_type: str, git_range: str | None
+) -> dict[str, list[DependencyChange]]:
+    """
+    Parse the dependency changes of the projects of a batch.
+
+    Args:
+        checker: Changelog checker parsing the input files
+        inputs: Package manager output files, one per project
+        parser_type: Parser type name for the input files
+        git_range: Optional revision range, each lockfile changed in it being a project
+
+    Returns:
+        Dependency changes by project name. Lockfiles changed in the revision range are named by their
+        path, prefixed with the range if an input file has the same path.
+    """
+    logger = logging.getLogger("changelog_checker")
+    projects = {}
+    for input_path in inputs:
+        logger.debug(f"Reading input from file: {input_path}")
+        projects[str(input_path)] = checker.parse_changes(input_path.read_text(), parser_type)
+    if git_range:
+        for path, changes in diff_git_range(git_range).items():
+            project = f"{git_range}:{path}" if path in projects else path
+            logger.debug(f"Checking the changes of {path} in {git_range} as {project}")
+            projects[project] = changes
+    return projects
+
+
+@main.command()
+@click.argument("inputs", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--parser",
+    "-p",
+    default=AUTO_PARSER,
+    callback=validate_parser_name,
+    help="Parser of the input files, or auto to detect it for each file (default: auto)",
+)
+@click.option(
+    "--git-range",
+    help="Also check each lockfile changed in a git revision range, such as main..HEAD, as a project",
+)
+@logging_options
+@click.option(
+    "--github-token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    help="GitHub API token for authentication (can also use GITHUB_TOKEN env var)",
+)
+@output_options
+@click.option(
+    "--save-results",
+    type=click.Path(dir_okay=False),
+    help="Also save the results of each project as JSON, adding the project name to the path",
+)
+def batch(
+    inputs: tuple[Path, ...],
+    parser: str,
+    git_range: str | None,
+    log_level: str,
+    verbose: bool,
+    github_token: str | None,
+    output_formats: tuple[str, ...],
+    output_file: str | None,
+    client_render: bool,
+    cache_dir: Path,
+    no_cache: bool,
+    render_workers: int,
+    render_timeout: float,
+    save_results: str | None,
+) -> None:
+    """
+    Check the dependency changes of several projects, fetching each package's changelog once.
+
+    Each input file holds the package manager output of one project. The changes of all projects
+    are merged, so a package updated in several projects is researched once for the widest version
+    range, and each project gets its own report. With several projects, the input path is added to
+    the output paths.
+
+    Example usage:
+
+        changelog-checker batch service-a/uv_output.txt service-b/uv_output.txt -f html
+
+        changelog-checker batch --git-range main..HEAD -f json -o reports/report.json
+    """
+    if verbose:
+        log_level = "DEBUG"
+    logger = setup_logging(log_level)
+    if not inputs and not git_range:
+        raise click.UsageError("Give input files or --git-range")
+    cache = open_cache(cache_dir, no_cache)
+    make_formatter = partial(
+        create_formatters,
+        output_formats,
+        cache=cache,
+        render_workers=render_workers,
+        render_timeout=render_timeout,
+        client_render=client_render,
+    )
+    progress_formatter = RichFormatter(cache=cache, console=Console(stderr=True))
+    try:
+        checker = ChangelogChecker(github_token=github_token, formatter=progress_formatter, cache=cache)
+        project_reports = check_projects(checker, read_projects(checker, inputs, parser, git_range))
+        several = len(project_reports) > 1
+        for project, reports in project_reports.items():
+            formatter = make_formatter(
+                get_project_output_file(output_file, output_formats, project) if several else output_file
+            )
+            formatter.display_progress(f"Report for {project}")
+            project_save_results = save_results
+            if save_results and several:
+                project_save_results = get_project_output_file(save_results, ["json"], project)
+            display_reports(formatter, reports, project_save_results)
+        logger.info(f"Generated reports for {len(project_reports)} projects")
+    except ChangelogCheckerError as e:
+        logger.error(f"Changelog checker error: {e}")
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
+
+@main.command()
+@click.option("--host", default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST})")
+@click.option(
+    "--port",
+    default=DEFAULT_PORT,
+    type=click.IntRange(min=0, max=65535),
+    help=f"Port to listen on, 0 for any free port (default: {DEFAULT_PORT})",
+)
+@logging_options
+@click.option(
+    "--github-token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    help="GitHub API token for authentication (can also use GITHUB_TOKEN env var)",
+)
+@cache_options
+@click.option(
+    "--report-ttl",
+    default=DEFAULT_REPORT_TTL,
+    type=click.FloatRange(min=0),
+    help=(
+        "Seconds a package report is reused for by later requests, 0 to only share the reports "
+        f"of checks running at the same time (default: {DEFAULT_REPORT_TTL:g})"
+    ),
+)
+@click.option(
+    "--pypi-url",
+    envvar="CHANGELOG_CHECKER_PYPI_URL",
+    default=PYPI_URL,
+    help=f"Base URL of the PyPI JSON API, such as a local stand-in (default: {PYPI_URL})",
+)
+@click.option(
+    "--github-api-url",
+    envvar="CHANGELOG_CHECKER_GITHUB_API_URL",
+    default=GITHUB_API_URL,
+    help=f"Base URL of the GitHub API, such as a local stand-in (default: {GITHUB_API_URL})",
+)
+def serve(
+    host: str,
+    port: int,
+    log_level: str,
+    verbose: bool,
+    github_token: str | None,
+    cache_dir: Path,
+    no_cache: bool,
+    report_ttl: float,
+    pypi_url: str,
+    github_api_url: str,
+) -> None:
+    """
+    Serve changelog checks over HTTP, keeping caches warm between requests.
+
+    POST package manager output to /check, or {"old": ..., "new": ...} lockfiles to /diff,
+    and receive the report. Choose the parser with ?parser= (default: auto), the lockfile type
+    with ?lockfile= (default: uv.lock) and the report with ?format=json, ndjson or html.
+
+    Example usage:
+
+        changelog-checker serve --port 8000
+
+        uv lock --upgrade 2>&1 | curl --data-binary @- "http://127.0.0.1:8000/check?format=html"
+    """
+    if verbose:
+        log_level = "DEBUG"
+    logger = setup_logging(log_level)
+    from .server import ChangelogServer, ChangelogService
+
+    service = ChangelogService(
+        github_token=github_token,
+        cache=open_cache(cache_dir, no_cache, DEFAULT_MEMORY_ENTRIES),
+        report_ttl=report_ttl,
+        pypi_url=pypi_url,
+        github_api_url=github_api_url,
+    )
+    try:
+        server = ChangelogServer(service, host, port)
+    except OSError as e:
+        service.close()
+        logger.error(f"Failed to listen on {host}:{port}: {e}")
+        click.echo(f"Error: Failed to listen on {host}:{port}: {e}")
+        sys.exit(1)
+    with server:
+        server_host, server_port = server.server_address[:2]
+        click.echo(f"Serving changelog checks on http://{server_host!s}:{server_port}", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Server stopped by user")
+
+
+@main.group("cache")
+def cache_command() -> None:
+    """
+    Manage the cache kept between runs.
+
+    Entries not used for 30 days are removed, and the least recently used entries are removed
+    while the cache is larger than 512 MB. This happens automatically once a day.
+    """
+
+
+@cache_command.command("prune")
+@click.option(
+    "--cache-dir",
+    envvar="CHANGELOG_CHECKER_CACHE_DIR",
+    default=get_default_cache_dir,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Cache directory (default: ~/.cache/changelog-checker)",
+)
+def cache_prune(cache_dir: Path) -> None:
+    """Remove expired entries and the least recently used entries over the size limit now."""
+    removed = Cache(cache_dir).prune()
+    click.echo(f"Removed {removed} cache entries from {cache_dir}")
+
+
+@cache_command.command("clear")
+@click.option(
+    "--cache-dir",
+    envvar="CHANGELOG_CHECKER_CACHE_DIR",
+    default=get_default_cache_dir,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Cache directory (default: ~/.cache/changelog-checker)",
+)
+def cache_clear(cache_dir: Path) -> None:
+    """Remove all cached data, keeping other files in the cache directory."""
+    Cache(cache_dir).clear()
+    click.echo(f"Cleared cache in {cache_dir}")
+
+
 if __name__ == "__main__":
     main()
@@ -2,85 +2,232 @@
 Core application logic for the changelog checker.
 """
 
+import itertools
 import logging
+import time
+from collections.abc import Iterable, Iterator, Sized
 
+from .cache import Cache
 from .models import ChangeType, DependencyChange, PackageReport
-from .output import HTMLFormatter, RichFormatter
-from .parsers import BaseParser, PipParser, UVParser
+from .output import HTMLFormatter, JSONFormatter, MultiFormatter, RichFormatter
+from .parsers import BaseParser
+from .parsers.registry import AUTO_DETECT_CHARS, AUTO_PARSER, create_parser, detect_parser
 from .research import ChangelogFinder, PackageFinder
+from .research.changelog_finder import GITHUB_API_URL
+from .research.package_finder import PYPI_URL
+from .sharding import Shard
+from .stats import RunStats
 from .utils import ChangelogCheckerError, NetworkError, ParserError
 
+VALIDATE_HEAD_LINES = 100
+
 
 class ChangelogChecker:
     """Main application class that orchestrates all components."""
 
-    def __init__(self, github_token: str | None = None, formatter: RichFormatter | HTMLFormatter | None = None):
+    def __init__(
+        self,
+        github_token: str | None = None,
+        formatter: RichFormatter | HTMLFormatter | JSONFormatter | MultiFormatter | None = None,
+        cache: Cache | None = None,
+        shard: Shard | None = None,
+        pypi_url: str = PYPI_URL,
+        github_api_url: str = GITHUB_API_URL,
+    ):
         """
         Initialize the changelog checker.
 
         Args:
             github_token: Optional GitHub API token.
             formatter: Optional formatter instance. Defaults to RichFormatter.
+            cache: Optional cache shared by the research components. Defaults to an in-memory cache.
+            shard: Optional shard of the run. Only the dependency changes belonging to it are checked.
+            pypi_url: Base URL of the PyPI JSON API
+            github_api_url: Base URL of the GitHub API
         """
+        self.cache = cache if cache is not None else Cache()
         self.logger = logging.getLogger("changelog_checker")
         self.formatter = formatter or RichFormatter()
-        self.package_finder = PackageFinder()
+        self.shard = shard
+        self.stats = RunStats(cache=self.cache)
+        self.package_finder = PackageFinder(stats=self.stats, pypi_url=pypi_url)
         if github_token:
             self.logger.debug("Using GitHub API token for authentication")
         else:
             self.logger.debug("No GitHub API token provided - using unauthenticated requests")
-        self.changelog_finder = ChangelogFinder(github_token=github_token)
+        self.changelog_finder = ChangelogFinder(
+            github_token=github_token, cache=self.cache, stats=self.stats, api_url=github_api_url
+        )
 
-    def check_dependencies(self, input_text: str, parser_type: str = "uv") -> list[PackageReport]:
+    def check_dependencies(self, input_text: str | Iterable[str], parser_type: str | BaseParser = "uv") -> list[PackageReport]:
         """
         Check dependencies and generate reports.
 
         Args:
-            input_text: Raw output from package manager
-            parser_type: Type of parser to use ("uv", etc.)
+            input_text: Raw output from package manager, or its lines as they are written. Lines are
+                validated once enough of them were read, and changes are checked as soon as the parser
+                recognizes them, while the package manager is still running. Reports of streamed lines
+                are in the order the parser recognizes the changes, see BaseParser.iter_parse.
+            parser_type: Name of the parser to use ("uv", "auto" to detect it from the input, etc.),
+                or a parser instance
 
         Returns:
             List of PackageReport objects
         """
         try:
-            parser: BaseParser
-            if parser_type == "uv":
-                parser = UVParser()
-            elif parser_type == "pip":
-                parser = PipParser()
-            else:
-                raise ParserError(f"Unsupported parser type: {parser_type}")
-            if not parser.validate_output(input_text):
-                raise ParserError(f"Input doesn't appear to be from {parser.get_package_manager_name()}")
-            self.logger.info(f"Using {parser.get_package_manager_name()} parser")
-            dependency_changes = parser.parse(input_text)
-            if not dependency_changes:
-                self.logger.info("No dependency changes found")
-                return []
+            if not isinstance(input_text, str):
+                lines: Iterator[str] = iter(input_text)
+                if parser_type == AUTO_PARSER:
+                    detection_head = self._read_head(lines, AUTO_DETECT_CHARS)
+                    parser = self._get_parser(parser_type, "".join(detection_head))
+                    lines = itertools.chain(detection_head, lines)
+                else:
+                    parser = self._get_parser(parser_type)
+                head = self._read_validated_head(parser, lines)
+                self.logger.info(f"Using {parser.get_package_manager_name()} parser")
+                return self.check_changes(parser.iter_parse(itertools.chain(head, lines)))
+            return self.check_changes(self.parse_changes(input_text, parser_type))
+        except ChangelogCheckerError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error in check_dependencies: {e}")
+            raise ChangelogCheckerError(f"Failed to check dependencies: {e}") from e
+
+    def parse_changes(self, input_text: str, parser_type: str | BaseParser = "uv") -> list[DependencyChange]:
+        """
+        Parse package manager output into dependency changes without checking them.
+
+        Args:
+            input_text: Raw output from package manager
+            parser_type: Name of the parser to use ("uv", "auto" to detect it from the input, etc.),
+                or a parser instance
+
+        Returns:
+            List of DependencyChange objects
+
+        Raises:
+            ParserError: If the output is not from the parser's package manager
+        """
+        parser = self._get_parser(parser_type, input_text[:AUTO_DETECT_CHARS])
+        if not parser.validate_output(input_text):
+            raise ParserError(f"Input doesn't appear to be from {parser.get_package_manager_name()}")
+        self.logger.info(f"Using {parser.get_package_manager_name()} parser")
+        dependency_changes = parser.parse(input_text)
+        if dependency_changes:
             self.logger.info(f"Found {len(dependency_changes)} dependency changes")
-            self.formatter.display_progress(f"Found {len(dependency_changes)} dependency changes")
+        return dependency_changes
+
+    def _get_parser(self, parser_type: str | BaseParser, output_head: str = "") -> BaseParser:
+        """Create the parser for a parser type, detecting it from the beginning of the output in auto mode."""
+        if isinstance(parser_type, BaseParser):
+            return parser_type
+        if parser_type == AUTO_PARSER:
+            parser = detect_parser(output_head)
+            self.logger.debug(f"Detected {parser.get_package_manager_name()} output ({parser.__class__.__name__})")
+            return parser
+        return create_parser(parser_type)
+
+    def _read_head(self, lines: Iterator[str], size: int) -> list[str]:
+        """Read lines until at least size characters were read or the output ends."""
+        head: list[str] = []
+        length = 0
+        for line in lines:
+            head.append(line)
+            length += len(line)
+            if length >= size:
+                break
+        return head
+
+    def _read_validated_head(self, parser: BaseParser, lines: Iterator[str]) -> list[str]:
+        """
+        Read lines until they validate as output of the parser's package manager.
+
+        The lines read are validated each time their number doubles, so validation stays linear in the
+        number of lines while the first changes are still checked early.
+
+        Returns:
+            Lines read
+
+        Raises:
+            ParserError: If the first VALIDATE_HEAD_LINES lines, or the whole output if shorter, are not valid
+        """
+        head: list[str] = []
+        next_validation = 1
+        for line in lines:
+            head.append(line)
+            if len(head) == next_validation:
+                if parser.validate_output("".join(head)):
+                    return head
+                if len(head) >= VALIDATE_HEAD_LINES:
+                    break
+                next_validation = min(2 * next_validation, VALIDATE_HEAD_LINES)
+        else:
+            if parser.validate_output("".join(head)):
+                return head
+        raise ParserError(f"Input doesn't appear to be from {parser.get_package_manager_name()}")
+
+    def check_changes(self, dependency_changes: Iterable[DependencyChange]) -> list[PackageReport]:
+        """
+        Generate reports for dependency changes.
+
+        Args:
+            dependency_changes: Dependency changes, for example from a lockfile diff. Changes yielded by an
+                iterator are processed as soon as they are yielded, before their total is known.
+
+        Returns:
+            List of PackageReport objects
+        """
+        if self.shard is not None:
+            dependency_changes = self._select_shard(self.shard, dependency_changes)
+        total = len(dependency_changes) if isinstance(dependency_changes, Sized) else None
+        if total == 0:
+            self.logger.info("No dependency changes found")
+            return []
+        try:
+            if total is not None:
+                self.formatter.display_progress(f"Found {total} dependency changes")
             reports = []
-            for i, change in enumerate(dependency_changes, 1):
-                self.formatter.display_progress(f"Processing {change.name} ({i}/{len(dependency_changes)})...")
-                try:
-                    report = self._generate_package_report(change)
+            self.stats.start(total or 0)
+            self.formatter.start_progress(self.stats)
+            try:
+                for i, change in enumerate(dependency_changes, 1):
+                    if total is None:
+                        self.stats.package_found()
+                    self.formatter.display_progress(f"Processing {change.name} ({i}/{total or '?'})...")
+                    started_at = time.perf_counter()
+                    try:
+                        report = self._generate_package_report(change)
+                    except Exception as e:
+                        self.logger.error(f"Failed to process {change.name}: {e}")
+                        report = PackageReport(
+                            dependency_change=change,
+                            package_info=None,
+                            changelog_entries=[],
+                            error_message=str(e),
+                        )
+                    report.duration = time.perf_counter() - started_at
                     reports.append(report)
-                except Exception as e:
-                    self.logger.error(f"Failed to process {change.name}: {e}")
-                    error_report = PackageReport(
-                        dependency_change=change,
-                        package_info=None,
-                        changelog_entries=[],
-                        error_message=str(e),
-                    )
-                    reports.append(error_report)
+                    self.stats.package_completed()
+                    self.formatter.display_report(report)
+            finally:
+                self.formatter.finish_progress()
+            if not reports:
+                self.logger.info("No dependency changes found")
             return reports
-        except ParserError:
+        except ChangelogCheckerError:
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error in check_dependencies: {e}")
+            self.logger.error(f"Unexpected error in check_changes: {e}")
             raise ChangelogCheckerError(f"Failed to check dependencies: {e}") from e
 
+    def _select_shard(self, shard: Shard, dependency_changes: Iterable[DependencyChange]) -> Iterable[DependencyChange]:
+        """Keep the dependency changes belonging to a shard, as a list if they were one."""
+        if not isinstance(dependency_changes, Sized):
+            return shard.select(dependency_changes)
+        selected = list(shard.select(dependency_changes))
+        self.logger.info(f"Shard {shard}: checking {len(selected)} of {len(dependency_changes)} dependency changes")
+        return selected
+
     def _generate_package_report(self, change: DependencyChange) -> PackageReport:
         """Generate a complete report for a single package."""
         report = PackageReport(
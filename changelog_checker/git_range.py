@@ -0,0 +1,129 @@
+"""
+Dependency changes between two git revisions, read from the lockfiles committed at each of them.
+"""
+
+import fnmatch
+import logging
+import shutil
+import subprocess
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from . import parsers
+from .models import DependencyChange
+from .utils import GitError
+
+if TYPE_CHECKING:
+    from .parsers import LockfileParser
+
+logger = logging.getLogger("changelog_checker.git_range")
+
+LOCKFILE_PATTERNS = [
+    ("uv.lock", "UVLockParser"),
+    ("poetry.lock", "PoetryLockParser"),
+    ("requirements*.txt", "RequirementsParser"),
+]
+
+
+def get_lockfile_parser(path: str) -> "LockfileParser | None":
+    """
+    Get the parser for a lockfile path, importing it only when it is needed.
+
+    Args:
+        path: Path of the file within the repository
+
+    Returns:
+        Parser instance, or None if the file is not a supported lockfile
+    """
+    name = PurePosixPath(path).name
+    for pattern, class_name in LOCKFILE_PATTERNS:
+        if fnmatch.fnmatchcase(name, pattern):
+            parser: LockfileParser = getattr(parsers, class_name)()
+            return parser
+    return None
+
+
+def run_git(*args: str, cwd: str | None = None) -> str:
+    """
+    Run a git command and return its output.
+
+    Raises:
+        GitError: If git is not available or the command fails
+    """
+    git = shutil.which("git")
+    if git is None:
+        raise GitError("git is not installed")
+    try:
+        result = subprocess.run([git, *args], cwd=cwd, capture_output=True, text=True, check=True)  # noqa: S603
+    except subprocess.CalledProcessError as e:
+        raise GitError(f"git {' '.join(args)} failed: {e.stderr.strip()}") from e
+    return result.stdout
+
+
+def parse_git_range(git_range: str, cwd: str | None = None) -> tuple[str, str]:
+    """
+    Resolve a revision range to the old and new revisions to compare.
+
+    Supports "A..B", "A...B" (compared from the merge base of A and B) and a single revision "A",
+    which is compared with HEAD. An empty side of a range means HEAD, like in git.
+
+    Args:
+        git_range: Revision range
+        cwd: Directory of the git repository
+
+    Returns:
+        Tuple of old and new revisions
+    """
+    if "..." in git_range:
+        old_ref, new_ref = git_range.split("...", 1)
+        new_ref = new_ref or "HEAD"
+        old_ref = run_git("merge-base", old_ref or "HEAD", new_ref, cwd=cwd).strip()
+    elif ".." in git_range:
+        old_ref, new_ref = git_range.split("..", 1)
+    else:
+        old_ref, new_ref = git_range, "HEAD"
+    return old_ref or "HEAD", new_ref or "HEAD"
+
+
+def list_lockfiles(ref: str, cwd: str | None = None) -> set[str]:
+    """List the paths of supported lockfiles committed at a revision."""
+    paths = run_git("ls-tree", "-r", "--name-only", "-z", ref, cwd=cwd).split("\0")
+    return {path for path in paths if path and get_lockfile_parser(path) is not None}
+
+
+def read_file(ref: str, path: str, cwd: str | None = None) -> str:
+    """Read a file committed at a revision."""
+    return run_git("show", f"{ref}:{path}", cwd=cwd)
+
+
+def diff_git_range(git_range: str, cwd: str | None = None) -> dict[str, list[DependencyChange]]:
+    """
+    Compare the lockfiles committed at two revisions.
+
+    Lockfiles only present at one of the revisions are compared with an empty lockfile.
+
+    Args:
+        git_range: Revision range, as accepted by parse_git_range
+        cwd: Directory of the git repository
+
+    Returns:
+        Dependency changes of each changed lockfile, by lockfile path
+    """
+    old_ref, new_ref = parse_git_range(git_range, cwd=cwd)
+    logger.debug(f"Comparing lockfiles between {old_ref} and {new_ref}")
+    old_paths = list_lockfiles(old_ref, cwd=cwd)
+    new_paths = list_lockfiles(new_ref, cwd=cwd)
+    lockfile_changes = {}
+    for path in sorted(old_paths | new_paths):
+        parser = get_lockfile_parser(path)
+        if parser is None:
+            continue
+        old_content = read_file(old_ref, path, cwd=cwd) if path in old_paths else ""
+        new_content = read_file(new_ref, path, cwd=cwd) if path in new_paths else ""
+        if old_content == new_content:
+            continue
+        changes = parser.diff(old_content, new_content)
+        logger.debug(f"Found {len(changes)} dependency changes in {path}")
+        if changes:
+            lockfile_changes[path] = changes
+    return lockfile_changes
@@ -4,6 +4,7 @@ Data models for the changelog checker.
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, overload
 
 
 class ChangeType(Enum):
@@ -43,13 +44,78 @@ class PackageInfo:
     changelog_found: bool = False
 
 
+def is_heading_underline(line: str) -> bool:
+    """Check if a stripped changelog line only underlines a heading (e.g. "-----" or "~~~~")."""
+    return bool(line) and len(set(line)) == 1 and line[0] in "-~=^#"
+
+
+class ChangelogText:
+    """
+    Changelog text stored as spans of a shared buffer and decoded on first use.
+
+    Entries parsed from the same changelog reference the same buffer instead of holding copies
+    of their sections. Heading underlines are dropped when decoding.
+    """
+
+    __slots__ = ("_buffer", "_spans", "_text")
+
+    def __init__(self, buffer: bytes | memoryview, spans: list[tuple[int, int]]) -> None:
+        """
+        Initialize the changelog text.
+
+        Args:
+            buffer: Raw changelog data
+            spans: List of (offset, length) spans of the buffer making up the text
+        """
+        self._buffer = memoryview(buffer)
+        self._spans = spans
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            lines: list[str] = []
+            for offset, length in self._spans:
+                body = str(self._buffer[offset : offset + length], "utf-8", "ignore")
+                lines.extend(line for line in body.removesuffix("\n").split("\n") if not is_heading_underline(line.strip()))
+            self._text = "\n".join(lines).strip()
+            self._buffer = memoryview(b"")
+            self._spans = []
+        return self._text
+
+
+class _LazyContent:
+    """Descriptor for entry content given either as a string or as ChangelogText decoded on first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: Any) -> "_LazyContent": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Any) -> str: ...
+
+    def __get__(self, instance: object | None, owner: Any) -> "str | _LazyContent":
+        if instance is None:
+            raise AttributeError(self.attribute)  # makes the dataclass field required
+        value = getattr(instance, self.attribute)
+        if isinstance(value, ChangelogText):
+            value = str(value)
+            setattr(instance, self.attribute, value)
+        return str(value)
+
+    def __set__(self, instance: object, value: str | ChangelogText) -> None:
+        setattr(instance, self.attribute, value)
+
+
 @dataclass
 class ChangelogEntry:
     """A single changelog entry."""
 
     version: str
-    content: str
+    content: _LazyContent = _LazyContent()
     date: str | None = None
+    content_format: str | None = None
 
 
 @dataclass
@@ -60,3 +126,4 @@ class PackageReport:
     package_info: PackageInfo | None
     changelog_entries: list[ChangelogEntry]
     error_message: str | None = None
+    duration: float | None = None
@@ -2,7 +2,10 @@
 Output formatters for displaying results.
 """
 
+from .html_dir_formatter import HTMLDirFormatter
 from .html_formatter import HTMLFormatter
+from .json_formatter import JSONFormatter
+from .multi_formatter import MultiFormatter
 from .rich_formatter import RichFormatter
 
-__all__ = ["RichFormatter", "HTMLFormatter"]
+__all__ = ["RichFormatter", "HTMLFormatter", "HTMLDirFormatter", "JSONFormatter", "MultiFormatter"]
@@ -0,0 +1,184 @@
+"""
+HTML formatter writing a multi-page report to a directory.
+"""
+
+import html
+import json
+import logging
+import re
+from pathlib import Path
+from typing import TextIO
+
+from changelog_checker.cache import Cache, make_cache_key
+from changelog_checker.models import DependencyChange, PackageReport
+from changelog_checker.output.html_formatter import (
+    BODY_HTML_END,
+    HTMLFormatter,
+    _format_version_change,
+)
+from changelog_checker.output.rendering import RENDER_TIMEOUT
+from changelog_checker.utils import get_entry_format
+from changelog_checker.version import VERSION
+
+INDEX_FILE_NAME = "index.html"
+PACKAGES_DIR_NAME = "packages"
+MANIFEST_FILE_NAME = "manifest.json"
+
+PACKAGE_PAGE_HTML = """
+    <div class="section">
+        <p><a href="../{index}" class="github-link">← Back to report</a></p>
+        <h2>{name} <span class="version-change">{version_change}</span></h2>
+        <p>{github_link}</p>
+        <div class="changelog-content">
+            {content}
+        </div>
+    </div>"""
+
+
+class HTMLDirFormatter(HTMLFormatter):
+    """
+    Formats output as a directory of HTML pages.
+
+    The index page holds the summary and package tables and links to one page per updated package
+    with its changelog. A manifest of page keys lets later runs skip pages whose content did not change.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "changelog_report",
+        cache: Cache | None = None,
+        render_workers: int = 0,
+        render_timeout: float = RENDER_TIMEOUT,
+        client_render: bool = False,
+    ) -> None:
+        """
+        Initialize the HTML directory formatter.
+
+        Args:
+            output_dir: Path to the output directory
+            cache: Optional cache for rendered changelog content. Defaults to an in-memory cache.
+            render_workers: Number of worker processes for rendering changelog entries. Renders serially if below 2.
+            render_timeout: Time budget in seconds for rendering one changelog entry, or 0 for no limit
+            client_render: Embed compressed raw changelog content and render it in the browser when expanded
+        """
+        self.output_dir = Path(output_dir)
+        super().__init__(
+            output_file=str(self.output_dir / INDEX_FILE_NAME),
+            cache=cache,
+            render_workers=render_workers,
+            render_timeout=render_timeout,
+            client_render=client_render,
+        )
+        self.logger = logging.getLogger("changelog_checker.html_dir_formatter")
+        self._previous_pages: dict[str, str] = {}
+        self._pages: dict[str, str] = {}
+
+    def _start_report(self) -> TextIO:
+        """Create the output directory, load the manifest of the previous run and write the index header."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._previous_pages = self._load_manifest()
+        self._pages = {}
+        return super()._start_report()
+
+    def _finish_report(self) -> None:
+        """Complete the index page, remove pages of packages no longer reported and save the manifest."""
+        super()._finish_report()
+        for page_name in self._previous_pages.keys() - self._pages.keys():
+            if Path(page_name).name == page_name:
+                (self.output_dir / PACKAGES_DIR_NAME / page_name).unlink(missing_ok=True)
+        manifest = json.dumps({"pages": self._pages}, indent=2, sort_keys=True)
+        (self.output_dir / MANIFEST_FILE_NAME).write_text(manifest, encoding="utf-8")
+
+    def _write_changelog_row(self, stream: TextIO, report: PackageReport) -> None:
+        """Write the index row linking to the changelog page of a package."""
+        if not report.changelog_entries:
+            super()._write_changelog_row(stream, report)
+            return
+        page_name = self._write_package_page(report)
+        count = len(report.changelog_entries)
+        label = f"View changelog ({count} {'version' if count == 1 else 'versions'})"
+        stream.write(f"""
+            <tr>
+                <td colspan="3">
+                    <a href="{PACKAGES_DIR_NAME}/{page_name}" class="github-link">{label}</a>
+                </td>
+            </tr>""")
+
+    def _write_package_page(self, report: PackageReport) -> str:
+        """
+        Write the changelog page of a package unless it is unchanged since the previous run.
+
+        Pages with entries shown as plain text get no page key, so they are written again by the next run.
+
+        Returns:
+            File name of the page within the packages directory
+        """
+        page_name = self._get_page_name(report.dependency_change)
+        page_key = self._get_page_key(report)
+        self._pages[page_name] = page_key
+        page_path = self.output_dir / PACKAGES_DIR_NAME / page_name
+        if self._previous_pages.get(page_name) == page_key and page_path.exists():
+            self.logger.debug(f"Skipping unchanged page {page_name}")
+            return page_name
+        page_path.parent.mkdir(parents=True, exist_ok=True)
+        fallback_count = len(self.render_fallbacks)
+        page_start, page_end = PACKAGE_PAGE_HTML.split("{content}")
+        with page_path.open("w", encoding="utf-8") as stream:
+            self._write_document_start(stream)
+            stream.write(
+                page_start.format(
+                    index=INDEX_FILE_NAME,
+                    name=html.escape(report.dependency_change.name),
+                    version_change=html.escape(_format_version_change(report.dependency_change)),
+                    github_link=self._generate_github_link(report.package_info),
+                )
+            )
+            self._write_changelog_entries(stream, report)
+            stream.write(page_end)
+            stream.write(BODY_HTML_END)
+        if len(self.render_fallbacks) > fallback_count:
+            self._pages[page_name] = ""
+        return page_name
+
+    def _get_page_name(self, change: DependencyChange) -> str:
+        """
+        Build a file name for the page of a package not used by another page of this run.
+
+        A package with several changes, such as two locked versions being updated, gets the version
+        change added to the names of its other pages.
+        """
+        name = re.sub(r"[^a-z0-9]+", "-", change.name.lower()).strip("-") or "package"
+        if f"{name}.html" not in self._pages:
+            return f"{name}.html"
+        name = re.sub(r"[^a-z0-9.]+", "-", f"{name}-{change.old_version}-{change.new_version}".lower())
+        page_name, number = f"{name}.html", 2
+        while page_name in self._pages:
+            page_name, number = f"{name}-{number}.html", number + 1
+        return page_name
+
+    def _get_page_key(self, report: PackageReport) -> str:
+        """Identify the content of a package page without rendering it."""
+        change = report.dependency_change
+        parts = [
+            VERSION,
+            str(self.client_render),
+            change.name,
+            _format_version_change(change),
+            self._generate_github_link(report.package_info),
+        ]
+        for entry in report.changelog_entries:
+            parts.append(entry.version)
+            parts.append(self._get_render_cache_key(entry.content, get_entry_format(entry)))
+        return make_cache_key(*parts)
+
+    def _load_manifest(self) -> dict[str, str]:
+        """Load the page keys written by the previous run."""
+        try:
+            manifest = json.loads((self.output_dir / MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+            pages = manifest["pages"]
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug(f"Ignoring unreadable manifest in {self.output_dir}: {e}")
+            return {}
+        return {str(name): str(key) for name, key in pages.items()} if isinstance(pages, dict) else {}
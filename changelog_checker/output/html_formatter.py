@@ -2,29 +2,53 @@
 HTML formatter for displaying changelog checker results.
 """
 
+import base64
 import html
+import os
 import re
+import zlib
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Any, TextIO
 
+from changelog_checker.cache import Cache, make_cache_key
 from changelog_checker.models import ChangeType, DependencyChange, PackageInfo, PackageReport
-from changelog_checker.utils import detect_content_format, get_packages_with_missing_changelogs
-
-try:
-    import markdown
-
-    HAS_MARKDOWN_SUPPORT = True
-except ImportError:
-    HAS_MARKDOWN_SUPPORT = False
-
-try:
-    import docutils
-    from docutils.core import publish_parts
-
-    HAS_RST_SUPPORT = True
-except ImportError:
-    HAS_RST_SUPPORT = False
+from changelog_checker.output.rendering import (
+    RENDER_TIMEOUT,
+    RenderFallback,
+    RenderResult,
+    describe_render_fallbacks,
+    prerender_changelog_content,
+    render_within_budget,
+)
+from changelog_checker.stats import RunStats
+from changelog_checker.utils import detect_content_format, get_entry_format, is_missing_changelog
+from changelog_checker.version import VERSION
+
+
+def _get_distribution_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return ""
+
+
+HAS_MARKDOWN_SUPPORT = find_spec("markdown") is not None
+MARKDOWN_VERSION = _get_distribution_version("markdown")
+HAS_RST_SUPPORT = find_spec("docutils") is not None
+DOCUTILS_VERSION = _get_distribution_version("docutils")
+
+# Renderers are imported on first use, so reports rendered in the browser never load them
+markdown: Any = None
+docutils: Any = None
+publish_parts: Any = None
+
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables"]
+RENDER_CACHE_NAMESPACE = "rendered-html"
 
 BODY_HTML = """<!DOCTYPE html>
 <html lang="en">
@@ -59,6 +83,13 @@ BODY_HTML = """<!DOCTYPE html>
             opacity: 0.9;
             font-size: 0.9em;
         }}
+        .report {{
+            display: flex;
+            flex-direction: column;
+        }}
+        .report > .summary {{
+            order: -1;
+        }}
         .section {{
             background: white;
             margin: 20px 0;
@@ -207,6 +238,14 @@ BODY_HTML = """<!DOCTYPE html>
             color: #666;
             font-style: italic;
         }}
+        .render-fallbacks {{
+            color: #856404;
+            margin-top: 15px;
+        }}
+        .deferred-changelog summary {{
+            cursor: pointer;
+            color: #0366d6;
+        }}
     </style>
 </head>
 <body>
@@ -214,12 +253,14 @@ BODY_HTML = """<!DOCTYPE html>
         <h1>📦 Dependency Update Report</h1>
         <div class="timestamp">Generated on {timestamp}</div>
     </div>
+    <div class="report">
     {content}
+    </div>
 </body>
 </html>"""
 
 SUMMARY_HTML = """
-    <div class="section">
+    <div class="section summary">
         <h2>📊 Summary</h2>
         <div class="summary-grid">
             <div class="summary-card updated">
@@ -238,7 +279,7 @@ SUMMARY_HTML = """
                 <div class="summary-number">{missing}</div>
                 <div class="summary-label">Missing Changelogs</div>
             </div>
-        </div>
+        </div>{render_fallbacks}
     </div>"""
 
 UPDATED_PACKAGES_HTML = """
@@ -309,45 +350,309 @@ MISSING_CHANGELOGS_HTML = """
         </table>
     </div>"""
 
+BODY_HTML_START, BODY_HTML_END = BODY_HTML.split("{content}")
+
+# Renders markdown with a small built-in renderer creating DOM nodes, so the report needs no
+# external script and changelog content can never inject markup into it
+CLIENT_RENDER_HTML = r"""
+    <script>
+        function appendInline(parent, text) {
+            const parts = [
+                /`([^`]+)`/,
+                /\*\*([^*]+)\*\*/,
+                /\[([^\]]+)\]\((https?:\/\/[^\s)]+)\)/,
+                /(https?:\/\/[^\s<>()]*[^\s<>().,;:!?])/,
+            ];
+            const pattern = new RegExp(parts.map((part) => part.source).join("|"), "g");
+            let last = 0;
+            let match;
+            while ((match = pattern.exec(text))) {
+                parent.append(text.slice(last, match.index));
+                let node;
+                if (match[1] !== undefined) {
+                    node = document.createElement("code");
+                    node.textContent = match[1];
+                } else if (match[2] !== undefined) {
+                    node = document.createElement("strong");
+                    node.textContent = match[2];
+                } else {
+                    node = document.createElement("a");
+                    node.href = match[4] || match[5];
+                    node.target = "_blank";
+                    node.rel = "noopener noreferrer";
+                    node.textContent = match[3] || match[5];
+                }
+                parent.append(node);
+                last = pattern.lastIndex;
+            }
+            parent.append(text.slice(last));
+        }
+
+        function renderMarkdown(text, container) {
+            let list = null;
+            let paragraph = null;
+            let code = null;
+            for (const line of text.split("\n")) {
+                const fence = /^\s*(```|~~~)/.test(line);
+                if (code) {
+                    if (fence) {
+                        code = null;
+                    } else {
+                        code.textContent += line + "\n";
+                    }
+                    continue;
+                }
+                const heading = /^(#{1,6})\s+(.*)$/.exec(line);
+                const item = /^\s*([-*+]|\d+[.)])\s+(.*)$/.exec(line);
+                if (fence) {
+                    list = paragraph = null;
+                    code = container.appendChild(document.createElement("pre")).appendChild(document.createElement("code"));
+                } else if (heading) {
+                    list = paragraph = null;
+                    appendInline(container.appendChild(document.createElement("h" + heading[1].length)), heading[2]);
+                } else if (item) {
+                    paragraph = null;
+                    const listTag = /\d/.test(item[1]) ? "OL" : "UL";
+                    if (!list || list.tagName !== listTag) {
+                        list = container.appendChild(document.createElement(listTag));
+                    }
+                    appendInline(list.appendChild(document.createElement("li")), item[2]);
+                } else if (!line.trim()) {
+                    list = paragraph = null;
+                } else if (list && /^\s/.test(line)) {
+                    appendInline(list.lastChild, " " + line.trim());
+                } else {
+                    list = null;
+                    if (paragraph) {
+                        paragraph.append(" ");
+                    } else {
+                        paragraph = container.appendChild(document.createElement("p"));
+                    }
+                    appendInline(paragraph, line.trim());
+                }
+            }
+        }
+
+        document.addEventListener("toggle", async function (event) {
+            const details = event.target;
+            if (!details.open || !details.classList.contains("deferred-changelog")) {
+                return;
+            }
+            for (const element of details.querySelectorAll(".deferred-content:not([data-rendered])")) {
+                element.dataset.rendered = "true";
+                const bytes = Uint8Array.from(atob(element.dataset.content), (c) => c.charCodeAt(0));
+                const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("deflate"));
+                const text = await new Response(stream).text();
+                element.replaceChildren();
+                if (element.dataset.format === "markdown") {
+                    renderMarkdown(text, element);
+                } else {
+                    element.appendChild(document.createElement("pre")).textContent = text;
+                }
+            }
+        }, true);
+    </script>"""
+
+
+def _import_markdown() -> None:
+    """Import markdown on first use."""
+    global markdown
+    if markdown is None:
+        import markdown
+
+
+def _import_docutils() -> None:
+    """Import docutils on first use."""
+    global docutils, publish_parts
+    if docutils is None:
+        import docutils.utils
+    if publish_parts is None:
+        from docutils.core import publish_parts
+
+
+def _format_version_change(change: DependencyChange) -> str:
+    return f"{change.old_version} → {change.new_version}"
+
+
+def _format_new_version(change: DependencyChange) -> str:
+    return change.new_version or "N/A"
+
+
+def _format_old_version(change: DependencyChange) -> str:
+    return change.old_version or "N/A"
+
 
 class HTMLFormatter:
     """Formats output as an HTML file with proper markdown and RST rendering."""
 
-    def __init__(self, output_file: str = "changelog_report.html") -> None:
+    def __init__(
+        self,
+        output_file: str = "changelog_report.html",
+        cache: Cache | None = None,
+        render_workers: int = 0,
+        render_timeout: float = RENDER_TIMEOUT,
+        client_render: bool = False,
+        render_pool: ProcessPoolExecutor | None = None,
+    ) -> None:
         """
         Initialize the HTML formatter.
 
         Args:
             output_file: Path to the output HTML file
+            cache: Optional cache for rendered changelog content. Defaults to an in-memory cache.
+            render_workers: Number of worker processes for rendering changelog entries. Renders serially if below 2.
+            render_timeout: Time budget in seconds for rendering one changelog entry, or 0 for no limit
+            client_render: Embed compressed raw changelog content and render it in the browser when expanded
+            render_pool: Optional pool from create_render_pool shared with other formatters, used instead of
+                render_workers. The render budget is only enforced in the main thread otherwise.
         """
         self.output_file = Path(output_file)
+        self.cache = cache if cache is not None else Cache()
+        self.render_workers = render_workers
+        self.render_timeout = render_timeout
+        self.render_pool = render_pool
+        self.render_fallbacks: list[RenderFallback] = []
+        self.client_render = client_render
+        self._uncached_renders: dict[str, str] = {}
+        self._markdown_converter: Any = None
+        self._stream: TextIO | None = None
+        self._temp_file: Path | None = None
+        self._streamed_count = 0
+        self._updated_section_open = False
+        self._summary_counts = {"updated": 0, "added": 0, "removed": 0, "missing": 0}
+        self._buffered_rows: dict[str, list[str]] = {"added": [], "removed": [], "missing": []}
+
+    def display_report(self, report: PackageReport) -> None:
+        """
+        Write a package report to the HTML file as soon as it is available.
+
+        Updated packages and their changelogs are written straight to the file, the small rows of
+        the other tables are kept until display_results completes the file with them and the summary.
+        When rendering in worker processes, reports are written by display_results instead.
+        """
+        if self._uses_render_pool():
+            return
+        self._write_report(report)
 
     def display_results(self, reports: list[PackageReport]) -> None:
-        """Generate and save the complete HTML report."""
-        html_content = self._generate_html_report(reports)
-        self.output_file.write_text(html_content, encoding="utf-8")
+        """Write the reports not written yet and complete the HTML report."""
+        if self._uses_render_pool():
+            self._uncached_renders = prerender_changelog_content(self, reports, RENDER_CACHE_NAMESPACE)
+        for report in reports[self._streamed_count :]:
+            self._write_report(report)
+        self._finish_report()
         print(f"HTML report generated: {self.output_file.absolute()}")
 
-    def _generate_html_report(self, reports: list[PackageReport]) -> str:
-        updated = [r for r in reports if r.dependency_change.change_type == ChangeType.UPDATED]
-        added = [r for r in reports if r.dependency_change.change_type == ChangeType.ADDED]
-        removed = [r for r in reports if r.dependency_change.change_type == ChangeType.REMOVED]
-        missing_changelogs = get_packages_with_missing_changelogs(reports)
-        summary_html = self._generate_summary_html(len(updated), len(added), len(removed), len(missing_changelogs))
-        updated_html = self._generate_updated_packages_html(updated) if updated else ""
-        added_html = self._generate_added_packages_html(added) if added else ""
-        removed_html = self._generate_removed_packages_html(removed) if removed else ""
-        missing_html = self._generate_missing_changelogs_html(missing_changelogs) if missing_changelogs else ""
-        return self._generate_html_template(summary_html + updated_html + added_html + removed_html + missing_html)
-
-    def _generate_html_template(self, content: str) -> str:
-        """Generate the complete HTML document template."""
+    def _uses_render_pool(self) -> bool:
+        """Check whether changelog entries are rendered in worker processes."""
+        return (self.render_pool is not None or self.render_workers > 1) and not self.client_render
+
+    def _start_report(self) -> TextIO:
+        """
+        Open a temporary file next to the output file and write the document header.
+
+        The output file is only replaced once the report is complete, so the report of a previous
+        run stays readable until then and is kept if this run fails.
+        """
+        self._temp_file = self.output_file.with_name(f".{self.output_file.name}.{os.getpid()}.tmp")
+        stream = self._temp_file.open("w", encoding="utf-8")
+        self._stream = stream
+        self._write_document_start(stream)
+        stream.flush()
+        return stream
+
+    def _write_document_start(self, stream: TextIO) -> None:
+        """Write the document header, with the client-side renderer if enabled."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return BODY_HTML.format(timestamp=timestamp, content=content)
+        stream.write(BODY_HTML_START.format(timestamp=timestamp))
+        if self.client_render:
+            stream.write(CLIENT_RENDER_HTML)
+
+    def _write_report(self, report: PackageReport) -> None:
+        """Write or buffer the table rows of a single package report, counting it as written."""
+        stream = self._stream or self._start_report()
+        self._streamed_count += 1
+        change_type = report.dependency_change.change_type
+        if change_type == ChangeType.UPDATED:
+            self._summary_counts["updated"] += 1
+            if not self._updated_section_open:
+                stream.write(UPDATED_PACKAGES_HTML.split("{content}")[0])
+                self._updated_section_open = True
+            stream.write(self._generate_package_row_html(report, _format_version_change))
+            self._write_changelog_row(stream, report)
+            stream.flush()
+            if is_missing_changelog(report):
+                self._summary_counts["missing"] += 1
+                self._buffered_rows["missing"].append(self._generate_package_row_html(report, _format_version_change))
+        elif change_type == ChangeType.ADDED:
+            self._summary_counts["added"] += 1
+            self._buffered_rows["added"].append(self._generate_package_row_html(report, _format_new_version))
+        elif change_type == ChangeType.REMOVED:
+            self._summary_counts["removed"] += 1
+            self._buffered_rows["removed"].append(self._generate_package_row_html(report, _format_old_version))
+
+    def _finish_report(self) -> None:
+        """
+        Write the remaining tables, the summary and the document footer, and replace the output file with the report.
+
+        The temporary file is always closed, and removed instead if the report cannot be completed.
+        """
+        stream = self._stream or self._start_report()
+        temp_file = self._temp_file
+        completed = False
+        try:
+            if self._updated_section_open:
+                stream.write(UPDATED_PACKAGES_HTML.split("{content}")[1])
+            for key, template in (
+                ("added", ADDED_PACKAGES_HTML),
+                ("removed", REMOVED_PACKAGES_HTML),
+                ("missing", MISSING_CHANGELOGS_HTML),
+            ):
+                rows = self._buffered_rows[key]
+                if rows:
+                    section_start, section_end = template.split("{content}")
+                    stream.write(section_start)
+                    stream.writelines(rows)
+                    stream.write(section_end)
+            stream.write(self._generate_summary_html(**self._summary_counts))
+            stream.write(BODY_HTML_END)
+            completed = True
+        finally:
+            stream.close()
+            self._reset_report()
+            if temp_file is not None:
+                if completed:
+                    os.replace(temp_file, self.output_file)
+                else:
+                    temp_file.unlink(missing_ok=True)
+
+    def _reset_report(self) -> None:
+        """Forget the state of the report written last, so the formatter can write another one."""
+        self._stream = None
+        self._temp_file = None
+        self._streamed_count = 0
+        self._updated_section_open = False
+        self._summary_counts = dict.fromkeys(self._summary_counts, 0)
+        self._buffered_rows = {key: [] for key in self._buffered_rows}
+        self._uncached_renders = {}
+        self.render_fallbacks = []
 
     def _generate_summary_html(self, updated: int, added: int, removed: int, missing: int) -> str:
         """Generate the summary section HTML."""
-        return SUMMARY_HTML.format(updated=updated, added=added, removed=removed, missing=missing)
+        return SUMMARY_HTML.format(
+            updated=updated,
+            added=added,
+            removed=removed,
+            missing=missing,
+            render_fallbacks=self._generate_render_fallbacks_html(),
+        )
+
+    def _generate_render_fallbacks_html(self) -> str:
+        """Generate the note on changelog entries shown as plain text, if there were any."""
+        description = describe_render_fallbacks(self.render_fallbacks)
+        if not description:
+            return ""
+        return f'\n        <div class="render-fallbacks">⚠️ {html.escape(description)}</div>'
 
     def _generate_github_link(self, package_info: PackageInfo | None) -> str:
         """Generate GitHub link HTML for a package."""
@@ -355,118 +660,133 @@ class HTMLFormatter:
             return f'<a href="{package_info.github_url}" class="github-link" target="_blank">{package_info.github_url}</a>'
         return "N/A"
 
-    def _generate_changelog_html(self, report: PackageReport) -> str:
-        """Generate changelog HTML content for a package report."""
-        if not report.changelog_entries:
-            return '<div class="no-content">No changelog content found</div>'
-        changelog_html = ""
-        for entry in report.changelog_entries:
-            changelog_html += f"<h4>Version {entry.version}</h4>"
-            changelog_html += self._format_changelog_content_html(entry.content)
-        return changelog_html
-
-    def _generate_package_table_html(
-        self,
-        reports: list[PackageReport],
-        template: str,
-        version_formatter: Callable[[DependencyChange], str],
-        include_changelog: bool = False,
-    ) -> str:
+    def _generate_package_row_html(self, report: PackageReport, version_formatter: Callable[[DependencyChange], str]) -> str:
         """
-        Generate HTML table for packages with customizable version formatting.
+        Generate the HTML table row for a package.
 
         Args:
-            reports: List of package reports
-            template: HTML template string with {content} placeholder
+            report: Package report
             version_formatter: Function that takes a DependencyChange and returns version string
-            include_changelog: Whether to include changelog content in the table
         """
-        if not reports:
-            return ""
-        rows = []
-        for report in reports:
-            change = report.dependency_change
-            version_text = version_formatter(change)
-            github_link = self._generate_github_link(report.package_info)
-            rows.append(f"""
+        change = report.dependency_change
+        version_text = version_formatter(change)
+        github_link = self._generate_github_link(report.package_info)
+        return f"""
             <tr>
                 <td><strong>{html.escape(change.name)}</strong></td>
                 <td><span class="version-change">{html.escape(version_text)}</span></td>
                 <td>{github_link}</td>
-            </tr>""")
-            if include_changelog:
-                changelog_html = self._generate_changelog_html(report)
-                rows.append(f"""
+            </tr>"""
+
+    def _write_changelog_row(self, stream: TextIO, report: PackageReport) -> None:
+        """Write the HTML table row with the changelog of a package, one entry at a time."""
+        stream.write("""
             <tr>
                 <td colspan="3">
                     <div class="changelog-content">
-                        {changelog_html}
+                        """)
+        self._write_changelog_entries(stream, report)
+        stream.write("""
                     </div>
                 </td>
             </tr>""")
-        return template.format(content="".join(rows))
-
-    def _generate_updated_packages_html(self, reports: list[PackageReport]) -> str:
-        """Generate HTML for updated packages with changelogs."""
-
-        def version_formatter(change: DependencyChange) -> str:
-            return f"{change.old_version} → {change.new_version}"
-
-        return self._generate_package_table_html(reports, UPDATED_PACKAGES_HTML, version_formatter, include_changelog=True)
-
-    def _generate_added_packages_html(self, reports: list[PackageReport]) -> str:
-        """Generate HTML for added packages."""
-
-        def version_formatter(change: DependencyChange) -> str:
-            return change.new_version or "N/A"
-
-        return self._generate_package_table_html(reports, ADDED_PACKAGES_HTML, version_formatter, include_changelog=False)
-
-    def _generate_removed_packages_html(self, reports: list[PackageReport]) -> str:
-        """Generate HTML for removed packages."""
-
-        def version_formatter(change: DependencyChange) -> str:
-            return change.old_version or "N/A"
-
-        return self._generate_package_table_html(reports, REMOVED_PACKAGES_HTML, version_formatter, include_changelog=False)
-
-    def _generate_missing_changelogs_html(self, reports: list[PackageReport]) -> str:
-        """Generate HTML for packages with missing changelogs."""
-
-        def version_formatter(change: DependencyChange) -> str:
-            return f"{change.old_version} → {change.new_version}"
 
-        return self._generate_package_table_html(reports, MISSING_CHANGELOGS_HTML, version_formatter, include_changelog=False)
-
-    def _format_changelog_content_html(self, content: str) -> str:
+    def _write_changelog_entries(self, stream: TextIO, report: PackageReport) -> None:
+        """Write the changelog entries of a package, one entry at a time."""
+        if not report.changelog_entries:
+            stream.write('<div class="no-content">No changelog content found</div>')
+            return
+        if self.client_render:
+            self._write_deferred_changelog_entries(stream, report)
+            return
+        for entry in report.changelog_entries:
+            stream.write(f"<h4>Version {entry.version}</h4>")
+            stream.write(self._format_changelog_content_html(entry.content, get_entry_format(entry)))
+
+    def _write_deferred_changelog_entries(self, stream: TextIO, report: PackageReport) -> None:
+        """Write the raw changelog entries of a package, compressed, to be rendered in the browser when expanded."""
+        count = len(report.changelog_entries)
+        stream.write(
+            f'<details class="deferred-changelog"><summary>Show changelog '
+            f"({count} {'version' if count == 1 else 'versions'})</summary>"
+        )
+        for entry in report.changelog_entries:
+            stream.write(f"<h4>Version {entry.version}</h4>")
+            if not entry.content.strip():
+                stream.write('<div class="no-content">No changelog content found</div>')
+                continue
+            encoded_content = base64.b64encode(zlib.compress(entry.content.encode("utf-8"))).decode("ascii")
+            stream.write(
+                f'<div class="deferred-content" data-format="{get_entry_format(entry)}" '
+                f'data-content="{encoded_content}"></div>'
+            )
+        stream.write("</details>")
+
+    def _format_changelog_content_html(self, content: str, content_format: str | None = None) -> str:
         """Format changelog content for HTML display with proper markdown/RST rendering."""
         if not content.strip():
             return '<div class="no-content">No changelog content found</div>'
-        content_format = detect_content_format(content)
+        content_format = content_format or detect_content_format(content)
+        cache_key = self._get_render_cache_key(content, content_format)
+        cached_html = self.cache.get_bytes(RENDER_CACHE_NAMESPACE, cache_key)
+        if cached_html is not None:
+            return cached_html.decode("utf-8")
+        if cache_key in self._uncached_renders:
+            return self._uncached_renders[cache_key]
+        result = self._render_changelog_content(content, content_format)
+        if result.fallback is None:
+            self.cache.set_bytes(RENDER_CACHE_NAMESPACE, cache_key, result.rendered.encode("utf-8"))
+        else:
+            self.render_fallbacks.append(result.fallback)
+            self._uncached_renders[cache_key] = result.rendered
+        return result.rendered
+
+    def _render_changelog_content(self, content: str, content_format: str) -> RenderResult[str]:
+        """Render changelog content of a known format to HTML within the render budget."""
+        return render_within_budget(
+            content, content_format, self._render_formatted_content, self._format_as_plain_text_html, self.render_timeout
+        )
+
+    def _render_formatted_content(self, content: str, content_format: str) -> str:
+        """Render changelog content of a known format to HTML."""
         if content_format == "markdown" and HAS_MARKDOWN_SUPPORT:
             return self._format_as_markdown_html(content)
         if content_format == "rst" and HAS_RST_SUPPORT:
             return self._format_as_rst_html(content)
         return self._format_as_plain_text_html(content)
 
+    def _get_render_cache_key(self, content: str, content_format: str) -> str:
+        """Build the render cache key for content of a given format."""
+        return make_cache_key(VERSION, self._get_renderer_id(content_format), content)
+
+    def _get_renderer_id(self, content_format: str) -> str:
+        """Identify the renderer and options used for a content format, for render cache keys."""
+        if content_format == "markdown" and HAS_MARKDOWN_SUPPORT:
+            return f"markdown-{MARKDOWN_VERSION}-{','.join(MARKDOWN_EXTENSIONS)}"
+        if content_format == "rst" and HAS_RST_SUPPORT:
+            return f"docutils-{DOCUTILS_VERSION}"
+        return "plain"
+
     def _format_as_markdown_html(self, content: str) -> str:
-        """Format content as HTML using markdown."""
+        """Format content as HTML using markdown. Errors are raised, so the content is shown as uncached plain text."""
+        if self._markdown_converter is None:
+            _import_markdown()
+            self._markdown_converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
         try:
-            html_result = markdown.markdown(content, extensions=["fenced_code", "tables"])
-            return self._add_target_blank_to_links(html_result)
+            html_result = self._markdown_converter.convert(content)
+            self._markdown_converter.reset()
         except Exception:
-            return self._format_as_plain_text_html(content)
+            self._markdown_converter = None
+            raise
+        return self._add_target_blank_to_links(html_result)
 
     def _format_as_rst_html(self, content: str) -> str:
-        """Format content as HTML using RST."""
-        try:
-            silent_level = docutils.utils.Reporter.SEVERE_LEVEL + 1
-            settings_overrides = {"report_level": silent_level}
-            parts = publish_parts(content, writer_name="html", settings_overrides=settings_overrides)
-            html_body = parts["body"]
-            return self._add_target_blank_to_links(html_body)
-        except Exception:
-            return self._format_as_plain_text_html(content)
+        """Format content as HTML using RST. Errors are raised, so the content is shown as uncached plain text."""
+        _import_docutils()
+        silent_level = docutils.utils.Reporter.SEVERE_LEVEL + 1
+        settings_overrides = {"report_level": silent_level}
+        parts = publish_parts(content, writer_name="html", settings_overrides=settings_overrides)
+        return self._add_target_blank_to_links(parts["body"])
 
     def _add_target_blank_to_links(self, html_content: str) -> str:
         """
@@ -539,6 +859,12 @@ class HTMLFormatter:
         """Display an error message."""
         print(f"Error: {message}")
 
+    def start_progress(self, stats: RunStats) -> None:
+        """Start showing progress of a run. Progress is shown as plain messages."""
+
+    def finish_progress(self) -> None:
+        """Stop showing progress of a run."""
+
     def display_progress(self, message: str) -> None:
         """Display a progress message."""
         print(message)
@@ -0,0 +1,109 @@
+"""
+JSON formatter for machine-readable changelog checker results.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import TextIO
+
+from changelog_checker.models import ChangeType, PackageReport
+from changelog_checker.serialization import FORMAT_VERSION, dumps, report_to_dict
+from changelog_checker.stats import RunStats
+from changelog_checker.utils import is_missing_changelog
+
+STDOUT_PATH = "-"
+
+
+class JSONFormatter:
+    """
+    Formats output as JSON.
+
+    Writes either a single document with all package reports and a summary, or NDJSON with one
+    package report per line, each with the format version. Reports are written as soon as they
+    complete in both modes.
+    """
+
+    def __init__(self, output_file: str = "changelog_report.json", ndjson: bool = False) -> None:
+        """
+        Initialize the JSON formatter.
+
+        Args:
+            output_file: Path to the output file, or "-" for stdout
+            ndjson: Write one package report per line instead of a single document
+        """
+        self.output_file = Path(output_file)
+        self.ndjson = ndjson
+        self._stream: TextIO | None = None
+        self._streamed_count = 0
+        self._summary_counts = {"updated": 0, "added": 0, "removed": 0, "missing": 0}
+
+    def display_report(self, report: PackageReport) -> None:
+        """Write a package report as soon as it is available."""
+        self._write_report(report)
+
+    def display_results(self, reports: list[PackageReport]) -> None:
+        """Write the reports not written yet and complete the output."""
+        for report in reports[self._streamed_count :]:
+            self._write_report(report)
+        self._finish_output()
+        if not self._writes_to_stdout():
+            print(f"JSON report generated: {self.output_file.absolute()}", file=sys.stderr)
+
+    def _writes_to_stdout(self) -> bool:
+        return str(self.output_file) == STDOUT_PATH
+
+    def _start_output(self) -> TextIO:
+        """Open the output and write the document header."""
+        stream = sys.stdout if self._writes_to_stdout() else self.output_file.open("w", encoding="utf-8")
+        if not self.ndjson:
+            generated_at = datetime.now().isoformat(timespec="seconds")
+            stream.write(f'{{"format_version":{FORMAT_VERSION},"generated_at":{dumps(generated_at)},"reports":[')
+        self._stream = stream
+        return stream
+
+    def _write_report(self, report: PackageReport) -> None:
+        """Write a single package report, counting it as written."""
+        stream = self._stream or self._start_output()
+        if self.ndjson:
+            stream.write(dumps({"format_version": FORMAT_VERSION, **report_to_dict(report)}) + "\n")
+        else:
+            stream.write(("," if self._streamed_count else "") + dumps(report_to_dict(report)))
+        stream.flush()
+        self._streamed_count += 1
+        change_type = report.dependency_change.change_type
+        if change_type == ChangeType.UPDATED:
+            self._summary_counts["updated"] += 1
+        elif change_type == ChangeType.ADDED:
+            self._summary_counts["added"] += 1
+        elif change_type == ChangeType.REMOVED:
+            self._summary_counts["removed"] += 1
+        if is_missing_changelog(report):
+            self._summary_counts["missing"] += 1
+
+    def _finish_output(self) -> None:
+        """Write the summary and close the output."""
+        stream = self._stream or self._start_output()
+        if not self.ndjson:
+            stream.write(f'],"summary":{dumps(self._summary_counts)}}}\n')
+        if stream is sys.stdout:
+            stream.flush()
+        else:
+            stream.close()
+        self._stream = None
+        self._streamed_count = 0
+        self._summary_counts = dict.fromkeys(self._summary_counts, 0)
+
+    def start_progress(self, stats: RunStats) -> None:
+        """Start showing progress of a run. Progress is shown as plain messages on stderr."""
+
+    def finish_progress(self) -> None:
+        """Stop showing progress of a run."""
+
+    def display_error(self, message: str) -> None:
+        """Display an error message."""
+        print(f"Error: {message}", file=sys.stderr)
+
+    def display_progress(self, message: str) -> None:
+        """Display a progress message."""
+        print(message, file=sys.stderr)
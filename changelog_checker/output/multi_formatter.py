@@ -0,0 +1,62 @@
+"""
+Formatter combining several formatters fed from a single run.
+"""
+
+from collections.abc import Sequence
+
+from changelog_checker.models import PackageReport
+from changelog_checker.output.html_formatter import HTMLFormatter
+from changelog_checker.output.json_formatter import JSONFormatter
+from changelog_checker.output.rich_formatter import RichFormatter
+from changelog_checker.stats import RunStats
+
+
+class MultiFormatter:
+    """
+    Passes the reports of one run to several formatters.
+
+    Every formatter receives each report as soon as it completes, so packages are researched once
+    however many outputs are produced. Progress is shown by one formatter only, preferring the
+    terminal formatter, so messages are not repeated.
+    """
+
+    def __init__(self, formatters: Sequence[RichFormatter | HTMLFormatter | JSONFormatter]) -> None:
+        """
+        Initialize the combined formatter.
+
+        Args:
+            formatters: Formatters receiving the reports, in output order
+        """
+        if not formatters:
+            raise ValueError("At least one formatter is required")
+        self.formatters = list(formatters)
+        self.progress_formatter = next(
+            (formatter for formatter in self.formatters if isinstance(formatter, RichFormatter)),
+            self.formatters[0],
+        )
+
+    def display_report(self, report: PackageReport) -> None:
+        """Pass a completed package report to every formatter."""
+        for formatter in self.formatters:
+            formatter.display_report(report)
+
+    def display_results(self, reports: list[PackageReport]) -> None:
+        """Complete the output of every formatter."""
+        for formatter in self.formatters:
+            formatter.display_results(reports)
+
+    def display_error(self, message: str) -> None:
+        """Display an error message."""
+        self.progress_formatter.display_error(message)
+
+    def start_progress(self, stats: RunStats) -> None:
+        """Start showing progress of a run."""
+        self.progress_formatter.start_progress(stats)
+
+    def finish_progress(self) -> None:
+        """Stop showing progress of a run."""
+        self.progress_formatter.finish_progress()
+
+    def display_progress(self, message: str) -> None:
+        """Display a progress message."""
+        self.progress_formatter.display_progress(message)
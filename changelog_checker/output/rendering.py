@@ -0,0 +1,251 @@
+"""
+Parallel rendering of changelog content in worker processes.
+"""
+
+import logging
+import multiprocessing.context
+import signal
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from types import FrameType, TracebackType
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from changelog_checker.models import PackageReport
+from changelog_checker.utils import get_entry_format
+
+RENDER_TIMEOUT = 2.0
+RENDER_MAX_CHARS = 200_000
+
+logger = logging.getLogger("changelog_checker.rendering")
+
+RenderedT = TypeVar("RenderedT")
+
+_worker_formatter: Any = None
+
+
+class RenderBudgetExceeded(Exception):
+    """Raised inside a render that ran out of its time budget."""
+
+
+@dataclass
+class RenderFallback:
+    """Changelog content shown as plain text because rendering exceeded its budget."""
+
+    content_format: str
+    size: int
+    reason: str
+
+
+class RenderResult(NamedTuple, Generic[RenderedT]):
+    """Rendered changelog content, with the fallback event if it is shown as plain text."""
+
+    rendered: RenderedT
+    fallback: RenderFallback | None = None
+
+
+def describe_render_fallbacks(fallbacks: list[RenderFallback]) -> str:
+    """
+    Describe the changelog entries shown as plain text, for the summary of a report.
+
+    Args:
+        fallbacks: Fallback events of the report
+
+    Returns:
+        Sentence counting the entries by reason, or an empty string if there were none
+    """
+    if not fallbacks:
+        return ""
+    reasons = Counter(fallback.reason for fallback in fallbacks)
+    details = ", ".join(f"{reason} ({count})" for reason, count in reasons.items())
+    noun = "entry was" if len(fallbacks) == 1 else "entries were"
+    return f"{len(fallbacks)} changelog {noun} shown as plain text: {details}"
+
+
+class RenderBudget:
+    """
+    Context manager interrupting the enclosed code once a time budget runs out.
+
+    Uses a real-time interval timer, so the budget is only enforced in the main thread on
+    platforms providing signal.setitimer. Elsewhere the enclosed code runs unbounded, so code
+    rendering in other threads, such as the server, renders in a render pool instead.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.expired = False
+        self._previous_handler: Any = None
+        self._armed = False
+
+    def __enter__(self) -> "RenderBudget":
+        if self.seconds > 0 and hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._expire)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+            self._armed = True
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self._armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+            self._armed = False
+
+    def _expire(self, signum: int, frame: FrameType | None) -> None:
+        self.expired = True
+        raise RenderBudgetExceeded(f"Rendering took longer than {self.seconds}s")
+
+
+def render_within_budget(
+    content: str,
+    content_format: str,
+    render: Callable[[str, str], RenderedT],
+    fallback: Callable[[str], RenderedT],
+    timeout: float,
+) -> RenderResult[RenderedT]:
+    """
+    Render changelog content, falling back to plain text if it is too large, too slow or fails to render.
+
+    Content shown as plain text should not be cached with properly rendered content, so the
+    fallback event is returned along with it.
+
+    Args:
+        content: Changelog content to render
+        content_format: Detected format of the content
+        render: Renderer for formatted content, called with the content and its format, raising if it fails
+        fallback: Plain text renderer
+        timeout: Time budget in seconds, or 0 for no limit
+
+    Returns:
+        Rendered content, with the fallback event if it is shown as plain text
+    """
+    if content_format == "plain":
+        return RenderResult(fallback(content))
+    if len(content) > RENDER_MAX_CHARS:
+        reason = f"content is larger than {RENDER_MAX_CHARS} characters"
+    else:
+        budget = RenderBudget(timeout)
+        error: Exception | None = None
+        try:
+            with budget:
+                rendered = render(content, content_format)
+        except Exception as e:
+            error = e
+        if budget.expired:
+            reason = f"rendering took longer than {timeout}s"
+        elif error is not None:
+            reason = f"rendering failed with {type(error).__name__}"
+        else:
+            return RenderResult(rendered)
+    logger.warning(f"Showing {content_format} changelog content ({len(content)} characters) as plain text: {reason}")
+    return RenderResult(fallback(content), RenderFallback(content_format=content_format, size=len(content), reason=reason))
+
+
+def _init_worker(formatter_class: type, render_timeout: float) -> None:
+    """Create the formatter used by a worker process, so its converters are reused for all entries."""
+    global _worker_formatter
+    _worker_formatter = formatter_class(render_timeout=render_timeout)
+
+
+def _render_content(item: tuple[str, str]) -> RenderResult[str]:
+    content, content_format = item
+    return _worker_formatter._render_changelog_content(content, content_format)
+
+
+def create_render_pool(
+    formatter_class: type,
+    workers: int,
+    render_timeout: float = RENDER_TIMEOUT,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+) -> ProcessPoolExecutor:
+    """
+    Create a pool of worker processes rendering changelog content.
+
+    Each worker renders in its main thread, so the render budget is enforced even if the pool is
+    used from other threads.
+
+    Args:
+        formatter_class: Formatter class providing _render_changelog_content(content, content_format)
+        workers: Number of worker processes
+        render_timeout: Time budget in seconds for rendering one entry, or 0 for no limit
+        mp_context: Optional multiprocessing context starting the workers
+
+    Returns:
+        Process pool for render_in_processes, to be shut down by the caller
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp_context, initializer=_init_worker, initargs=(formatter_class, render_timeout)
+    )
+
+
+def render_in_processes(
+    formatter_class: type,
+    items: Iterable[tuple[str, str]],
+    workers: int,
+    render_timeout: float = RENDER_TIMEOUT,
+    pool: ProcessPoolExecutor | None = None,
+) -> list[RenderResult[str]]:
+    """
+    Render changelog content in a pool of worker processes.
+
+    Args:
+        formatter_class: Formatter class providing _render_changelog_content(content, content_format)
+        items: (content, content_format) pairs to render
+        workers: Number of worker processes
+        render_timeout: Time budget in seconds for rendering one entry, or 0 for no limit
+        pool: Optional pool created by create_render_pool to reuse. A pool is created for this call otherwise.
+
+    Returns:
+        Rendered content with its fallback events, in the same order as items
+    """
+    items = list(items)
+    chunksize = max(1, len(items) // (max(workers, 1) * 4))
+    if pool is not None:
+        return list(pool.map(_render_content, items, chunksize=chunksize))
+    with create_render_pool(formatter_class, workers, render_timeout) as executor:
+        return list(executor.map(_render_content, items, chunksize=chunksize))
+
+
+def prerender_changelog_content(formatter: Any, reports: list[PackageReport], namespace: str) -> dict[str, str]:
+    """
+    Render changelog entries missing from a formatter's render cache in worker processes.
+
+    Rendered content is stored in the formatter's cache, so the formatter then assembles
+    its output in the usual order without rendering anything itself. Content shown as plain
+    text is returned instead of being cached, and its fallback events are added to the
+    formatter's render_fallbacks. A formatter with a render_pool renders even a single entry
+    in it, so its render budget is enforced.
+
+    Args:
+        formatter: Formatter with cache, render_workers, render_timeout, render_fallbacks,
+            _get_render_cache_key and _render_changelog_content, and optionally render_pool
+        reports: Reports whose changelog entries will be displayed
+        namespace: Cache namespace used by the formatter for rendered content
+
+    Returns:
+        Content shown as plain text by its render cache key
+    """
+    pending: dict[str, tuple[str, str]] = {}
+    for report in reports:
+        for entry in report.changelog_entries:
+            if not entry.content.strip():
+                continue
+            content_format = get_entry_format(entry)
+            cache_key = formatter._get_render_cache_key(entry.content, content_format)
+            if cache_key not in pending and formatter.cache.get_bytes(namespace, cache_key) is None:
+                pending[cache_key] = (entry.content, content_format)
+    pool = getattr(formatter, "render_pool", None)
+    if len(pending) < (1 if pool is not None else 2):
+        return {}
+    results = render_in_processes(type(formatter), pending.values(), formatter.render_workers, formatter.render_timeout, pool)
+    uncached = {}
+    for cache_key, result in zip(pending, results, strict=True):
+        if result.fallback is None:
+            formatter.cache.set_bytes(namespace, cache_key, result.rendered.encode("utf-8"))
+        else:
+            formatter.render_fallbacks.append(result.fallback)
+            uncached[cache_key] = result.rendered
+    return uncached
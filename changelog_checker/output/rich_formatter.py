@@ -2,29 +2,87 @@
 Rich formatter for displaying changelog checker results.
 """
 
+from datetime import timedelta
+from importlib.metadata import version
+from importlib.util import find_spec
+from typing import Any
+
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
 from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
+from rich.progress_bar import ProgressBar
+from rich.segment import SegmentLines
 from rich.table import Table
+from rich.text import Text
 
+from changelog_checker.cache import Cache, make_cache_key
 from changelog_checker.models import ChangeType, PackageReport
-from changelog_checker.utils import detect_content_format, get_packages_with_missing_changelogs
+from changelog_checker.output.rendering import (
+    RENDER_TIMEOUT,
+    RenderFallback,
+    RenderResult,
+    describe_render_fallbacks,
+    prerender_changelog_content,
+    render_within_budget,
+)
+from changelog_checker.stats import RunStats
+from changelog_checker.utils import detect_content_format, get_entry_format, get_packages_with_missing_changelogs
+from changelog_checker.version import VERSION
+
+HAS_RST_SUPPORT = find_spec("rich_rst") is not None
+RICH_RST_VERSION = version("rich-rst") if HAS_RST_SUPPORT else ""
+
+# rich_rst loads docutils, so it is imported on first use
+RestructuredText: Any = None
+
+RICH_VERSION = version("rich")
+PANEL_CHROME_WIDTH = 4
+MIN_RENDER_WIDTH = 20
+PROGRESS_REFRESH_PER_SECOND = 4
+RENDER_CACHE_NAMESPACE = "rendered-terminal"
 
-try:
-    from rich_rst import RestructuredText
 
-    HAS_RST_SUPPORT = True
-except ImportError:
-    RestructuredText = None
-    HAS_RST_SUPPORT = False
+def _import_rich_rst() -> None:
+    """Import rich_rst on first use."""
+    global RestructuredText
+    if RestructuredText is None:
+        from rich_rst import RestructuredText
 
 
 class RichFormatter:
     """Formats output using the Rich library for colorful console display."""
 
-    def __init__(self) -> None:
-        self.console = Console()
+    def __init__(
+        self,
+        cache: Cache | None = None,
+        render_workers: int = 0,
+        render_timeout: float = RENDER_TIMEOUT,
+        console: Console | None = None,
+    ) -> None:
+        """
+        Initialize the Rich formatter.
+
+        Args:
+            cache: Optional cache for rendered changelog content. Defaults to an in-memory cache.
+            render_workers: Number of worker processes for rendering changelog entries. Renders serially if below 2.
+            render_timeout: Time budget in seconds for rendering one changelog entry, or 0 for no limit
+            console: Optional console to write to. Defaults to a console writing to stdout.
+        """
+        self.console = console or Console()
+        self.cache = cache if cache is not None else Cache()
+        self.render_workers = render_workers
+        self.render_timeout = render_timeout
+        self.render_fallbacks: list[RenderFallback] = []
+        self._uncached_renders: dict[str, str] = {}
+        self._stats: RunStats | None = None
+        self._live: Live | None = None
+        self._progress_message = ""
+
+    def display_report(self, report: PackageReport) -> None:
+        """Handle a package report as soon as it is available. Reports are displayed together by display_results."""
 
     def display_results(self, reports: list[PackageReport]) -> None:
         """Display the complete results of changelog checking."""
@@ -33,6 +91,10 @@ class RichFormatter:
         if not reports:
             self.console.print("[yellow]No dependency changes found.[/yellow]")
             return
+        self.render_fallbacks = []
+        self._uncached_renders = {}
+        if self.render_workers > 1:
+            self._uncached_renders = prerender_changelog_content(self, reports, RENDER_CACHE_NAMESPACE)
         updated = [r for r in reports if r.dependency_change.change_type == ChangeType.UPDATED]
         added = [r for r in reports if r.dependency_change.change_type == ChangeType.ADDED]
         removed = [r for r in reports if r.dependency_change.change_type == ChangeType.REMOVED]
@@ -46,6 +108,8 @@ class RichFormatter:
             self._display_removed_packages(removed)
         if missing_changelogs:
             self._display_missing_changelogs(missing_changelogs)
+        if self.render_fallbacks:
+            self.console.print(f"[yellow]⚠️ {escape(describe_render_fallbacks(self.render_fallbacks))}[/yellow]")
 
     def _display_summary(self, updated_count: int, added_count: int, removed_count: int, missing_changelog_count: int) -> None:
         """Display summary statistics."""
@@ -114,61 +178,120 @@ class RichFormatter:
             header += ")"
         else:
             header += " [red](GitHub not found)[/red]"
-        content_parts = []
+        content_parts: list[RenderableType] = []
         if report.error_message:
-            content_parts.append(f"[red]Error: {report.error_message}[/red]")
+            content_parts.append(Text.from_markup(f"[red]Error: {escape(report.error_message)}[/red]"))
         if report.changelog_entries:
-            content_parts.append("[bold]Changelog:[/bold]")
+            content_parts.append(Text.from_markup("[bold]Changelog:[/bold]"))
             for entry in report.changelog_entries:
-                content_parts.append(f"\n[bold cyan]Version {entry.version}:[/bold cyan]")
-                formatted_content = self._format_changelog_content(entry.content)
-                content_parts.append(formatted_content)
+                content_parts.append(Text.from_markup(f"\n[bold cyan]Version {escape(entry.version)}:[/bold cyan]"))
+                content_parts.append(self._get_changelog_renderable(entry.content, get_entry_format(entry)))
         else:
             if change.change_type == ChangeType.UPDATED:
                 if info and info.github_url:
-                    content_parts.append("[red]Changelog not found in repository[/red]")
+                    content_parts.append(Text.from_markup("[red]Changelog not found in repository[/red]"))
                 else:
-                    content_parts.append("[red]No GitHub repository found - cannot check changelog[/red]")
+                    content_parts.append(Text.from_markup("[red]No GitHub repository found - cannot check changelog[/red]"))
             elif change.change_type == ChangeType.REMOVED:
-                content_parts.append("[dim]Package removed from dependencies[/dim]")
+                content_parts.append(Text.from_markup("[dim]Package removed from dependencies[/dim]"))
             elif change.change_type == ChangeType.ADDED:
-                content_parts.append("[dim]Package added to dependencies[/dim]")
-        content = "\n".join(content_parts) if content_parts else "[dim]No additional information available[/dim]"
+                content_parts.append(Text.from_markup("[dim]Package added to dependencies[/dim]"))
+        content = (
+            Group(*content_parts) if content_parts else Text.from_markup("[dim]No additional information available[/dim]")
+        )
         self.console.print(Panel(content, title=header, border_style="dim", expand=False))
         self.console.print()
 
-    def _format_changelog_content(self, content: str) -> str:
-        """Format changelog content for display with proper markdown/RST rendering."""
+    def _get_changelog_renderable(self, content: str, content_format: str | None = None) -> RenderableType:
+        """
+        Get the renderable displaying changelog content in a package panel.
+
+        Content found in the render cache, such as entries prerendered in worker processes, is shown
+        from its cached output. Other content is rendered once, directly by the console at the panel's
+        width, and its output is cached for later runs.
+        """
         if not content.strip():
-            return "[dim]No changelog content found[/dim]"
-        content_format = detect_content_format(content)
+            return Text("No changelog content found", style="dim")
+        content_format = content_format or detect_content_format(content)
+        cache_key = self._get_render_cache_key(content, content_format)
+        cached_content = self._get_cached_render(cache_key)
+        if cached_content is not None:
+            return Text.from_ansi(cached_content)
+        lines, fallback = render_within_budget(
+            content, content_format, self._render_lines, self._render_plain_lines, self.render_timeout
+        )
+        self._store_render(cache_key, RenderResult(self._capture_lines(lines), fallback))
+        return lines
+
+    def _get_cached_render(self, cache_key: str) -> str | None:
+        """Return the terminal output of content rendered before, or None if it was not rendered yet."""
+        cached_content = self.cache.get_bytes(RENDER_CACHE_NAMESPACE, cache_key)
+        if cached_content is not None:
+            return cached_content.decode("utf-8")
+        return self._uncached_renders.get(cache_key)
+
+    def _store_render(self, cache_key: str, result: RenderResult[str]) -> None:
+        """Cache rendered terminal output, or keep content shown as plain text for this run only."""
+        if result.fallback is None:
+            self.cache.set_bytes(RENDER_CACHE_NAMESPACE, cache_key, result.rendered.encode("utf-8"))
+        else:
+            self.render_fallbacks.append(result.fallback)
+            self._uncached_renders[cache_key] = result.rendered
+
+    def _render_changelog_content(self, content: str, content_format: str) -> RenderResult[str]:
+        """Render changelog content of a known format to terminal output within the render budget."""
+        lines, fallback = render_within_budget(
+            content, content_format, self._render_lines, self._render_plain_lines, self.render_timeout
+        )
+        return RenderResult(self._capture_lines(lines), fallback)
+
+    def _capture_lines(self, lines: SegmentLines) -> str:
+        """Convert rendered lines to terminal output with escape codes."""
+        with self.console.capture() as capture:
+            self.console.print(lines)
+        return capture.get().rstrip()
+
+    def _render_lines(self, content: str, content_format: str) -> SegmentLines:
+        """
+        Render changelog content of a known format to lines of segments at the panel's content width.
+
+        Errors are raised, so the content is shown as uncached plain text.
+        """
+        options = self.console.options.update_width(self._get_render_width())
+        renderable = self._build_changelog_renderable(content, content_format)
+        return SegmentLines(self.console.render_lines(renderable, options, pad=False), new_lines=True)
+
+    def _render_plain_lines(self, content: str) -> SegmentLines:
+        """Render changelog content as plain text to lines of segments at the panel's content width."""
+        options = self.console.options.update_width(self._get_render_width())
+        renderable = Text.from_markup(self._format_as_plain_text(content))
+        return SegmentLines(self.console.render_lines(renderable, options, pad=False), new_lines=True)
+
+    def _build_changelog_renderable(self, content: str, content_format: str) -> RenderableType:
+        """Build the Rich renderable for changelog content of a known format."""
+        if content_format == "markdown":
+            return Markdown(content)
+        if content_format == "rst" and HAS_RST_SUPPORT:
+            _import_rich_rst()
+            return RestructuredText(content, show_errors=False)
+        return Text.from_markup(self._format_as_plain_text(content))
+
+    def _get_render_width(self) -> int:
+        """Width available for changelog content inside a package panel."""
+        return max(self.console.width - PANEL_CHROME_WIDTH, MIN_RENDER_WIDTH)
+
+    def _get_render_cache_key(self, content: str, content_format: str) -> str:
+        """Build the render cache key for content of a given format."""
+        return make_cache_key(VERSION, self._get_renderer_id(content_format), content)
+
+    def _get_renderer_id(self, content_format: str) -> str:
+        """Identify the renderer and options used for a content format, for render cache keys."""
+        terminal = f"{self._get_render_width()}-{self.console.color_system}"
         if content_format == "markdown":
-            return self._format_as_markdown(content)
+            return f"rich-{RICH_VERSION}-markdown-{terminal}"
         if content_format == "rst" and HAS_RST_SUPPORT:
-            return self._format_as_rst(content)
-        return self._format_as_plain_text(content)
-
-    def _format_as_markdown(self, content: str) -> str:
-        """Format content as markdown using Rich's Markdown renderer."""
-        try:
-            md = Markdown(content)
-            temp_console = Console(file=None, width=80)
-            with temp_console.capture() as capture:
-                temp_console.print(md)
-            return capture.get().strip()
-        except Exception:
-            return self._format_as_plain_text(content)
-
-    def _format_as_rst(self, content: str) -> str:
-        """Format content as RST using rich-rst if available."""
-        try:
-            rst = RestructuredText(content, show_errors=False)
-            temp_console = Console(file=None, width=80)
-            with temp_console.capture() as capture:
-                temp_console.print(rst)
-            return capture.get().strip()
-        except Exception:
-            return self._format_as_plain_text(content)
+            return f"rich-{RICH_VERSION}-rich-rst-{RICH_RST_VERSION}-{terminal}"
+        return f"rich-{RICH_VERSION}-plain-{terminal}"
 
     def _format_as_plain_text(self, content: str) -> str:
         """Format content as plain text."""
@@ -179,17 +302,65 @@ class RichFormatter:
             if not line:
                 continue
             if line.startswith("*") or line.startswith("-") or line.startswith("+"):
-                formatted_lines.append(f"  {line}")
+                formatted_lines.append(f"  {escape(line)}")
             elif line.startswith("#"):
-                formatted_lines.append(f"[bold]{line}[/bold]")
+                formatted_lines.append(f"[bold]{escape(line)}[/bold]")
             else:
-                formatted_lines.append(f"  {line}")
+                formatted_lines.append(f"  {escape(line)}")
         return "\n".join(formatted_lines) if formatted_lines else "[dim]No readable content[/dim]"
 
     def display_error(self, message: str) -> None:
         """Display an error message."""
         self.console.print(Panel(f"[red]Error: {message}[/red]", title="Error", border_style="red"))
 
+    def start_progress(self, stats: RunStats) -> None:
+        """
+        Start showing progress of a run.
+
+        On a terminal, a live dashboard is refreshed from the run statistics in a background thread,
+        so processing packages never waits for it. Otherwise progress messages are printed as lines.
+        """
+        self._stats = stats
+        self._progress_message = ""
+        if not self.console.is_terminal:
+            return
+        self._live = Live(
+            console=self.console,
+            get_renderable=self._render_progress_dashboard,
+            refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+            transient=True,
+        )
+        self._live.start()
+
+    def finish_progress(self) -> None:
+        """Stop showing progress of a run."""
+        if self._live is not None:
+            self._live.stop()
+            self._live = None
+        self._stats = None
+
     def display_progress(self, message: str) -> None:
         """Display a progress message."""
-        self.console.print(f"[dim]{message}[/dim]")
+        if self._live is not None:
+            self._progress_message = message
+            return
+        self.console.print(f"[dim]{escape(message)}[/dim]")
+
+    def _render_progress_dashboard(self) -> RenderableType:
+        """Build the live progress dashboard from the current run statistics."""
+        if self._stats is None:
+            return Text("")
+        stats = self._stats.snapshot()
+        eta = f"ETA {timedelta(seconds=round(stats.eta))}" if stats.eta is not None else "ETA unknown"
+        requests = ", ".join(f"{host}: {count}" for host, count in sorted(stats.in_flight.items())) or "none"
+        rate_limit = str(stats.rate_limit_remaining) if stats.rate_limit_remaining is not None else "unknown"
+        grid = Table.grid(padding=(0, 2))
+        grid.add_column(style="bold")
+        grid.add_column()
+        grid.add_row("Packages", ProgressBar(total=stats.total or None, completed=stats.completed, width=40))
+        grid.add_row("", f"{stats.completed}/{stats.total} · {stats.rate:.2f} packages/s · {eta}")
+        grid.add_row("Current", Text(self._progress_message, style="dim"))
+        grid.add_row("In-flight requests", requests)
+        grid.add_row("Cache", f"{stats.cache_hits} hits · {stats.cache_misses} misses")
+        grid.add_row("GitHub rate limit", f"{rate_limit} requests remaining")
+        return Panel(grid, title="Checking changelogs", border_style="blue", expand=False)
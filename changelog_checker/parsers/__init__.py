@@ -1,9 +1,48 @@
 """
 Parsers for different package manager outputs.
+
+Parser classes are imported when they are first accessed, so importing this package stays cheap.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseParser
-from .pip_parser import PipParser
-from .uv_parser import UVParser
 
-__all__ = ["BaseParser", "UVParser", "PipParser"]
+if TYPE_CHECKING:
+    from .lockfile import LockedPackage, LockfileParser
+    from .pip_parser import PipParser
+    from .pip_report_parser import PipReportParser
+    from .poetry_lock_parser import PoetryLockParser
+    from .requirements_parser import RequirementsParser
+    from .uv_lock_parser import UVLockParser
+    from .uv_parser import UVParser
+
+_LAZY_IMPORTS = {
+    "UVParser": ".uv_parser",
+    "PipParser": ".pip_parser",
+    "PipReportParser": ".pip_report_parser",
+    "LockfileParser": ".lockfile",
+    "LockedPackage": ".lockfile",
+    "UVLockParser": ".uv_lock_parser",
+    "PoetryLockParser": ".poetry_lock_parser",
+    "RequirementsParser": ".requirements_parser",
+}
+
+__all__ = [
+    "BaseParser",
+    "UVParser",
+    "PipParser",
+    "PipReportParser",
+    "LockfileParser",
+    "LockedPackage",
+    "UVLockParser",
+    "PoetryLockParser",
+    "RequirementsParser",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
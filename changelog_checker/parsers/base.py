@@ -3,6 +3,7 @@ Base parser class for different package managers.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 
 from changelog_checker.models import DependencyChange
 
@@ -23,6 +24,22 @@ class BaseParser(ABC):
         """
         pass
 
+    def iter_parse(self, lines: Iterable[str]) -> Iterator[DependencyChange]:
+        """
+        Parse package manager output read line by line, yielding dependency changes.
+
+        Parsers able to recognize changes before the output is complete override this to yield them
+        as soon as they are known, which may be in another order than the changes of parse. By default,
+        the whole output is read and parsed at once.
+
+        Args:
+            lines: Lines of package manager output, including their line endings
+
+        Yields:
+            DependencyChange objects
+        """
+        yield from self.parse("".join(lines))
+
     @abstractmethod
     def get_package_manager_name(self) -> str:
         """Return the name of the package manager this parser handles."""
@@ -39,3 +56,15 @@ class BaseParser(ABC):
             True if output appears to be from this package manager
         """
         return True
+
+    def detect(self, output: str) -> int:
+        """
+        Score how well the beginning of some output matches this parser, for choosing a parser automatically.
+
+        Args:
+            output: Beginning of the output
+
+        Returns:
+            0 if the output is not recognized, higher values for more specific matches
+        """
+        return 1 if output.strip() and self.validate_output(output) else 0
@@ -0,0 +1,118 @@
+"""
+Base class for parsers comparing two versions of a lockfile.
+"""
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from distlib.version import NormalizedVersion, UnsupportedVersionError
+
+from changelog_checker.models import ChangeType, DependencyChange
+
+
+@dataclass(frozen=True)
+class LockedPackage:
+    """A package version pinned in a lockfile."""
+
+    name: str
+    version: str
+    markers: tuple[str, ...] = ()
+
+
+def _version_sort_key(version: str) -> tuple[int, Any]:
+    """Sort key ordering valid versions by precedence and any others by their text, after them."""
+    try:
+        return (0, NormalizedVersion(version))
+    except UnsupportedVersionError:
+        return (1, version)
+
+
+class LockfileParser(ABC):
+    """
+    Abstract base class for lockfile parsers.
+
+    Subclasses load the packages pinned in a lockfile, and the dependency changes are computed by
+    comparing the packages of two versions of it, without running the resolver.
+    """
+
+    @abstractmethod
+    def load_packages(self, content: str) -> list[LockedPackage]:
+        """
+        Load the packages pinned in a lockfile.
+
+        Args:
+            content: Lockfile content
+
+        Returns:
+            List of LockedPackage objects
+
+        Raises:
+            ParserError: If the lockfile is malformed
+        """
+        pass
+
+    @abstractmethod
+    def get_package_manager_name(self) -> str:
+        """Return the name of the package manager whose lockfiles this parser handles."""
+        pass
+
+    def diff(self, old_content: str, new_content: str) -> list[DependencyChange]:
+        """
+        Compare two versions of a lockfile and return the dependency changes between them.
+
+        A package locked at several versions, for example for different Python versions, is
+        paired by matching resolution markers first and by version order otherwise.
+
+        Args:
+            old_content: Lockfile content before the update
+            new_content: Lockfile content after the update
+
+        Returns:
+            List of DependencyChange objects ordered by package name
+        """
+        old_packages = self._group_by_name(self.load_packages(old_content))
+        new_packages = self._group_by_name(self.load_packages(new_content))
+        changes = []
+        for name in sorted(old_packages.keys() | new_packages.keys()):
+            for change in self._diff_package(name, old_packages.get(name, []), new_packages.get(name, [])):
+                if change not in changes:
+                    changes.append(change)
+        return changes
+
+    def _group_by_name(self, packages: list[LockedPackage]) -> dict[str, list[LockedPackage]]:
+        grouped: dict[str, list[LockedPackage]] = defaultdict(list)
+        for package in packages:
+            grouped[package.name].append(package)
+        return grouped
+
+    def _diff_package(self, name: str, old: list[LockedPackage], new: list[LockedPackage]) -> list[DependencyChange]:
+        """Pair the old and new versions of one package and return the changes between them."""
+        old = sorted(old, key=lambda package: _version_sort_key(package.version))
+        new = sorted(new, key=lambda package: _version_sort_key(package.version))
+        pairs = []
+        if len(old) > 1 or len(new) > 1:
+            for new_package in list(new):
+                old_package = next((package for package in old if package.markers == new_package.markers), None)
+                if old_package is not None:
+                    pairs.append((old_package, new_package))
+                    old.remove(old_package)
+                    new.remove(new_package)
+        pairs.extend(zip(old, new, strict=False))
+        changes = [
+            DependencyChange(
+                name=name, change_type=ChangeType.UPDATED, old_version=old_package.version, new_version=new_package.version
+            )
+            for old_package, new_package in pairs
+            if old_package.version != new_package.version
+        ]
+        changes.extend(
+            DependencyChange(name=name, change_type=ChangeType.ADDED, new_version=package.version)
+            for package in new[len(old) :]
+        )
+        changes.extend(
+            DependencyChange(name=name, change_type=ChangeType.REMOVED, old_version=package.version)
+            for package in old[len(new) :]
+        )
+        return changes
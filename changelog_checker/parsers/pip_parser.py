@@ -6,6 +6,8 @@ from changelog_checker.models import ChangeType, DependencyChange
 
 from .base import BaseParser
 
+PIP_HEADER = ["Package", "Version", "Latest", "Type"]
+
 
 class PipParser(BaseParser):
     """Parser for (uv) pip list --outdated output."""
@@ -17,10 +19,13 @@ class PipParser(BaseParser):
         """Check if output looks like pip list --outdated output."""
         if output == "":  # empty output indicates no updates found
             return True
-        pip_header = ["Package", "Version", "Latest", "Type"]
         lines = output.split("\n")
         words = lines[0].split()
-        return words == pip_header
+        return words == PIP_HEADER
+
+    def detect(self, output: str) -> int:
+        """Recognize the exact pip list --outdated header as a specific match."""
+        return 2 if output.strip() and self.validate_output(output.lstrip("\n")) else 0
 
     def parse(self, output: str) -> list[DependencyChange]:
         """
@@ -31,8 +36,10 @@ class PipParser(BaseParser):
         """
         changes = []
         lines = output.strip().split("\n")
-        for line in lines[2:]:
+        for line in lines:
             words = line.split()
+            if len(words) < 3 or words[: len(PIP_HEADER)] == PIP_HEADER or set(line.strip()) <= {"-", " "}:
+                continue
             package_name = words[0]
             old_version = words[1]
             new_version = words[2]
@@ -0,0 +1,177 @@
+"""
+Parser for pip installation reports.
+"""
+
+import json
+import os
+import platform
+import sys
+from importlib.metadata import distributions
+from pathlib import Path
+from typing import Any
+
+from changelog_checker.models import ChangeType, DependencyChange
+from changelog_checker.utils import ParserError
+
+from .base import BaseParser
+from .requirements_parser import normalize_name
+
+SUPPORTED_REPORT_VERSION = "1"
+
+
+def get_installed_versions(environment: dict[str, Any] | None = None) -> dict[str, str]:
+    """
+    Return the versions of the packages installed in the environment a report was created for, by normalized name.
+
+    This is the active virtual environment when it is not the one running changelog-checker, such as
+    when changelog-checker is installed with pipx or run with uvx, and the current environment otherwise.
+
+    Args:
+        environment: Environment markers of the report, checked against the current environment
+
+    Returns:
+        Installed versions by normalized package name
+
+    Raises:
+        ParserError: If the report was created for another interpreter and no other virtual environment is active
+    """
+    site_packages = _get_active_site_packages()
+    if site_packages is None and environment:
+        _check_environment(environment)
+    installed: dict[str, str] = {}
+    for distribution in distributions(path=site_packages) if site_packages is not None else distributions():
+        name = distribution.metadata["Name"]
+        if name:
+            installed.setdefault(normalize_name(name), distribution.version)
+    return installed
+
+
+def _get_active_site_packages() -> list[str] | None:
+    """Return the site-packages directories of the active virtual environment if it is not the current one."""
+    virtual_env = os.environ.get("VIRTUAL_ENV")
+    if not virtual_env or Path(virtual_env).resolve() == Path(sys.prefix).resolve():
+        return None
+    root = Path(virtual_env)
+    site_packages = [*root.glob("lib/python*/site-packages"), *root.glob("Lib/site-packages")]
+    return [str(path) for path in site_packages] or None
+
+
+def _check_environment(environment: dict[str, Any]) -> None:
+    """Check that a report was created for the interpreter running changelog-checker."""
+    current = {
+        "implementation_name": sys.implementation.name,
+        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "python_full_version": platform.python_version(),
+        "sys_platform": sys.platform,
+    }
+    differences = [
+        f"{marker} {environment[marker]} instead of {value}"
+        for marker, value in current.items()
+        if marker in environment and str(environment[marker]) != value
+    ]
+    if differences:
+        raise ParserError(
+            f"The pip installation report was created for another environment ({', '.join(differences)}). "
+            "Pass the installed packages of that environment with --installed-file"
+        )
+
+
+def load_installed_versions(content: str) -> dict[str, str]:
+    """
+    Load installed package versions from pip list --format=json or pip freeze output.
+
+    Args:
+        content: Output of pip list --format=json or pip freeze
+
+    Returns:
+        Installed versions by normalized package name
+    """
+    if content.lstrip().startswith("["):
+        try:
+            return {normalize_name(package["name"]): str(package["version"]) for package in json.loads(content)}
+        except (ValueError, KeyError, TypeError) as e:
+            raise ParserError(f"Invalid installed packages list: {e}") from e
+    installed = {}
+    for line in content.splitlines():
+        name, separator, version = line.strip().partition("==")
+        if separator and name and not name.startswith("#"):
+            installed[normalize_name(name)] = version.strip()
+    return installed
+
+
+class PipReportParser(BaseParser):
+    """
+    Parser for the installation report of pip install --dry-run --report.
+
+    The report lists the versions chosen by the resolver, which are compared with the installed
+    versions of the environment the report was created for.
+    """
+
+    def __init__(self, installed_versions: dict[str, str] | None = None) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            installed_versions: Installed versions by normalized package name. Defaults to the environment
+                the report was created for, see get_installed_versions.
+        """
+        self.installed_versions = installed_versions
+
+    def get_package_manager_name(self) -> str:
+        return "pip"
+
+    def validate_output(self, output: str) -> bool:
+        """Check if output looks like a pip installation report."""
+        head = output[:4096]
+        return head.lstrip().startswith("{") and ('"install"' in head or '"pip_version"' in head)
+
+    def detect(self, output: str) -> int:
+        """Recognize a JSON report as a specific match."""
+        return 2 if self.validate_output(output) else 0
+
+    def parse(self, output: str) -> list[DependencyChange]:
+        """
+        Parse a pip installation report to extract dependency changes.
+
+        Expected format:
+        {"version": "1", "pip_version": "...", "install": [{"metadata": {"name": "...", "version": "..."}, ...}],
+         "environment": {"python_full_version": "...", ...}}
+        """
+        report = self._load_report(output)
+        installed_versions = self.installed_versions
+        if installed_versions is None:
+            environment = report.get("environment")
+            installed_versions = get_installed_versions(environment if isinstance(environment, dict) else None)
+        changes = []
+        for item in report["install"]:
+            metadata = item.get("metadata") if isinstance(item, dict) else None
+            if not isinstance(metadata, dict) or not metadata.get("name") or not metadata.get("version"):
+                continue
+            package_name = str(metadata["name"])
+            new_version = str(metadata["version"])
+            old_version = installed_versions.get(normalize_name(package_name))
+            if old_version == new_version:
+                continue
+            if old_version:
+                changes.append(
+                    DependencyChange(
+                        name=package_name, change_type=ChangeType.UPDATED, old_version=old_version, new_version=new_version
+                    )
+                )
+            else:
+                changes.append(DependencyChange(name=package_name, change_type=ChangeType.ADDED, new_version=new_version))
+        return changes
+
+    def _load_report(self, output: str) -> dict[str, Any]:
+        """Decode a report and check its version and install list."""
+        try:
+            report = json.loads(output)
+        except ValueError as e:
+            raise ParserError(f"Invalid pip installation report: {e}") from e
+        if not isinstance(report, dict) or not isinstance(report.get("install", []), list):
+            raise ParserError("Invalid pip installation report: expected an object with an install list")
+        version = report.get("version")
+        if version is not None and str(version).split(".")[0] != SUPPORTED_REPORT_VERSION:
+            raise ParserError(f"Unsupported pip installation report version {version}")
+        report.setdefault("install", [])
+        return report
@@ -0,0 +1,42 @@
+"""
+Parser for poetry.lock lockfiles.
+"""
+
+import tomllib
+
+from changelog_checker.utils import ParserError
+
+from .lockfile import LockedPackage, LockfileParser
+from .requirements_parser import normalize_name
+
+LOCAL_SOURCE_TYPES = ("directory", "file")
+
+
+class PoetryLockParser(LockfileParser):
+    """Parser comparing two versions of a poetry.lock file."""
+
+    def get_package_manager_name(self) -> str:
+        return "poetry"
+
+    def load_packages(self, content: str) -> list[LockedPackage]:
+        """
+        Load the packages pinned in a poetry.lock file.
+
+        Packages installed from local directories or files are skipped, as they have no published changelog.
+        """
+        try:
+            lockfile = tomllib.loads(content)
+        except tomllib.TOMLDecodeError as e:
+            raise ParserError(f"Invalid poetry.lock file: {e}") from e
+        packages = lockfile.get("package", [])
+        if not isinstance(packages, list):
+            raise ParserError("Invalid poetry.lock file: package must be an array of tables")
+        locked_packages = []
+        for package in packages:
+            if not isinstance(package, dict) or "name" not in package or "version" not in package:
+                continue
+            source = package.get("source", {})
+            if isinstance(source, dict) and source.get("type") in LOCAL_SOURCE_TYPES:
+                continue
+            locked_packages.append(LockedPackage(name=normalize_name(str(package["name"])), version=str(package["version"])))
+        return locked_packages
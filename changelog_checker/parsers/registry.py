@@ -0,0 +1,100 @@
+"""
+Registry of package manager output parsers.
+
+Parsers are registered by name, either built in or provided by other packages through the
+"changelog_checker.parsers" entry point group, and are only imported when they are used.
+"""
+
+import functools
+import importlib
+from importlib.metadata import EntryPoint, entry_points
+
+from changelog_checker.utils import ParserError
+
+from .base import BaseParser
+
+ENTRY_POINT_GROUP = "changelog_checker.parsers"
+AUTO_PARSER = "auto"
+AUTO_DETECT_CHARS = 4096
+
+BUILTIN_PARSERS = {
+    "uv": "changelog_checker.parsers.uv_parser:UVParser",
+    "pip": "changelog_checker.parsers.pip_parser:PipParser",
+    "pip-report": "changelog_checker.parsers.pip_report_parser:PipReportParser",
+}
+
+
+@functools.cache
+def _get_plugin_entry_points() -> dict[str, EntryPoint]:
+    """Find the parsers provided by other packages. Built-in parser names cannot be overridden."""
+    return {
+        entry_point.name: entry_point
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP)
+        if entry_point.name not in BUILTIN_PARSERS and entry_point.name != AUTO_PARSER
+    }
+
+
+def get_parser_names() -> list[str]:
+    """Return the names of the available parsers, built-in parsers first."""
+    return [*BUILTIN_PARSERS, *sorted(_get_plugin_entry_points())]
+
+
+def get_parser_class(name: str) -> type[BaseParser]:
+    """
+    Import the parser class registered under a name.
+
+    Args:
+        name: Parser name
+
+    Returns:
+        Parser class
+
+    Raises:
+        ParserError: If no parser is registered under the name or it cannot be loaded
+    """
+    try:
+        if name in BUILTIN_PARSERS:
+            module_name, _, class_name = BUILTIN_PARSERS[name].partition(":")
+            parser_class = getattr(importlib.import_module(module_name), class_name)
+        elif name in _get_plugin_entry_points():
+            parser_class = _get_plugin_entry_points()[name].load()
+        else:
+            raise ParserError(f"Unsupported parser type: {name}")
+    except (ImportError, AttributeError) as e:
+        raise ParserError(f"Failed to load parser {name}: {e}") from e
+    if not isinstance(parser_class, type) or not issubclass(parser_class, BaseParser):
+        raise ParserError(f"Parser {name} is not a BaseParser subclass")
+    return parser_class
+
+
+def create_parser(name: str) -> BaseParser:
+    """Create an instance of the parser registered under a name."""
+    return get_parser_class(name)()
+
+
+def detect_parser(output: str) -> BaseParser:
+    """
+    Choose the parser matching the beginning of package manager output best.
+
+    Only the first AUTO_DETECT_CHARS characters are examined. Ties are resolved in the order of get_parser_names.
+
+    Args:
+        output: Package manager output, or its beginning
+
+    Returns:
+        Parser instance
+
+    Raises:
+        ParserError: If no parser recognizes the output
+    """
+    head = output[:AUTO_DETECT_CHARS]
+    best_parser = None
+    best_score = 0
+    for name in get_parser_names():
+        parser = create_parser(name)
+        score = parser.detect(head)
+        if score > best_score:
+            best_parser, best_score = parser, score
+    if best_parser is None:
+        raise ParserError("Could not detect the package manager of the input, use --parser to choose one")
+    return best_parser
@@ -0,0 +1,47 @@
+"""
+Parser for pinned requirements files.
+"""
+
+import re
+
+from .lockfile import LockedPackage, LockfileParser
+
+REQUIREMENT_PATTERN = re.compile(
+    r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*===?\s*(?P<version>[^\s;\\]+)\s*(?:;(?P<markers>[^\\]*))?"
+)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a package name as described in PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+class RequirementsParser(LockfileParser):
+    """
+    Parser comparing two versions of a pinned requirements file, such as pip-compile or uv pip compile output.
+
+    Only requirements pinned with == or === are considered, as other requirements do not lock a version.
+    """
+
+    def get_package_manager_name(self) -> str:
+        return "pip"
+
+    def load_packages(self, content: str) -> list[LockedPackage]:
+        """Load the pinned requirements of a requirements file."""
+        packages = []
+        for line in content.replace("\\\n", " ").splitlines():
+            line = line.split(" #", 1)[0].strip()
+            if not line or line.startswith(("#", "-")):
+                continue
+            match = REQUIREMENT_PATTERN.match(line)
+            if not match:
+                continue
+            markers = (match.group("markers") or "").split(" --", 1)[0].strip()
+            packages.append(
+                LockedPackage(
+                    name=normalize_name(match.group("name")),
+                    version=match.group("version"),
+                    markers=(markers,) if markers else (),
+                )
+            )
+        return packages
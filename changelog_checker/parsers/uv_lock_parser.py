@@ -0,0 +1,47 @@
+"""
+Parser for uv.lock lockfiles.
+"""
+
+import tomllib
+
+from changelog_checker.utils import ParserError
+
+from .lockfile import LockedPackage, LockfileParser
+
+LOCAL_SOURCE_KEYS = ("editable", "virtual")
+
+
+class UVLockParser(LockfileParser):
+    """Parser comparing two versions of a uv.lock file."""
+
+    def get_package_manager_name(self) -> str:
+        return "uv"
+
+    def load_packages(self, content: str) -> list[LockedPackage]:
+        """
+        Load the packages pinned in a uv.lock file.
+
+        Workspace members installed from local sources are skipped, as they have no published changelog.
+        """
+        try:
+            lockfile = tomllib.loads(content)
+        except tomllib.TOMLDecodeError as e:
+            raise ParserError(f"Invalid uv.lock file: {e}") from e
+        packages = lockfile.get("package", [])
+        if not isinstance(packages, list):
+            raise ParserError("Invalid uv.lock file: package must be an array of tables")
+        locked_packages = []
+        for package in packages:
+            if not isinstance(package, dict) or "name" not in package or "version" not in package:
+                continue
+            source = package.get("source", {})
+            if isinstance(source, dict) and any(key in source for key in LOCAL_SOURCE_KEYS):
+                continue
+            locked_packages.append(
+                LockedPackage(
+                    name=str(package["name"]),
+                    version=str(package["version"]),
+                    markers=tuple(package.get("resolution-markers", ())),
+                )
+            )
+        return locked_packages
@@ -3,28 +3,38 @@ Parser for UV package manager output.
 """
 
 import re
+from collections.abc import Iterable, Iterator
 
 from changelog_checker.models import ChangeType, DependencyChange
 
 from .base import BaseParser
+from .requirements_parser import normalize_name
+
+SYNC_CHANGE_PATTERN = re.compile(r"([-+]) ([^=]+)==(.+)")
+DIFF_CHANGE_PATTERN = re.compile(r"([-+])([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?==([^\s;\\]+)")
+LOCK_CHANGE_PATTERN = re.compile(r"(?:Would )?([Uu]pdated?|[Aa]dd(?:ed)?|[Rr]emoved?) ([A-Za-z0-9][A-Za-z0-9._-]*) (v.+)")
 
 
 class UVParser(BaseParser):
-    """Parser for UV sync -U output."""
+    """Parser for uv sync -U, uv lock --upgrade and uv pip compile diff output."""
 
     def get_package_manager_name(self) -> str:
         return "uv"
 
     def validate_output(self, output: str) -> bool:
-        """Check if output looks like UV sync output."""
+        """Check if output looks like UV sync, UV lock or UV pip compile diff output."""
         uv_indicators = ["Resolved", "packages in", "Prepared", "Installed", "Uninstalled"]
-        return any(indicator in output for indicator in uv_indicators)
+        if any(indicator in output for indicator in uv_indicators):
+            return True
+        return any(
+            LOCK_CHANGE_PATTERN.match(line.strip()) or DIFF_CHANGE_PATTERN.match(line.strip()) for line in output.splitlines()
+        )
 
     def parse(self, output: str) -> list[DependencyChange]:
         """
-        Parse UV sync -U output to extract dependency changes.
+        Parse UV output to extract dependency changes.
 
-        Expected format:
+        Expected format for uv sync -U:
         - package==old_version
         + package==new_version
 
@@ -33,39 +43,143 @@ class UVParser(BaseParser):
 
         Or for removed packages:
         - package==version
+
+        For uv lock --upgrade (including --dry-run):
+        Update package vold_version -> vnew_version
+        Add package vversion
+        Remove package vversion
+
+        For diffs of uv pip compile output:
+        -package==old_version
+        +package==new_version
         """
-        changes = []
-        lines = output.strip().split("\n")
-        removed_packages = {}
-        added_packages = {}
-        package_order = []
-        for line in lines:
+        removed_packages: dict[str, list[str]] = {}
+        added_packages: dict[str, list[str]] = {}
+        package_names: dict[str, str] = {}
+        for line in output.strip().split("\n"):
             line = line.strip()
-            if line.startswith("- "):
-                match = re.match(r"- ([^=]+)==(.+)", line)
-                if match:
-                    package_name, version = match.groups()
-                    removed_packages[package_name] = version
-                    if package_name not in package_order:
-                        package_order.append(package_name)
-            elif line.startswith("+ "):
-                match = re.match(r"\+ ([^=]+)==(.+)", line)
-                if match:
-                    package_name, version = match.groups()
-                    added_packages[package_name] = version
-                    if package_name not in package_order:
-                        package_order.append(package_name)
-        for package_name in package_order:
-            old_version = removed_packages.get(package_name)
-            new_version = added_packages.get(package_name)
-            if old_version and new_version:
+            for package_name, old_versions, new_versions in self._parse_line(line):
+                key = normalize_name(package_name)
+                package_names.setdefault(key, package_name)
+                for version in old_versions:
+                    if version not in removed_packages.setdefault(key, []):
+                        removed_packages[key].append(version)
+                for version in new_versions:
+                    if version not in added_packages.setdefault(key, []):
+                        added_packages[key].append(version)
+        changes = []
+        for key, package_name in package_names.items():
+            removed = removed_packages.get(key, [])
+            added = added_packages.get(key, [])
+            old_versions = [version for version in removed if version not in added]
+            new_versions = [version for version in added if version not in removed]
+            for old_version, new_version in zip(old_versions, new_versions, strict=False):
                 changes.append(
                     DependencyChange(
                         name=package_name, change_type=ChangeType.UPDATED, old_version=old_version, new_version=new_version
                     )
                 )
-            elif new_version and not old_version:
+            for new_version in new_versions[len(old_versions) :]:
                 changes.append(DependencyChange(name=package_name, change_type=ChangeType.ADDED, new_version=new_version))
-            elif old_version and not new_version:
+            for old_version in old_versions[len(new_versions) :]:
                 changes.append(DependencyChange(name=package_name, change_type=ChangeType.REMOVED, old_version=old_version))
         return changes
+
+    def iter_parse(self, lines: Iterable[str]) -> Iterator[DependencyChange]:
+        """
+        Parse UV output line by line, yielding dependency changes as soon as they are known.
+
+        An update is yielded as soon as both its - and + lines were read, and lines of uv lock output
+        right away. Lone + and - lines are yielded as additions and removals at the end of the output,
+        as their counterpart could still follow. The changes are the same as those of parse, but updates
+        come before additions and removals instead of being in the order their packages appear.
+
+        Args:
+            lines: Lines of UV output, such as a stream being written by the package manager
+
+        Yields:
+            DependencyChange objects
+        """
+        removed_packages: dict[str, list[str]] = {}
+        added_packages: dict[str, list[str]] = {}
+        seen_versions: dict[str, tuple[set[str], set[str]]] = {}
+        package_names: dict[str, str] = {}
+        for line in lines:
+            line = line.strip()
+            if LOCK_CHANGE_PATTERN.match(line):
+                yield from self.parse(line)
+                continue
+            for package_name, old_versions, new_versions in self._parse_line(line):
+                key = normalize_name(package_name)
+                package_names.setdefault(key, package_name)
+                removed = removed_packages.setdefault(key, [])
+                added = added_packages.setdefault(key, [])
+                seen_old, seen_new = seen_versions.setdefault(key, (set(), set()))
+                for version in old_versions:
+                    if version not in seen_old:
+                        seen_old.add(version)
+                        _add_or_cancel(version, removed, added)
+                for version in new_versions:
+                    if version not in seen_new:
+                        seen_new.add(version)
+                        _add_or_cancel(version, added, removed)
+                while removed and added:
+                    yield DependencyChange(
+                        name=package_names[key],
+                        change_type=ChangeType.UPDATED,
+                        old_version=removed.pop(0),
+                        new_version=added.pop(0),
+                    )
+        for key, package_name in package_names.items():
+            for new_version in added_packages[key]:
+                yield DependencyChange(name=package_name, change_type=ChangeType.ADDED, new_version=new_version)
+            for old_version in removed_packages[key]:
+                yield DependencyChange(name=package_name, change_type=ChangeType.REMOVED, old_version=old_version)
+
+    def _parse_line(self, line: str) -> list[tuple[str, list[str], list[str]]]:
+        """
+        Parse one line of output.
+
+        Returns:
+            List of (package name, old versions, new versions) tuples, empty if the line describes no change
+        """
+        match = SYNC_CHANGE_PATTERN.match(line) or DIFF_CHANGE_PATTERN.match(line)
+        if match:
+            sign, package_name, version = match.groups()
+            return [(package_name, [version], [])] if sign == "-" else [(package_name, [], [version])]
+        match = LOCK_CHANGE_PATTERN.match(line)
+        if not match:
+            return []
+        action, package_name, versions = match.groups()
+        if action.lower().startswith("add"):
+            return [(package_name, [], _split_lock_versions(versions))]
+        if action.lower().startswith("remove"):
+            return [(package_name, _split_lock_versions(versions), [])]
+        old_versions, _, new_versions = versions.partition(" -> ")
+        old_list, new_list = _split_lock_versions(old_versions), _split_lock_versions(new_versions)
+        unchanged = [version for version in old_list if version in new_list]
+        return [
+            (
+                package_name,
+                [version for version in old_list if version not in unchanged],
+                [version for version in new_list if version not in unchanged],
+            )
+        ]
+
+
+def _split_lock_versions(versions: str) -> list[str]:
+    """Split a comma-separated list of versions from uv lock output, removing their "v" prefix."""
+    return [version.strip().removeprefix("v") for version in versions.split(",") if version.strip()]
+
+
+def _add_or_cancel(version: str, pending: list[str], counterpart: list[str]) -> None:
+    """
+    Add a version to the pending versions of one side of a change.
+
+    A version pending on the other side is the same version listed again with different markers
+    or extras, so it is dropped from there instead of becoming an update to the same version.
+    """
+    if version in counterpart:
+        counterpart.remove(version)
+    else:
+        pending.append(version)
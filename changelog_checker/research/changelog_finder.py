@@ -3,17 +3,21 @@ Changelog finder for discovering and parsing changelog files from GitHub reposit
 """
 
 import contextlib
+import hashlib
 import io
 import logging
 import os
 import re
+import time
 import zipfile
-from typing import Any
+from typing import Any, NamedTuple
 
 import requests
 from distlib.version import NormalizedVersion, UnsupportedVersionError
 
-from changelog_checker.models import ChangelogEntry
+from changelog_checker.cache import Cache
+from changelog_checker.models import ChangelogEntry, ChangelogText, is_heading_underline
+from changelog_checker.stats import RunStats, TrackedSession
 from changelog_checker.utils import NetworkError, handle_network_errors
 from changelog_checker.version import VERSION
 
@@ -28,18 +32,48 @@ COMMON_FILES = [
     "RELEASE_NOTES",
 ]
 
+CHANGELOG_CHUNK_SIZE = 64 * 1024
+CHANGELOG_BLOB_NAMESPACE = "changelog-blobs"
+CHANGELOG_INDEX_NAMESPACE = "changelog-index"
+RELEASES_NAMESPACE = "github-releases"
+RELEASES_TTL = 24 * 3600
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_RAW_URL = "https://raw.githubusercontent.com"
+# Highest priority root changelog file names of ChangelogFinder.changelog_paths, probed through raw URLs
+# before listing the repository root with the contents API, so the same file is chosen either way
+RAW_PROBE_FILES = [f"{COMMON_FILES[0]}{extension}" for extension in (".md", ".rst")]
+
+
+class Release(NamedTuple):
+    """GitHub release reduced to the fields used for changelog entries."""
+
+    version: str
+    body: str
+    published_at: str | None
+
 
 class ChangelogFinder:
     """Finds and parses changelog files from GitHub repositories."""
 
-    def __init__(self, github_token: str | None = None):
+    def __init__(
+        self,
+        github_token: str | None = None,
+        cache: Cache | None = None,
+        stats: RunStats | None = None,
+        api_url: str = GITHUB_API_URL,
+    ):
         """
         Initialize the changelog finder.
 
         Args:
             github_token: Optional GitHub API token for authentication
+            cache: Optional cache for changelog files and their version indexes. Defaults to an in-memory cache.
+            stats: Optional run statistics recording requests
+            api_url: Base URL of the GitHub API, such as a local stand-in for testing
         """
-        self.session = requests.Session()
+        self.api_url = api_url.rstrip("/")
+        self.cache = cache if cache is not None else Cache()
+        self.session = TrackedSession(stats)
         self.session.headers.update(
             {"User-Agent": f"changelog-checker/{VERSION} (https://github.com/MrNaif2018/changelog-checker)"}
         )
@@ -103,11 +137,18 @@ class ChangelogFinder:
                 self.logger.debug(f"Found {len(entries)} entries from GitHub releases")
                 return entries, releases_url
         self.logger.debug(f"Falling back to changelog file parsing for {owner}/{repo}")
+        raw_result = self._fetch_from_raw_file(owner, repo, old_version, new_version)
+        if raw_result is not None:
+            entries, changelog_url = raw_result
+            if changelog_url:
+                self.logger.debug(f"Found {len(entries)} entries from raw changelog file")
+                return entries, changelog_url
         changelog_result = self.find_changelog(owner, repo)
         if changelog_result is not None:
             changelog_url, content = changelog_result
             if content:
-                entries = self.parse_changelog(content, old_version, new_version)
+                data = content.encode("utf-8", errors="ignore")
+                entries = self._parse_indexed_changelog(self._get_blob_sha(data), data, True, old_version, new_version)
                 self.logger.debug(f"Found {len(entries)} entries from changelog file")
                 return entries, changelog_url
         return [], None
@@ -127,23 +168,27 @@ class ChangelogFinder:
             version = version[4:].replace("_", ".")
         return version
 
-    def _fetch_all_releases(self, owner: str, repo: str, old_version: str) -> list[dict[str, Any]] | None:
+    def _fetch_all_releases(self, owner: str, repo: str, old_version: str) -> list[Release] | None:
         """
         Fetch releases from GitHub API with pagination support, stopping when old_version is found.
 
+        Releases are reduced to Release records as soon as a page is received, and bodies of
+        releases at or below old_version are dropped. Bodies of releases newer than the requested
+        range are kept, so the releases can answer later queries for other ranges.
+
         Args:
             owner: Repository owner
             repo: Repository name
-            old_version: Stop fetching when this version is encountered
+            old_version: Starting version (exclusive), stop fetching when this version is encountered
 
         Returns:
-            List of release dictionaries or None if error occurred
+            List of Release records or None if error occurred
         """
-        all_releases = []
+        all_releases: list[Release] = []
         page = 1
         per_page = 40  # for faster responses
         while True:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
+            api_url = f"{self.api_url}/repos/{owner}/{repo}/releases"
             params = {"page": page, "per_page": per_page}
             self.logger.debug(f"Fetching releases from GitHub API: {api_url} (page {page})")
             response = self.session.get(api_url, params=params, timeout=15)
@@ -161,11 +206,11 @@ class ChangelogFinder:
             releases = response.json()
             if not releases:
                 break
-            all_releases.extend(releases)
             will_break = False
             for release in releases:
-                tag_name = release.get("tag_name", "")
-                version = self._normalize_tag_to_version(tag_name)
+                version = self._normalize_tag_to_version(release.get("tag_name", ""))
+                body = (release.get("body") or "").strip() if self._is_newer(version, old_version) else ""
+                all_releases.append(Release(version, body, release.get("published_at")))
                 with contextlib.suppress(UnsupportedVersionError):
                     if not will_break and NormalizedVersion(version) <= NormalizedVersion(old_version):
                         self.logger.debug(f"Found old_version {old_version}, stopping pagination")
@@ -179,6 +224,43 @@ class ChangelogFinder:
         self.logger.debug(f"Total releases fetched: {len(all_releases)}")
         return all_releases
 
+    def _get_releases(self, owner: str, repo: str, old_version: str) -> list[Release] | None:
+        """
+        Get the releases of a repository newer than old_version, from the cache if possible.
+
+        Releases are cached per repository for RELEASES_TTL seconds, so edited release notes are
+        picked up and overlapping version ranges reuse the same releases. A cached entry answers
+        a query if it reaches down to old_version or holds all releases of the repository.
+
+        Returns:
+            Release records with a body, or None if the releases could not be fetched
+        """
+        cache_key = f"{owner}/{repo}"
+        cached = self.cache.get_json(RELEASES_NAMESPACE, cache_key)
+        if (
+            isinstance(cached, dict)
+            and time.time() - cached.get("fetched_at", 0) < RELEASES_TTL
+            and (cached.get("complete") or self._is_at_or_below(cached.get("oldest") or "", old_version))
+        ):
+            self.logger.debug(f"Using cached GitHub releases for {owner}/{repo}")
+            return [Release(*release) for release in cached["releases"]]
+        all_releases = self._fetch_all_releases(owner, repo, old_version)
+        if all_releases is None:
+            return None
+        reached = [release.version for release in all_releases if self._is_at_or_below(release.version, old_version)]
+        releases = [release for release in all_releases if release.body]
+        self.cache.set_json(
+            RELEASES_NAMESPACE,
+            cache_key,
+            {
+                "fetched_at": time.time(),
+                "complete": not reached,
+                "oldest": old_version if reached else None,
+                "releases": releases,
+            },
+        )
+        return releases
+
     @handle_network_errors
     def _fetch_from_github_releases(
         self, owner: str, repo: str, old_version: str, new_version: str
@@ -196,19 +278,14 @@ class ChangelogFinder:
             Tuple of (List of ChangelogEntry objects, releases_url)
         """
         try:
-            all_releases = self._fetch_all_releases(owner, repo, old_version)
-            if all_releases is None:
+            releases = self._get_releases(owner, repo, old_version)
+            if releases is None:
                 return [], None
+            releases = [release for release in releases if self._version_in_range(release.version, old_version, new_version)]
             entries = []
-            for release in all_releases:
-                tag_name = release.get("tag_name", "")
-                release_body = release.get("body", "") or ""
-                version = self._normalize_tag_to_version(tag_name)
-                if self._version_in_range(version, old_version, new_version) and release_body.strip():
-                    self.logger.debug(f"Found release {version} with changelog content")
-                    entries.append(
-                        ChangelogEntry(version=version, content=release_body.strip(), date=release.get("published_at"))
-                    )
+            for release in releases:
+                self.logger.debug(f"Found release {release.version} with changelog content")
+                entries.append(ChangelogEntry(version=release.version, content=release.body, date=release.published_at))
             if entries:
                 with contextlib.suppress(Exception):
                     entries.sort(key=lambda entry: NormalizedVersion(entry.version), reverse=True)
@@ -235,7 +312,7 @@ class ChangelogFinder:
             Tuple of (changelog_url, changelog_content) or (None, None) if not found
         """
         try:
-            archive_url = f"https://api.github.com/repos/{owner}/{repo}/zipball"
+            archive_url = f"{self.api_url}/repos/{owner}/{repo}/zipball"
             self.logger.debug(f"Downloading repository archive from {archive_url}")
             response = self.session.get(archive_url, timeout=30)
             if response.status_code == 200:
@@ -260,6 +337,193 @@ class ChangelogFinder:
             self.logger.warning(f"Error downloading repository archive for {owner}/{repo}: {e}")
             return None, None
 
+    @handle_network_errors
+    def _fetch_from_raw_file(
+        self, owner: str, repo: str, old_version: str, new_version: str
+    ) -> tuple[list[ChangelogEntry], str | None]:
+        """
+        Fetch changelog entries from a changelog file in the repository root, downloading only the needed part.
+
+        The downloaded part and its version index are cached by the file's blob SHA, so later runs
+        only need to download more of the file if old_version is not covered yet.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            old_version: Starting version (exclusive)
+            new_version: Ending version (inclusive)
+
+        Returns:
+            Tuple of (List of ChangelogEntry objects, changelog_url) or ([], None) if no changelog file was found
+        """
+        try:
+            file_info = self._find_root_changelog_file(owner, repo)
+            if not file_info or not file_info.get("download_url"):
+                return [], None
+            self.logger.debug(f"Found changelog file in repository root: {file_info['path']}")
+            blob_sha = file_info["sha"]
+            changelog_url = f"https://github.com/{owner}/{repo}/blob/HEAD/{file_info['path']}"
+            data = self.cache.get_bytes(CHANGELOG_BLOB_NAMESPACE, blob_sha)
+            index = self.cache.get_json(CHANGELOG_INDEX_NAMESPACE, blob_sha)
+            if data is not None and index is not None and self._index_covers_version(index, len(data), old_version):
+                self.logger.debug(f"Using cached changelog index for {owner}/{repo} ({blob_sha})")
+                return self._entries_from_index(data, index["sections"], old_version, new_version), changelog_url
+            result = self._download_changelog_prefix(file_info["download_url"], old_version, data or b"")
+            if result is None:
+                return [], None
+            data, complete = result
+            if not data:
+                return [], None
+            self.cache.set_bytes(CHANGELOG_BLOB_NAMESPACE, blob_sha, data)
+            return self._parse_indexed_changelog(blob_sha, data, complete, old_version, new_version), changelog_url
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"Network error downloading changelog file for {owner}/{repo}: {e}")
+            raise NetworkError(f"Failed to download changelog file for {owner}/{repo}") from e
+        except Exception as e:
+            self.logger.warning(f"Error downloading changelog file for {owner}/{repo}: {e}")
+            return [], None
+
+    def _find_root_changelog_file(self, owner: str, repo: str) -> dict[str, Any] | None:
+        """
+        Find the changelog file in the repository root.
+
+        The most common file names are probed through raw URLs first, which do not count against the
+        GitHub API rate limit, and the repository root is only listed with the contents API if none exists.
+        A stand-in for the GitHub API has no raw file host, so its repositories are always listed.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            File object with the name, path, download_url and a content key in sha, or None if no
+            changelog file is in the root
+        """
+        if self.api_url == GITHUB_API_URL:
+            file_info = self._probe_raw_changelog_file(owner, repo)
+            if file_info is not None:
+                return file_info
+        return self._list_root_changelog_file(owner, repo)
+
+    def _probe_raw_changelog_file(self, owner: str, repo: str) -> dict[str, Any] | None:
+        """
+        Probe the raw URLs of common changelog file names with HEAD requests.
+
+        The ETag of a raw file changes with its content, so it replaces the blob SHA as cache key.
+        """
+        for name in RAW_PROBE_FILES:
+            download_url = f"{GITHUB_RAW_URL}/{owner}/{repo}/HEAD/{name}"
+            response = self.session.head(download_url, timeout=15)
+            etag = response.headers.get("ETag", "").removeprefix("W/").strip('"')
+            if response.status_code == 200 and etag:
+                self.logger.debug(f"Found changelog file {name} for {owner}/{repo} through its raw URL")
+                return {"name": name, "path": name, "download_url": download_url, "sha": f"etag-{etag}"}
+        return None
+
+    def _list_root_changelog_file(self, owner: str, repo: str) -> dict[str, Any] | None:
+        """
+        Find the highest priority changelog file in the repository root using the contents API.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            Contents API file object or None if no changelog file is in the root
+        """
+        api_url = f"{self.api_url}/repos/{owner}/{repo}/contents/"
+        self.logger.debug(f"Listing repository root from GitHub API: {api_url}")
+        response = self.session.get(api_url, timeout=15)
+        if response.status_code != 200:
+            self.logger.debug(f"GitHub contents API returned {response.status_code} for {owner}/{repo}")
+            return None
+        priorities: dict[str, int] = {}
+        for i, changelog_path in enumerate(self.changelog_paths):
+            priorities.setdefault(changelog_path.lower(), i)
+        candidates = [
+            item for item in response.json() if item.get("type") == "file" and item.get("name", "").lower() in priorities
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda item: priorities[item["name"].lower()])
+
+    def _download_changelog_prefix(
+        self, download_url: str, old_version: str, initial_data: bytes = b""
+    ) -> tuple[bytes, bool] | None:
+        """
+        Download a changelog file in chunks using HTTP Range requests.
+
+        Newest entries are at the top of a changelog, so further chunks are only requested
+        while no version heading at or below old_version has appeared yet.
+
+        Args:
+            download_url: Raw file URL
+            old_version: Version which marks the end of the needed part
+            initial_data: Already downloaded beginning of the file (ending at a line boundary) to continue from
+
+        Returns:
+            Tuple of (downloaded bytes, whether the whole file was downloaded) or None on error.
+            Incomplete downloads are cut at the last complete line.
+        """
+        data = bytearray(initial_data)
+        chunk_size = CHANGELOG_CHUNK_SIZE
+        while True:
+            headers = {"Range": f"bytes={len(data)}-{len(data) + chunk_size - 1}"}
+            self.logger.debug(f"Downloading changelog chunk from {download_url} ({headers['Range']})")
+            response = self.session.get(download_url, headers=headers, timeout=15)
+            if response.status_code == 416:  # range starts past the end of file
+                return bytes(data), True
+            if response.status_code == 200:  # server ignored the range and sent the whole file
+                return response.content, True
+            if response.status_code != 206:
+                self.logger.debug(f"Changelog file download failed with status {response.status_code}")
+                return None
+            data += response.content
+            total_size = response.headers.get("Content-Range", "").rpartition("/")[2]
+            if len(response.content) < chunk_size or (total_size.isdigit() and len(data) >= int(total_size)):
+                return bytes(data), True
+            complete_end = data.rfind(b"\n") + 1
+            if self._reaches_version(bytes(data[:complete_end]), old_version):
+                self.logger.debug(f"Found version {old_version} or older after {complete_end} bytes, stopping download")
+                return bytes(data[:complete_end]), False
+            chunk_size *= 2
+
+    def _reaches_version(self, data: bytes, old_version: str) -> bool:
+        """
+        Check if changelog data covers old_version, judged by the version headings found by _index_changelog.
+
+        The heading of old_version itself ends the entries. If the changelog has no such heading, two
+        consecutive headings below it are needed, so a lower version mentioned in the text of an entry
+        does not cut off the older entries.
+        """
+        older_headings = 0
+        for version, *_ in self._index_changelog(data):
+            if version == old_version:
+                return True
+            older_headings = older_headings + 1 if self._is_at_or_below(version, old_version) else 0
+            if older_headings == 2:
+                return True
+        return False
+
+    def _is_at_or_below(self, version: str, old_version: str) -> bool:
+        """Check if version is old_version or an older one."""
+        if version == old_version:
+            return True
+        try:
+            return bool(NormalizedVersion(version) <= NormalizedVersion(old_version))
+        except UnsupportedVersionError:
+            return False
+
+    def _index_covers_version(self, index: dict[str, Any], size: int, old_version: str) -> bool:
+        """Check if a changelog index built from size bytes can answer queries down to old_version."""
+        if index.get("size") != size:
+            return False
+        return bool(index["complete"]) or any(self._is_at_or_below(section[0], old_version) for section in index["sections"])
+
+    def _get_blob_sha(self, data: bytes) -> str:
+        """Compute the git blob SHA of file contents, matching the SHA reported by the GitHub API."""
+        return hashlib.sha1(b"blob %d\0" % len(data) + data, usedforsecurity=False).hexdigest()
+
     def _search_archive_for_changelog(self, archive_data: bytes, owner: str, repo: str) -> tuple[str | None, str | None]:
         """
         Search extracted archive for changelog files by examining all files in the archive.
@@ -324,35 +588,110 @@ class ChangelogFinder:
             old_version: Starting version (exclusive)
             new_version: Ending version (inclusive)
 
+        Returns:
+            List of ChangelogEntry objects for versions between old and new
+        """
+        data = content.encode("utf-8", errors="ignore")
+        return self._entries_from_index(data, self._index_changelog(data), old_version, new_version)
+
+    def _parse_indexed_changelog(
+        self, blob_sha: str, data: bytes, complete: bool, old_version: str, new_version: str
+    ) -> list[ChangelogEntry]:
+        """
+        Parse changelog data, reusing the cached version index for this blob or building and caching it.
+
+        Args:
+            blob_sha: Git blob SHA of the full changelog file
+            data: Changelog data (possibly only the beginning of the file)
+            complete: Whether data is the whole file
+            old_version: Starting version (exclusive)
+            new_version: Ending version (inclusive)
+
+        Returns:
+            List of ChangelogEntry objects for versions between old and new
+        """
+        index = self.cache.get_json(CHANGELOG_INDEX_NAMESPACE, blob_sha)
+        if index is None or index.get("size") != len(data):
+            index = {"size": len(data), "complete": complete, "sections": self._index_changelog(data)}
+            self.cache.set_json(CHANGELOG_INDEX_NAMESPACE, blob_sha, index)
+        return self._entries_from_index(data, index["sections"], old_version, new_version)
+
+    def _index_changelog(self, data: bytes) -> list[tuple[str, int, int, bool]]:
+        """
+        Locate all version headings in changelog data.
+
+        Args:
+            data: Raw changelog data
+
+        Returns:
+            List of (version, body_offset, body_length, has_content) tuples in file order, where the body
+            is the text between the version heading line and the next version heading line, and has_content
+            tells whether the body has any lines besides heading underlines
+        """
+        self.logger.debug(f"Building changelog version index for {len(data)} bytes")
+        sections: list[tuple[str, int, int, bool]] = []
+        position = 0
+        size = len(data)
+        while position < size:
+            line_end = data.find(b"\n", position)
+            if line_end == -1:
+                line_end = size
+            stripped_line = data[position:line_end].decode("utf-8", errors="ignore").strip()
+            version = self._extract_version_from_line(stripped_line)
+            if version:
+                if sections:
+                    previous_version, body_offset, _, has_content = sections[-1]
+                    sections[-1] = (previous_version, body_offset, position - body_offset, has_content)
+                body_offset = min(line_end + 1, size)
+                sections.append((version, body_offset, size - body_offset, False))
+            elif sections and not sections[-1][3] and not is_heading_underline(stripped_line):
+                sections[-1] = (*sections[-1][:3], True)
+            position = line_end + 1
+        return sections
+
+    def _entries_from_index(
+        self, data: bytes, sections: list[tuple[str, int, int, bool]], old_version: str, new_version: str
+    ) -> list[ChangelogEntry]:
+        """
+        Extract entries between versions from indexed changelog sections.
+
+        Consecutive headings without content in between share the content that follows them.
+        Entry contents reference spans of the changelog data and are only decoded when accessed.
+
+        Args:
+            data: Raw changelog data the index was built from
+            sections: Version index from _index_changelog
+            old_version: Starting version (exclusive)
+            new_version: Ending version (inclusive)
+
         Returns:
             List of ChangelogEntry objects for versions between old and new
         """
         self.logger.debug(f"Parsing changelog for versions {old_version} to {new_version}")
+        buffer = memoryview(data)
         entries = []
-        lines = content.split("\n")
-        current_content: list[str] = []
+        current_spans: list[tuple[int, int]] = []
+        has_content = False
         versions_in_current_section: list[str] = []
-        for line in lines:
-            version_found = self._extract_version_from_line(line.strip())
-            if version_found:
-                if versions_in_current_section and current_content:
-                    content_str = "\n".join(current_content).strip()
-                    for version in versions_in_current_section:
-                        entries.append(ChangelogEntry(version=version, content=content_str))
-                    versions_in_current_section = []
-                    current_content = []
-                if self._version_in_range(version_found, old_version, new_version):
-                    versions_in_current_section.append(version_found)
-                if version_found == old_version:
-                    break
-            elif versions_in_current_section:
-                stripped_line = line.strip()
-                if not (stripped_line and len(set(stripped_line)) == 1 and stripped_line[0] in "-~=^#"):
-                    current_content.append(line)
+        for version_found, body_offset, body_length, body_has_content in sections:
+            if versions_in_current_section and has_content:
+                content = ChangelogText(buffer, current_spans)
+                for version in versions_in_current_section:
+                    entries.append(ChangelogEntry(version=version, content=content))
+                versions_in_current_section = []
+                current_spans = []
+                has_content = False
+            if self._version_in_range(version_found, old_version, new_version):
+                versions_in_current_section.append(version_found)
+            if version_found == old_version:
+                break
+            if versions_in_current_section and body_length:
+                current_spans.append((body_offset, body_length))
+                has_content = has_content or body_has_content
         if versions_in_current_section:
-            content_str = "\n".join(current_content).strip()
+            content = ChangelogText(buffer, current_spans)
             for version in versions_in_current_section:
-                entries.append(ChangelogEntry(version=version, content=content_str))
+                entries.append(ChangelogEntry(version=version, content=content))
         with contextlib.suppress(Exception):
             entries.sort(key=lambda entry: NormalizedVersion(entry.version), reverse=True)
         return entries
@@ -398,6 +737,13 @@ class ChangelogFinder:
                     continue
         return None
 
+    def _is_newer(self, version: str, old_version: str) -> bool:
+        """Check if version is newer than old_version, False if either cannot be compared."""
+        try:
+            return bool(NormalizedVersion(version) > NormalizedVersion(old_version))
+        except UnsupportedVersionError:
+            return False
+
     def _version_in_range(self, version: str, old_version: str, new_version: str) -> bool:
         """Check if version is between old_version (exclusive) and new_version (inclusive)."""
         try:
@@ -13,19 +13,26 @@ import requests
 from googlesearch import search as google_search
 
 from changelog_checker.models import PackageInfo
+from changelog_checker.stats import RunStats, TrackedSession
 from changelog_checker.utils import NetworkError, handle_network_errors
 from changelog_checker.version import VERSION
 
+PYPI_URL = "https://pypi.org"
+
 
 class PackageFinder:
     """Finds GitHub repositories for PyPI packages."""
 
-    def __init__(self) -> None:
+    def __init__(self, stats: RunStats | None = None, pypi_url: str = PYPI_URL) -> None:
         """
         Initialize the package finder.
 
+        Args:
+            stats: Optional run statistics recording requests
+            pypi_url: Base URL of the PyPI JSON API, such as a local stand-in for testing
         """
-        self.session = requests.Session()
+        self.pypi_url = pypi_url.rstrip("/")
+        self.session = TrackedSession(stats)
         self.session.headers.update({"User-Agent": f"changelog-checker/{VERSION} (https://github.com/user/changelog-checker)"})
         self.logger = logging.getLogger("changelog_checker.package_finder")
         self._reserved_names = self._load_reserved_names()
@@ -74,7 +81,7 @@ class PackageFinder:
         """Find GitHub URL from PyPI JSON API."""
         try:
             self.logger.debug(f"Fetching PyPI JSON API data for {package_name}")
-            pypi_json_url = f"https://pypi.org/pypi/{package_name}/json"
+            pypi_json_url = f"{self.pypi_url}/pypi/{package_name}/json"
             response = self.session.get(pypi_json_url, timeout=10)
             response.raise_for_status()
             data = response.json()
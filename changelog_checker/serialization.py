@@ -0,0 +1,150 @@
+"""
+Serialization of changelog checker results to JSON.
+"""
+
+import json
+from typing import Any
+
+from changelog_checker.models import ChangelogEntry, ChangeType, DependencyChange, PackageInfo, PackageReport
+from changelog_checker.utils import ChangelogCheckerError, get_entry_format
+
+FORMAT_VERSION = 1
+
+_encoder = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":"))
+
+
+def dependency_change_to_dict(change: DependencyChange) -> dict[str, Any]:
+    """Convert a dependency change to a JSON-compatible dict."""
+    return {
+        "name": change.name,
+        "change_type": change.change_type.value,
+        "old_version": change.old_version,
+        "new_version": change.new_version,
+    }
+
+
+def package_info_to_dict(info: PackageInfo | None) -> dict[str, Any] | None:
+    """Convert package info to a JSON-compatible dict."""
+    if info is None:
+        return None
+    return {
+        "name": info.name,
+        "github_url": info.github_url,
+        "pypi_url": info.pypi_url,
+        "changelog_url": info.changelog_url,
+        "changelog_found": info.changelog_found,
+    }
+
+
+def changelog_entry_to_dict(entry: ChangelogEntry) -> dict[str, Any]:
+    """Convert a changelog entry to a JSON-compatible dict."""
+    return {
+        "version": entry.version,
+        "date": entry.date,
+        "content_format": get_entry_format(entry),
+        "content": entry.content,
+    }
+
+
+def report_to_dict(report: PackageReport) -> dict[str, Any]:
+    """Convert a package report to a JSON-compatible dict."""
+    return {
+        "dependency_change": dependency_change_to_dict(report.dependency_change),
+        "package_info": package_info_to_dict(report.package_info),
+        "changelog_entries": [changelog_entry_to_dict(entry) for entry in report.changelog_entries],
+        "error_message": report.error_message,
+        "duration": report.duration,
+    }
+
+
+def dumps(value: Any) -> str:
+    """Encode a JSON-compatible value as compact JSON."""
+    return _encoder.encode(value)
+
+
+def dependency_change_from_dict(data: dict[str, Any]) -> DependencyChange:
+    """Create a dependency change from its dict form."""
+    return DependencyChange(
+        name=data["name"],
+        change_type=ChangeType(data["change_type"]),
+        old_version=data.get("old_version"),
+        new_version=data.get("new_version"),
+    )
+
+
+def package_info_from_dict(data: dict[str, Any] | None) -> PackageInfo | None:
+    """Create package info from its dict form."""
+    if data is None:
+        return None
+    return PackageInfo(
+        name=data["name"],
+        github_url=data.get("github_url"),
+        pypi_url=data.get("pypi_url"),
+        changelog_url=data.get("changelog_url"),
+        changelog_found=data.get("changelog_found", False),
+    )
+
+
+def changelog_entry_from_dict(data: dict[str, Any]) -> ChangelogEntry:
+    """Create a changelog entry from its dict form."""
+    return ChangelogEntry(
+        version=data["version"],
+        content=data["content"],
+        date=data.get("date"),
+        content_format=data.get("content_format"),
+    )
+
+
+def report_from_dict(data: dict[str, Any]) -> PackageReport:
+    """Create a package report from its dict form."""
+    return PackageReport(
+        dependency_change=dependency_change_from_dict(data["dependency_change"]),
+        package_info=package_info_from_dict(data.get("package_info")),
+        changelog_entries=[changelog_entry_from_dict(entry) for entry in data.get("changelog_entries", [])],
+        error_message=data.get("error_message"),
+        duration=data.get("duration"),
+    )
+
+
+def _check_format_version(data: dict[str, Any]) -> None:
+    """Reject saved results written by a newer format version. Results without a version are from version 1."""
+    format_version = data.get("format_version", FORMAT_VERSION)
+    if not isinstance(format_version, int) or format_version > FORMAT_VERSION:
+        raise ChangelogCheckerError(f"Unsupported results format version {format_version}, expected at most {FORMAT_VERSION}")
+
+
+def load_reports(text: str) -> list[PackageReport]:
+    """
+    Load package reports saved as a JSON document or as NDJSON.
+
+    The format version is checked on the JSON document, and on every line of NDJSON, where each
+    report carries it so that files can be concatenated.
+
+    Args:
+        text: Saved results, as written by the json or ndjson output formats
+
+    Returns:
+        List of PackageReport objects
+
+    Raises:
+        ChangelogCheckerError: If the results are malformed or from an unsupported format version
+    """
+    try:
+        try:
+            document = json.loads(text)
+        except ValueError:
+            document = None
+        if isinstance(document, dict) and "reports" in document:
+            _check_format_version(document)
+            items = document["reports"]
+        elif isinstance(document, dict):
+            items = [document]
+        else:
+            items = [json.loads(line) for line in text.splitlines() if line.strip()]
+        reports = []
+        for item in items:
+            _check_format_version(item)
+            reports.append(report_from_dict(item))
+        return reports
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ChangelogCheckerError(f"Invalid saved results: {e}") from e
@@ -0,0 +1,415 @@
+"""
+Long-running HTTP server checking dependency changes with warm caches.
+
+The server keeps the changelog cache, package reports and research sessions with their pooled
+connections between requests, so packages that were already checked are reported without any
+network request. Identical requests and checks of the same package running at the same time are
+only processed once. Requests are handled in threads, where the render budget cannot interrupt
+rendering, so HTML reports are rendered in a pool of worker processes shared by all requests.
+"""
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import multiprocessing
+import queue
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+from urllib.parse import parse_qs, urlsplit
+
+from .cache import Cache
+from .core import ChangelogChecker
+from .git_range import get_lockfile_parser
+from .models import DependencyChange, PackageReport
+from .output import HTMLFormatter, JSONFormatter
+from .output.rendering import RENDER_TIMEOUT, create_render_pool
+from .parsers.registry import AUTO_PARSER, get_parser_names
+from .parsers.requirements_parser import normalize_name
+from .research.changelog_finder import GITHUB_API_URL
+from .research.package_finder import PYPI_URL
+from .server_defaults import (
+    DEFAULT_HOST,
+    DEFAULT_MAX_REPORTS,
+    DEFAULT_MEMORY_ENTRIES,
+    DEFAULT_PORT,
+    DEFAULT_RENDER_WORKERS,
+    DEFAULT_REPORT_TTL,
+)
+from .utils import ChangelogCheckerError, NetworkError
+
+MAX_BODY_SIZE = 16 * 1024 * 1024
+PRUNE_CHECK_INTERVAL = 3600.0
+RESPONSE_FORMATS = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "html": "text/html; charset=utf-8",
+}
+
+T = TypeVar("T")
+
+logger = logging.getLogger("changelog_checker.server")
+
+
+class Response(NamedTuple):
+    """HTTP response of the server."""
+
+    status: int
+    content_type: str
+    body: bytes
+
+
+def error_response(status: int, message: str) -> Response:
+    """Create a JSON error response."""
+    return Response(status, RESPONSE_FORMATS["json"], json.dumps({"error": message}).encode("utf-8"))
+
+
+class SingleFlight:
+    """Runs a function once for all callers asking for the same key at the same time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Call a function, or wait for the result of the call already running for the key.
+
+        Args:
+            key: Key identifying the call
+            function: Function to call if no call for the key is running
+
+        Returns:
+            Result of the function, shared by all callers waiting for it
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class ReportCache:
+    """Package reports shared by all requests, kept for a limited time."""
+
+    def __init__(self, ttl: float = DEFAULT_REPORT_TTL, max_size: int = DEFAULT_MAX_REPORTS) -> None:
+        """
+        Initialize the report cache.
+
+        Args:
+            ttl: Seconds a package report is reused for, or 0 to only share reports of running checks
+            max_size: Number of reports kept, the oldest being dropped first, or 0 for no limit
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._reports: OrderedDict[Hashable, tuple[float, PackageReport]] = OrderedDict()
+        self._flight = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    def get(self, change: DependencyChange, generate: Callable[[DependencyChange], PackageReport]) -> PackageReport:
+        """
+        Return the report of a dependency change, generating it if it is not cached.
+
+        Reports with an error are not kept, so the change is checked again by the next request.
+
+        Args:
+            change: Dependency change
+            generate: Function generating the report of a change
+
+        Returns:
+            Copy of the report, which the caller may modify
+        """
+        key = (normalize_name(change.name), change.change_type, change.old_version, change.new_version)
+        with self._lock:
+            cached = self._reports.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            report = cached[1]
+        else:
+            report = self._flight.do(key, lambda: self._generate(key, change, generate))
+        return dataclasses.replace(report, dependency_change=change, changelog_entries=list(report.changelog_entries))
+
+    def _generate(
+        self, key: Hashable, change: DependencyChange, generate: Callable[[DependencyChange], PackageReport]
+    ) -> PackageReport:
+        report = generate(change)
+        if self.ttl > 0 and not report.error_message:
+            with self._lock:
+                now = time.monotonic()
+                # Reports are kept in the order they expire, as they all share the same TTL
+                while self._reports and next(iter(self._reports.values()))[0] <= now:
+                    self._reports.popitem(last=False)
+                self._reports.pop(key, None)
+                self._reports[key] = (now + self.ttl, report)
+                while self.max_size and len(self._reports) > self.max_size:
+                    self._reports.popitem(last=False)
+        return report
+
+
+class PooledChecker(ChangelogChecker):
+    """Changelog checker reused by the requests of the server, sharing package reports through a report cache."""
+
+    def __init__(self, reports: ReportCache, **kwargs: Any) -> None:
+        """
+        Initialize the checker.
+
+        Args:
+            reports: Report cache shared by all checkers of the server
+            **kwargs: Arguments of ChangelogChecker
+        """
+        super().__init__(**kwargs)
+        self.reports = reports
+
+    def _generate_package_report(self, change: DependencyChange) -> PackageReport:
+        return self.reports.get(change, super()._generate_package_report)
+
+
+class ChangelogService:
+    """
+    Handles the requests of the server, independently of the HTTP transport.
+
+    Endpoints:
+        GET /health: Server status
+        POST /check?parser=auto&format=json: Check the package manager output in the request body
+        POST /diff?lockfile=uv.lock&format=json: Compare the lockfiles {"old": ..., "new": ...} in the request body
+
+    The format is json (default), ndjson or html, and responses are the documents of the matching output formats.
+    """
+
+    def __init__(
+        self,
+        github_token: str | None = None,
+        cache: Cache | None = None,
+        report_ttl: float = DEFAULT_REPORT_TTL,
+        pypi_url: str = PYPI_URL,
+        github_api_url: str = GITHUB_API_URL,
+        max_reports: int = DEFAULT_MAX_REPORTS,
+        render_workers: int = DEFAULT_RENDER_WORKERS,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            github_token: Optional GitHub API token
+            cache: Optional cache shared by all requests. Defaults to an in-memory cache keeping
+                DEFAULT_MEMORY_ENTRIES entries.
+            report_ttl: Seconds a package report is reused for, or 0 to only share reports of running checks
+            pypi_url: Base URL of the PyPI JSON API, such as a local stand-in for testing
+            github_api_url: Base URL of the GitHub API, such as a local stand-in for testing
+            max_reports: Number of package reports kept, or 0 for no limit
+            render_workers: Number of worker processes rendering HTML reports within the render budget,
+                or 0 to render in the request threads without a time limit
+        """
+        self.github_token = github_token
+        self.cache = cache if cache is not None else Cache(max_memory_entries=DEFAULT_MEMORY_ENTRIES)
+        self.reports = ReportCache(report_ttl, max_reports)
+        self.pypi_url = pypi_url
+        self.github_api_url = github_api_url
+        self.render_workers = render_workers
+        self._render_pool: ProcessPoolExecutor | None = None
+        self._render_pool_lock = threading.Lock()
+        self._checkers: queue.SimpleQueue[PooledChecker] = queue.SimpleQueue()
+        self._flight = SingleFlight()
+        self._prune_lock = threading.Lock()
+        self._next_prune_check = time.monotonic() + PRUNE_CHECK_INTERVAL
+
+    def close(self) -> None:
+        """Stop the worker processes rendering HTML reports."""
+        with self._render_pool_lock:
+            if self._render_pool is not None:
+                self._render_pool.shutdown(cancel_futures=True)
+                self._render_pool = None
+
+    def handle(self, method: str, path: str, body: bytes = b"") -> Response:
+        """
+        Handle a request.
+
+        Args:
+            method: HTTP method
+            path: Request path with the query string
+            body: Request body
+
+        Returns:
+            Response to send
+        """
+        self._prune_cache_if_due()
+        url = urlsplit(path)
+        if method == "GET" and url.path == "/health":
+            return Response(HTTPStatus.OK, RESPONSE_FORMATS["json"], json.dumps({"status": "ok"}).encode("utf-8"))
+        if url.path not in ("/check", "/diff"):
+            return error_response(HTTPStatus.NOT_FOUND, f"Unknown endpoint {url.path}")
+        if method != "POST":
+            return error_response(HTTPStatus.METHOD_NOT_ALLOWED, f"Use POST for {url.path}")
+        key = (url.path, url.query, hashlib.sha256(body).hexdigest())
+        return self._flight.do(key, lambda: self._handle_check(url.path, parse_qs(url.query), body))
+
+    def _prune_cache_if_due(self) -> None:
+        """
+        Prune the cache on disk in the background once a day, as commands only prune it when they start.
+
+        Whether pruning is due is checked at most every PRUNE_CHECK_INTERVAL seconds.
+        """
+        with self._prune_lock:
+            now = time.monotonic()
+            if now < self._next_prune_check:
+                return
+            self._next_prune_check = now + PRUNE_CHECK_INTERVAL
+        threading.Thread(target=self.cache.prune_if_due, name="cache-prune", daemon=True).start()
+
+    def _handle_check(self, endpoint: str, query: dict[str, list[str]], body: bytes) -> Response:
+        """Check the dependency changes of a request and render the response."""
+        output_format = query.get("format", ["json"])[0]
+        if output_format not in RESPONSE_FORMATS:
+            return error_response(HTTPStatus.BAD_REQUEST, f"Unsupported format {output_format}")
+        try:
+            with tempfile.TemporaryDirectory(prefix="changelog-checker-") as directory:
+                output_path = Path(directory) / f"report.{output_format}"
+                formatter = self._create_formatter(output_format, output_path)
+                with self._checker(formatter) as checker:
+                    if endpoint == "/check":
+                        self._check_output(checker, query, body)
+                    else:
+                        self._check_lockfiles(checker, query, body)
+                return Response(HTTPStatus.OK, RESPONSE_FORMATS[output_format], output_path.read_bytes())
+        except NetworkError as e:
+            return error_response(HTTPStatus.BAD_GATEWAY, str(e))
+        except ChangelogCheckerError as e:
+            return error_response(HTTPStatus.BAD_REQUEST, str(e))
+        except Exception as e:
+            logger.exception(f"Unexpected error handling {endpoint}: {e}")
+            return error_response(HTTPStatus.INTERNAL_SERVER_ERROR, f"Unexpected error: {e}")
+
+    def _check_output(self, checker: PooledChecker, query: dict[str, list[str]], body: bytes) -> None:
+        parser_type = query.get("parser", [AUTO_PARSER])[0]
+        if parser_type not in (*get_parser_names(), AUTO_PARSER):
+            raise ChangelogCheckerError(f"Unsupported parser type: {parser_type}")
+        reports = checker.check_dependencies(body.decode("utf-8", errors="replace"), parser_type)
+        checker.formatter.display_results(reports)
+
+    def _check_lockfiles(self, checker: PooledChecker, query: dict[str, list[str]], body: bytes) -> None:
+        lockfile = query.get("lockfile", ["uv.lock"])[0]
+        parser = get_lockfile_parser(lockfile)
+        if parser is None:
+            raise ChangelogCheckerError(f"Unsupported lockfile {lockfile}")
+        try:
+            lockfiles = json.loads(body)
+            old_content, new_content = str(lockfiles["old"]), str(lockfiles["new"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ChangelogCheckerError(f'Expected a JSON object with "old" and "new" lockfiles: {e}') from e
+        reports = checker.check_changes(parser.diff(old_content, new_content))
+        checker.formatter.display_results(reports)
+
+    def _create_formatter(self, output_format: str, output_path: Path) -> HTMLFormatter | JSONFormatter:
+        if output_format == "html":
+            return HTMLFormatter(output_file=str(output_path), cache=self.cache, render_pool=self._get_render_pool())
+        return JSONFormatter(output_file=str(output_path), ndjson=output_format == "ndjson")
+
+    def _get_render_pool(self) -> ProcessPoolExecutor | None:
+        """Return the render pool shared by all requests, starting it on first use."""
+        if self.render_workers < 1:
+            return None
+        with self._render_pool_lock:
+            if self._render_pool is None:
+                # Forking a process running request threads could copy locks held by them
+                self._render_pool = create_render_pool(
+                    HTMLFormatter, self.render_workers, RENDER_TIMEOUT, multiprocessing.get_context("spawn")
+                )
+            return self._render_pool
+
+    @contextlib.contextmanager
+    def _checker(self, formatter: HTMLFormatter | JSONFormatter) -> Iterator[PooledChecker]:
+        """Take an idle checker from the pool, creating one if all are busy, and return it when done."""
+        try:
+            checker = self._checkers.get_nowait()
+        except queue.Empty:
+            checker = PooledChecker(
+                self.reports,
+                github_token=self.github_token,
+                cache=self.cache,
+                pypi_url=self.pypi_url,
+                github_api_url=self.github_api_url,
+            )
+        checker.formatter = formatter
+        try:
+            yield checker
+        finally:
+            self._checkers.put(checker)
+
+
+class ChangelogRequestHandler(BaseHTTPRequestHandler):
+    """Passes HTTP requests to the changelog service of the server."""
+
+    server: "ChangelogServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._respond(self.server.service.handle("GET", self.path))
+
+    def do_POST(self) -> None:
+        content_length = self.headers.get("Content-Length") or "0"
+        if not content_length.isdigit():
+            self.close_connection = True
+            self._respond(error_response(HTTPStatus.BAD_REQUEST, "Invalid Content-Length"))
+            return
+        length = int(content_length)
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True
+            self._respond(error_response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large"))
+            return
+        self._respond(self.server.service.handle("POST", self.path, self.rfile.read(length)))
+
+    def _respond(self, response: Response) -> None:
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.info(f"{self.address_string()} - {format % args}")
+
+
+class ChangelogServer(ThreadingHTTPServer):
+    """HTTP server handling each request in its own thread with a shared changelog service."""
+
+    daemon_threads = True
+
+    def __init__(self, service: ChangelogService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            service: Service handling the requests
+            host: Address to listen on
+            port: Port to listen on, or 0 for any free port
+        """
+        super().__init__((host, port), ChangelogRequestHandler)
+        self.service = service
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.service.close()
@@ -0,0 +1,10 @@
+"""
+Default settings of the server, importable without loading the server itself.
+"""
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_REPORT_TTL = 3600.0
+DEFAULT_MAX_REPORTS = 10_000
+DEFAULT_MEMORY_ENTRIES = 4096
+DEFAULT_RENDER_WORKERS = 2
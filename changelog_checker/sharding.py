@@ -0,0 +1,82 @@
+"""
+Splitting a run over several processes and merging their results.
+"""
+
+import hashlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .models import DependencyChange, PackageReport
+from .parsers.requirements_parser import normalize_name
+
+
+def get_shard_key(name: str) -> str:
+    """
+    Return the key deciding the shard of a package.
+
+    The key is the whole normalized name. Grouping packages by their repository would need it to be
+    looked up first, and guessing it from a prefix of the name puts unrelated packages sharing one,
+    such as the many django-* packages, on the same shard.
+    """
+    return normalize_name(name)
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of several parts a run is split into, numbered from 1."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """
+        Parse a shard given as "i/n".
+
+        Raises:
+            ValueError: If the value is not two numbers with 1 <= i <= n
+        """
+        index, separator, count = value.partition("/")
+        if not separator or not index.strip().isdigit() or not count.strip().isdigit():
+            raise ValueError(f"Invalid shard {value!r}, expected i/n such as 1/4")
+        shard = cls(int(index), int(count))
+        if not 1 <= shard.index <= shard.count:
+            raise ValueError(f"Invalid shard {value!r}, i must be between 1 and n")
+        return shard
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def contains(self, change: DependencyChange) -> bool:
+        """Check if a dependency change belongs to this shard. The result is the same on every machine."""
+        digest = hashlib.sha256(get_shard_key(change.name).encode()).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+
+    def select(self, changes: Iterable[DependencyChange]) -> Iterator[DependencyChange]:
+        """Yield the dependency changes belonging to this shard."""
+        return (change for change in changes if self.contains(change))
+
+
+def merge_results(results: Iterable[list[PackageReport]]) -> list[PackageReport]:
+    """
+    Combine the results of several shards into one list of reports.
+
+    Reports are kept in the order of the results, and a report for a dependency change that was
+    already reported by an earlier result, under any spelling of the package name, is dropped.
+
+    Args:
+        results: Package reports of each shard
+
+    Returns:
+        Combined list of PackageReport objects
+    """
+    merged = []
+    seen = set()
+    for reports in results:
+        for report in reports:
+            change = report.dependency_change
+            key = (normalize_name(change.name), change.change_type, change.old_version, change.new_version)
+            if key not in seen:
+                seen.add(key)
+                merged.append(report)
+    return merged
@@ -0,0 +1,129 @@
+"""
+Run statistics shared by the components of a changelog check.
+"""
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from changelog_checker.cache import Cache
+
+
+@dataclass
+class StatsSnapshot:
+    """Consistent view of run statistics at one point in time."""
+
+    total: int
+    completed: int
+    elapsed: float
+    in_flight: dict[str, int] = field(default_factory=dict)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    rate_limit_remaining: int | None = None
+
+    @property
+    def rate(self) -> float:
+        """Completed packages per second."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds until all packages are completed, or None if unknown."""
+        if not self.completed or self.rate <= 0:
+            return None
+        return (self.total - self.completed) / self.rate
+
+
+class RunStats:
+    """Thread-safe counters describing the progress of a changelog check."""
+
+    def __init__(self, cache: Cache | None = None) -> None:
+        """
+        Initialize run statistics.
+
+        Args:
+            cache: Optional cache whose hits and misses are reported
+        """
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._total = 0
+        self._completed = 0
+        self._started_at = time.monotonic()
+        self._in_flight: Counter[str] = Counter()
+        self._rate_limit_remaining: int | None = None
+
+    def start(self, total: int) -> None:
+        """Start tracking a run over the given number of packages."""
+        with self._lock:
+            self._total = total
+            self._completed = 0
+            self._started_at = time.monotonic()
+
+    def package_found(self) -> None:
+        """Record a package found while the run is in progress, for runs whose total is not known upfront."""
+        with self._lock:
+            self._total += 1
+
+    def package_completed(self) -> None:
+        """Record a completed package."""
+        with self._lock:
+            self._completed += 1
+
+    def request_started(self, host: str) -> None:
+        """Record a request sent to a host."""
+        with self._lock:
+            self._in_flight[host] += 1
+
+    def request_finished(self, host: str, response: requests.Response | None) -> None:
+        """Record a finished request, reading the GitHub rate limit from its response."""
+        with self._lock:
+            self._in_flight[host] -= 1
+            if self._in_flight[host] <= 0:
+                del self._in_flight[host]
+            remaining = response.headers.get("X-RateLimit-Remaining") if response is not None else None
+            if remaining is not None and remaining.isdigit():
+                self._rate_limit_remaining = int(remaining)
+
+    def snapshot(self) -> StatsSnapshot:
+        """Return the current statistics."""
+        with self._lock:
+            return StatsSnapshot(
+                total=self._total,
+                completed=self._completed,
+                elapsed=time.monotonic() - self._started_at,
+                in_flight=dict(self._in_flight),
+                cache_hits=self.cache.hits if self.cache else 0,
+                cache_misses=self.cache.misses if self.cache else 0,
+                rate_limit_remaining=self._rate_limit_remaining,
+            )
+
+
+class TrackedSession(requests.Session):
+    """Requests session recording in-flight requests and rate limits in run statistics."""
+
+    def __init__(self, stats: RunStats | None = None) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            stats: Optional run statistics to record requests in
+        """
+        super().__init__()
+        self.stats = stats
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> requests.Response:
+        if self.stats is None:
+            return super().request(method, url, *args, **kwargs)
+        host = urlsplit(url if isinstance(url, str) else url.decode()).hostname or "unknown"
+        self.stats.request_started(host)
+        response = None
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            return response
+        finally:
+            self.stats.request_finished(host, response)
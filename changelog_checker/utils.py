@@ -12,11 +12,38 @@ from typing import ParamSpec, TypeVar
 
 import requests
 
-from changelog_checker.models import ChangeType, PackageReport
+from changelog_checker.models import ChangelogEntry, ChangeType, PackageReport
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+CONTENT_FORMAT_SAMPLE_LINES = 400
+
+# Line-start markup checked in priority order
+_FORMAT_MARKUP_RE = re.compile(
+    r"(?P<markdown_header>#+\s)"  # Headers: # ## ###
+    r"|(?P<markdown_inline>\*\*.*\*\*|[-*+]\s)"  # Bold: **text**, list items
+    r"|(?P<markdown_block>```|\[.*\]\(.*\))"  # Code blocks: ```, links
+    r"|(?P<rst>[=\-~`#^\"']{3,}$|\.\. )"  # RST underlines and directives
+)
+_RST_VERSION_HEADER_RE = re.compile(r"[\w\-_]+\s+v\d+\.\d+\.\d+.*\([^)]+\)$")  # RST-style version headers
+
+
+class StderrHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """
+    Logging handler writing to the current sys.stderr instead of the one set when it was created.
+
+    A live progress display replaces sys.stderr with a proxy printing above the display, so log records
+    emitted while it runs do not break it up.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(sys.stderr)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.stream = sys.stderr
+        super().emit(record)
+
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """
@@ -31,7 +58,7 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
     logger = logging.getLogger("changelog_checker")
     if logger.handlers:
         return logger
-    handler = logging.StreamHandler(sys.stderr)
+    handler = StderrHandler()
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     handler.setFormatter(formatter)
     logger.addHandler(handler)
@@ -94,6 +121,10 @@ class NetworkError(ChangelogCheckerError):
     """Error in network operations."""
 
 
+class GitError(ChangelogCheckerError):
+    """Error in reading files from a git repository."""
+
+
 class ChangelogNotFoundError(ChangelogCheckerError):
     """Error when changelog cannot be found."""
 
@@ -102,45 +133,55 @@ def detect_content_format(content: str) -> str:
     """
     Detect if content is markdown, RST, or plain text.
 
+    Only the first CONTENT_FORMAT_SAMPLE_LINES lines are examined, and detection stops
+    as soon as the remaining lines can no longer change the result.
+
     Args:
         content: The content to analyze
 
     Returns:
         One of: "markdown", "rst", "plain"
     """
-    lines = content.split("\n")
+    lines = content.split("\n", CONTENT_FORMAT_SAMPLE_LINES)[:CONTENT_FORMAT_SAMPLE_LINES]
     markdown_indicators = 0
     rst_indicators = 0
-    for line in lines:
+    for i, line in enumerate(lines):
         stripped = line.strip()
-        if re.match(r"^#+\s", stripped):  # Headers: # ## ###
-            markdown_indicators += 2
-        elif re.match(r"^\*\*.*\*\*", stripped) or re.match(r"^[-*+]\s", stripped):  # Bold: **text**
-            markdown_indicators += 1
-        elif re.match(r"^```", stripped) or re.match(r"^\[.*\]\(.*\)", stripped):  # Code blocks: ```
-            markdown_indicators += 2
-        elif re.match(r"^[=\-~`#^\"']{3,}$", stripped) or re.match(r"^\.\. ", stripped):  # RST underlines
-            rst_indicators += 2
+        match = _FORMAT_MARKUP_RE.match(stripped)
+        if match:
+            if match.lastgroup == "rst":
+                rst_indicators += 2
+            else:
+                markdown_indicators += 1 if match.lastgroup == "markdown_inline" else 2
         elif "~~~~" in stripped or "^^^^" in stripped:  # RST section markers
             rst_indicators += 1
-        elif re.match(r"^[\w\-_]+\s+v\d+\.\d+\.\d+.*\([^)]+\)$", stripped):  # RST-style version headers
+        elif _RST_VERSION_HEADER_RE.match(stripped):
             rst_indicators += 2
-    if rst_indicators > markdown_indicators and rst_indicators > 0:
-        return "rst"
-    if markdown_indicators > 0:
-        return "markdown"
+        max_remaining_score = 2 * (len(lines) - i - 1)
+        if rst_indicators > markdown_indicators + max_remaining_score:
+            return "rst"
+        if markdown_indicators > 0 and markdown_indicators >= rst_indicators + max_remaining_score:
+            return "markdown"
     return "plain"
 
 
+def get_entry_format(entry: ChangelogEntry) -> str:
+    """Return the content format of a changelog entry, detecting and recording it on first use."""
+    if entry.content_format is None:
+        entry.content_format = detect_content_format(entry.content)
+    return entry.content_format
+
+
+def is_missing_changelog(report: PackageReport) -> bool:
+    """Check whether an updated package was found but its changelog was not."""
+    return bool(
+        report.dependency_change.change_type == ChangeType.UPDATED
+        and report.package_info
+        and not report.changelog_entries
+        and not report.error_message
+    )
+
+
 def get_packages_with_missing_changelogs(reports: list[PackageReport]) -> list[PackageReport]:
     """Get packages that have missing changelogs."""
-    missing_changelogs = []
-    for report in reports:
-        if (
-            report.dependency_change.change_type == ChangeType.UPDATED
-            and report.package_info
-            and not report.changelog_entries
-            and not report.error_message
-        ):
-            missing_changelogs.append(report)
-    return missing_changelogs
+    return [report for report in reports if is_missing_changelog(report)]
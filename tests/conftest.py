@@ -1,10 +1,12 @@
 import socket
-from collections.abc import Iterator
-from typing import NoReturn
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, NoReturn
 
 import pytest
 from pytest import Config, FixtureRequest, Item, Parser
 
+from changelog_checker.models import ChangelogEntry, ChangeType, DependencyChange, PackageInfo, PackageReport
+
 # This is to ensure we patch correctly and don't send real network calls on CI
 
 _original_connect = socket.socket.connect
@@ -57,3 +59,41 @@ def pytest_runtest_setup(item: Item) -> None:
 def pytest_runtest_teardown(item: Item) -> None:
     if list(item.iter_markers(name=_DISABLE_NETWORK)) and socket.socket.connect != _original_connect:
         socket.socket.connect = _original_connect
+
+
+@pytest.fixture
+def make_report() -> Callable[..., PackageReport]:
+    """
+    Factory for package reports used by formatter tests.
+
+    Entries are changelog entries, or their content for entries of versions 1.0.0, 1.1.0 and so on.
+    Updated packages get a GitHub repository, added and removed ones no package info.
+    """
+
+    def factory(
+        name: str = "requests",
+        entries: Sequence[ChangelogEntry | str] = (),
+        change_type: ChangeType = ChangeType.UPDATED,
+        old_version: str = "1.0.0",
+        new_version: str = "2.0.0",
+        duration: float | None = None,
+        **info_fields: Any,
+    ) -> PackageReport:
+        change = DependencyChange(
+            name=name,
+            change_type=change_type,
+            old_version=None if change_type == ChangeType.ADDED else old_version,
+            new_version=None if change_type == ChangeType.REMOVED else new_version,
+        )
+        info = None
+        if change_type == ChangeType.UPDATED:
+            info = PackageInfo(name=name, github_url=f"https://github.com/user/{name}", **info_fields)
+        changelog_entries = [
+            ChangelogEntry(version=f"1.{i}.0", content=entry) if isinstance(entry, str) else entry
+            for i, entry in enumerate(entries)
+        ]
+        return PackageReport(
+            dependency_change=change, package_info=info, changelog_entries=changelog_entries, duration=duration
+        )
+
+    return factory
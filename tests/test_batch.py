@@ -0,0 +1,62 @@
+from unittest.mock import Mock, patch
+
+from changelog_checker.batch import check_projects, merge_changes, slice_report
+from changelog_checker.core import ChangelogChecker
+from changelog_checker.models import ChangelogEntry, ChangeType, DependencyChange, PackageInfo, PackageReport
+
+
+def updated(name, old_version, new_version):
+    return DependencyChange(name=name, change_type=ChangeType.UPDATED, old_version=old_version, new_version=new_version)
+
+
+class TestBatch:
+    def setup_method(self):
+        self.checker = ChangelogChecker(formatter=Mock())
+
+    def _generate_report(self, change):
+        versions = ["2.30.0", "2.31.0", "2.32.0", "2.32.3"]
+        return PackageReport(
+            dependency_change=change,
+            package_info=PackageInfo(name=change.name, changelog_found=True),
+            changelog_entries=[ChangelogEntry(version=version, content=f"Changes in {version}") for version in versions],
+        )
+
+    def test_merge_changes_widens_version_range(self):
+        merged = merge_changes(
+            {
+                "service-a": [updated("requests", "2.31.0", "2.32.3"), updated("click", "8.1.0", "8.1.7")],
+                "service-b": [updated("Requests", "2.30.0", "2.32.0")],
+            }
+        )
+        assert list(merged.values()) == [updated("requests", "2.30.0", "2.32.3"), updated("click", "8.1.0", "8.1.7")]
+
+    def test_merge_changes_keeps_distinct_additions(self):
+        added = DependencyChange(name="rich", change_type=ChangeType.ADDED, new_version="13.0.0")
+        other_added = DependencyChange(name="rich", change_type=ChangeType.ADDED, new_version="13.1.0")
+        merged = merge_changes({"service-a": [added], "service-b": [added, other_added]})
+        assert list(merged.values()) == [added, other_added]
+
+    def test_check_projects_fetches_each_package_once(self):
+        projects = {
+            "service-a": [updated("requests", "2.31.0", "2.32.3")],
+            "service-b": [updated("requests", "2.30.0", "2.32.0")],
+            "service-c": [updated("requests", "2.31.0", "2.32.3")],
+        }
+        with patch.object(self.checker, "_generate_package_report", side_effect=self._generate_report) as mock_generate:
+            project_reports = check_projects(self.checker, projects)
+        mock_generate.assert_called_once_with(updated("requests", "2.30.0", "2.32.3"))
+        assert list(project_reports) == ["service-a", "service-b", "service-c"]
+        service_a_report = project_reports["service-a"][0]
+        assert service_a_report.dependency_change == updated("requests", "2.31.0", "2.32.3")
+        assert [entry.version for entry in service_a_report.changelog_entries] == ["2.32.0", "2.32.3"]
+        service_b_report = project_reports["service-b"][0]
+        assert [entry.version for entry in service_b_report.changelog_entries] == ["2.31.0", "2.32.0"]
+
+    def test_slice_report_without_entries_in_range(self):
+        report = self._generate_report(updated("requests", "2.29.0", "2.32.3"))
+        sliced = slice_report(report, updated("requests", "2.32.3", "2.33.0"))
+        assert sliced.changelog_entries == []
+        assert sliced.package_info is not None
+        assert not sliced.package_info.changelog_found
+        assert report.package_info is not None
+        assert report.package_info.changelog_found
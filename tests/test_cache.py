@@ -0,0 +1,111 @@
+import os
+import time
+from unittest.mock import patch
+
+from changelog_checker.cache import CACHE_NAMESPACES, Cache, get_default_cache_dir
+from changelog_checker.output import html_formatter, rich_formatter
+from changelog_checker.research.changelog_finder import (
+    CHANGELOG_BLOB_NAMESPACE,
+    CHANGELOG_INDEX_NAMESPACE,
+    RELEASES_NAMESPACE,
+)
+
+
+class TestCache:
+    def test_memory_only(self):
+        cache = Cache()
+        assert cache.get_bytes("blobs", "key") is None
+        cache.set_bytes("blobs", "key", b"data")
+        cache.set_json("index", "key", {"size": 4})
+        assert cache.get_bytes("blobs", "key") == b"data"
+        assert cache.get_json("index", "key") == {"size": 4}
+
+    def test_memory_entries_bounded(self):
+        cache = Cache(max_memory_entries=2)
+        cache.set_bytes("blobs", "a", b"a")
+        cache.set_bytes("blobs", "b", b"b")
+        assert cache.get_bytes("blobs", "a") == b"a"
+        cache.set_json("index", "c", {"size": 1})
+        assert cache.get_bytes("blobs", "b") is None
+        assert cache.get_bytes("blobs", "a") == b"a"
+        assert cache.get_json("index", "c") == {"size": 1}
+
+    def test_dropped_memory_entries_read_from_disk(self, tmp_path):
+        cache = Cache(tmp_path, max_memory_entries=1)
+        cache.set_bytes("blobs", "a", b"a")
+        cache.set_bytes("blobs", "b", b"b")
+        assert cache.get_bytes("blobs", "a") == b"a"
+
+    def test_persists_across_instances(self, tmp_path):
+        Cache(tmp_path).set_bytes("blobs", "key", b"data")
+        Cache(tmp_path).set_json("index", "key", {"sections": [["1.0.0", 0, 10]]})
+        cache = Cache(tmp_path)
+        assert cache.get_bytes("blobs", "key") == b"data"
+        assert cache.get_json("index", "key") == {"sections": [["1.0.0", 0, 10]]}
+        assert cache.get_json("index", "missing") is None
+
+    def test_corrupted_entry_ignored(self, tmp_path):
+        cache = Cache(tmp_path)
+        cache.set_bytes("index", "key", b"{not json")
+        assert Cache(tmp_path).get_json("index", "key") is None
+
+    def test_default_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_default_cache_dir() == tmp_path / "changelog-checker"
+
+    def test_expired_entry_ignored(self, tmp_path):
+        Cache(tmp_path).set_bytes("blobs", "key", b"data")
+        path = next(tmp_path.glob("blobs/*"))
+        os.utime(path, (time.time() - 100, time.time() - 100))
+        assert Cache(tmp_path, max_age=50).get_bytes("blobs", "key") is None
+        assert not path.exists()
+
+    def test_prune_removes_least_recently_used(self, tmp_path):
+        cache = Cache(tmp_path, max_size=10)
+        for i, key in enumerate(["old", "used", "new"]):
+            cache.set_bytes("changelog-blobs", key, b"12345")
+            path = next(path for path in tmp_path.glob("changelog-blobs/*") if path.stat().st_mtime > time.time() - 5)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        Cache(tmp_path).get_bytes("changelog-blobs", "old")
+        assert cache.prune() == 1
+        reloaded = Cache(tmp_path)
+        assert reloaded.get_bytes("changelog-blobs", "old") == b"12345"
+        assert reloaded.get_bytes("changelog-blobs", "used") is None
+        assert reloaded.get_bytes("changelog-blobs", "new") == b"12345"
+
+    def test_prune_if_due_runs_once(self, tmp_path):
+        cache = Cache(tmp_path)
+        with patch.object(cache, "prune", return_value=0) as mock_prune:
+            cache.prune_if_due()
+            cache.prune_if_due()
+        mock_prune.assert_called_once()
+
+    def test_clear(self, tmp_path):
+        cache = Cache(tmp_path)
+        cache.set_bytes("changelog-blobs", "key", b"data")
+        cache.clear()
+        assert cache.get_bytes("changelog-blobs", "key") is None
+        assert Cache(tmp_path).get_bytes("changelog-blobs", "key") is None
+
+    def test_prune_and_clear_keep_foreign_files(self, tmp_path):
+        foreign_file = tmp_path / "notes" / "todo.txt"
+        foreign_file.parent.mkdir()
+        foreign_file.write_text("keep me")
+        os.utime(foreign_file, (time.time() - 100, time.time() - 100))
+        cache = Cache(tmp_path, max_age=50, max_size=1)
+        cache.set_bytes("changelog-blobs", "key", b"data")
+        os.utime(next(tmp_path.glob("changelog-blobs/*")), (time.time() - 100, time.time() - 100))
+        assert cache.prune() == 1
+        cache.set_bytes("rendered-html", "key", b"data")
+        cache.clear()
+        assert foreign_file.read_text() == "keep me"
+        assert not (tmp_path / "rendered-html").exists()
+
+    def test_namespaces_in_use_are_owned(self):
+        assert {
+            CHANGELOG_BLOB_NAMESPACE,
+            CHANGELOG_INDEX_NAMESPACE,
+            RELEASES_NAMESPACE,
+            html_formatter.RENDER_CACHE_NAMESPACE,
+            rich_formatter.RENDER_CACHE_NAMESPACE,
+        } == set(CACHE_NAMESPACES)
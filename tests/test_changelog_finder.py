@@ -1,6 +1,14 @@
-from unittest.mock import patch
+import time
+from unittest.mock import Mock, patch
 
-from changelog_checker.research.changelog_finder import ChangelogFinder
+from changelog_checker.models import ChangelogEntry
+from changelog_checker.research.changelog_finder import (
+    CHANGELOG_CHUNK_SIZE,
+    RAW_PROBE_FILES,
+    RELEASES_TTL,
+    ChangelogFinder,
+    Release,
+)
 
 
 class TestChangelogFinder:
@@ -62,3 +70,207 @@ class TestChangelogFinder:
         assert self.finder._version_in_range("1.0.0a0", "1.3.2", "1.4.0") is False
         assert self.finder._version_in_range("2.0.0b1", "1.3.2", "1.4.0") is False
         assert self.finder._version_in_range("invalid-version", "1.3.2", "1.4.0") is False
+
+    def test_download_changelog_prefix_stops_at_old_version(self):
+        head = b"# Changelog\n\n## 1.3.0\n- New\n\n## 1.2.0\n- Old\n"
+        first = Mock(status_code=206, content=head + b"x" * (CHANGELOG_CHUNK_SIZE - len(head)))
+        first.headers = {"Content-Range": f"bytes 0-{CHANGELOG_CHUNK_SIZE - 1}/1000000"}
+        with patch.object(self.finder.session, "get", return_value=first) as mock_get:
+            data = self.finder._download_changelog_prefix("https://raw.example/CHANGELOG.md", "1.2.0")
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["headers"] == {"Range": f"bytes=0-{CHANGELOG_CHUNK_SIZE - 1}"}
+        assert data == (head, False)
+
+    def test_download_changelog_prefix_requests_more_chunks(self):
+        first_chunk = b"## 2.0.0\n" + b"- change\n" * (CHANGELOG_CHUNK_SIZE // 9)
+        first_chunk = first_chunk[:CHANGELOG_CHUNK_SIZE]
+        first = Mock(status_code=206, content=first_chunk)
+        first.headers = {"Content-Range": f"bytes 0-{CHANGELOG_CHUNK_SIZE - 1}/*"}
+        second = Mock(status_code=206, content=b"\n## 1.0.0\n- Old\n")
+        second.headers = {}
+        with patch.object(self.finder.session, "get", side_effect=[first, second]) as mock_get:
+            data = self.finder._download_changelog_prefix("https://raw.example/CHANGELOG.md", "1.0.0")
+        assert mock_get.call_count == 2
+        start = CHANGELOG_CHUNK_SIZE
+        assert mock_get.call_args.kwargs["headers"] == {"Range": f"bytes={start}-{start + 2 * CHANGELOG_CHUNK_SIZE - 1}"}
+        assert data == (first_chunk + second.content, True)
+
+    def test_reaches_version_ignores_versions_in_entry_text(self):
+        data = b"## 5.0.0\nPython 3.8 is no longer supported\n\n## 4.1.0\n- Fix\n"
+        assert not self.finder._reaches_version(data, "4.0.0")
+        assert self.finder._reaches_version(data + b"## 3.9.0\n- Old\n## 3.8.0\n- Older\n", "4.0.0")
+        assert self.finder._reaches_version(data + b"## 4.0.0\n- Old\n", "4.0.0")
+
+    def test_download_changelog_prefix_range_ignored(self):
+        response = Mock(status_code=200, content=b"## 1.0.0\n- Initial\n")
+        with patch.object(self.finder.session, "get", return_value=response):
+            assert self.finder._download_changelog_prefix("https://raw.example/CHANGES", "0.9") == (response.content, True)
+
+    def test_download_changelog_prefix_resumes_from_initial_data(self):
+        response = Mock(status_code=206, content=b"## 1.0.0\n- Old\n")
+        response.headers = {}
+        with patch.object(self.finder.session, "get", return_value=response) as mock_get:
+            data = self.finder._download_changelog_prefix("https://raw.example/CHANGES", "1.0.0", b"## 2.0.0\n- New\n")
+        assert mock_get.call_args.kwargs["headers"] == {"Range": f"bytes=15-{15 + CHANGELOG_CHUNK_SIZE - 1}"}
+        assert data == (b"## 2.0.0\n- New\n## 1.0.0\n- Old\n", True)
+
+    def test_index_changelog(self):
+        data = b"# Changelog\n\n## 1.2.0\n- New\n\n## 1.1.0\n- Old\n"
+        sections = self.finder._index_changelog(data)
+        assert [section[0] for section in sections] == ["1.2.0", "1.1.0"]
+        _, offset, length, has_content = sections[0]
+        assert data[offset : offset + length] == b"- New\n\n"
+        assert has_content
+        _, offset, length, has_content = sections[1]
+        assert data[offset : offset + length] == b"- Old\n"
+        assert has_content
+
+    def test_index_changelog_underline_only_section(self):
+        data = b"1.2.0\n-----\n1.1.0\n-----\n- Shared\n"
+        sections = self.finder._index_changelog(data)
+        assert [(section[0], section[3]) for section in sections] == [("1.2.0", False), ("1.1.0", True)]
+        entries = self.finder._entries_from_index(data, sections, "1.0.0", "1.2.0")
+        assert [(entry.version, entry.content) for entry in entries] == [("1.2.0", "- Shared"), ("1.1.0", "- Shared")]
+
+    def test_raw_file_uses_cached_index(self):
+        data = b"## 1.2.0\n- New\n\n## 1.1.0\n- Old\n"
+        blob_sha = self.finder._get_blob_sha(data)
+        self.finder.cache.set_bytes("changelog-blobs", blob_sha, data)
+        self.finder._parse_indexed_changelog(blob_sha, data, True, "1.1.0", "1.2.0")
+        file_info = {"sha": blob_sha, "path": "CHANGELOG.md", "download_url": "https://raw.example/CHANGELOG.md"}
+        with (
+            patch.object(self.finder, "_find_root_changelog_file", return_value=file_info),
+            patch.object(self.finder, "_download_changelog_prefix") as mock_download,
+            patch.object(self.finder, "_index_changelog") as mock_index,
+        ):
+            entries, changelog_url = self.finder._fetch_from_raw_file("user", "repo", "1.0.0", "1.2.0")
+        mock_download.assert_not_called()
+        mock_index.assert_not_called()
+        assert changelog_url == "https://github.com/user/repo/blob/HEAD/CHANGELOG.md"
+        assert [(entry.version, entry.content) for entry in entries] == [("1.2.0", "- New"), ("1.1.0", "- Old")]
+
+    def test_raw_file_continues_partial_download(self):
+        data = b"## 1.2.0\n- New\n"
+        blob_sha = "abc123"
+        self.finder.cache.set_bytes("changelog-blobs", blob_sha, data)
+        self.finder._parse_indexed_changelog(blob_sha, data, False, "1.1.0", "1.2.0")
+        file_info = {"sha": blob_sha, "path": "CHANGES.rst", "download_url": "https://raw.example/CHANGES.rst"}
+        full_data = data + b"## 1.1.0\n- Old\n"
+        with (
+            patch.object(self.finder, "_find_root_changelog_file", return_value=file_info),
+            patch.object(self.finder, "_download_changelog_prefix", return_value=(full_data, True)) as mock_download,
+        ):
+            entries, _ = self.finder._fetch_from_raw_file("user", "repo", "1.0.0", "1.2.0")
+        mock_download.assert_called_once_with("https://raw.example/CHANGES.rst", "1.0.0", data)
+        assert [entry.version for entry in entries] == ["1.2.0", "1.1.0"]
+        assert self.finder.cache.get_bytes("changelog-blobs", blob_sha) == full_data
+
+    def test_find_root_changelog_file_priority(self):
+        response = Mock(status_code=200)
+        response.json.return_value = [
+            {"type": "file", "name": "HISTORY.rst", "path": "HISTORY.rst"},
+            {"type": "dir", "name": "changelog", "path": "changelog"},
+            {"type": "file", "name": "CHANGELOG.md", "path": "CHANGELOG.md"},
+            {"type": "file", "name": "README.md", "path": "README.md"},
+        ]
+        with patch.object(self.finder.session, "get", return_value=response):
+            file_info = self.finder._list_root_changelog_file("user", "repo")
+        assert file_info is not None
+        assert file_info["name"] == "CHANGELOG.md"
+
+    def test_find_root_changelog_file_probes_raw_urls_first(self):
+        responses = {
+            "https://raw.githubusercontent.com/user/repo/HEAD/CHANGELOG.rst": Mock(
+                status_code=200, headers={"ETag": 'W/"abc"'}
+            )
+        }
+        with (
+            patch.object(
+                self.finder.session,
+                "head",
+                side_effect=lambda url, **kwargs: responses.get(url, Mock(status_code=404, headers={})),
+            ) as mock_head,
+            patch.object(self.finder.session, "get") as mock_get,
+        ):
+            file_info = self.finder._find_root_changelog_file("user", "repo")
+        mock_get.assert_not_called()
+        assert [call.args[0].rpartition("/")[2] for call in mock_head.call_args_list] == ["CHANGELOG.md", "CHANGELOG.rst"]
+        assert file_info == {
+            "name": "CHANGELOG.rst",
+            "path": "CHANGELOG.rst",
+            "download_url": "https://raw.githubusercontent.com/user/repo/HEAD/CHANGELOG.rst",
+            "sha": "etag-abc",
+        }
+
+    def test_stand_in_api_lists_root_without_raw_probe(self):
+        finder = ChangelogFinder(api_url="http://stand-in/")
+        response = Mock(status_code=200)
+        response.json.return_value = [{"type": "file", "name": "CHANGELOG.md", "path": "CHANGELOG.md"}]
+        with (
+            patch.object(finder.session, "head") as mock_head,
+            patch.object(finder.session, "get", return_value=response) as mock_get,
+        ):
+            file_info = finder._find_root_changelog_file("user", "repo")
+        mock_head.assert_not_called()
+        assert mock_get.call_args.args[0] == "http://stand-in/repos/user/repo/contents/"
+        assert file_info is not None
+
+    def test_raw_probe_files_follow_changelog_priority(self):
+        priorities = [path.lower() for path in self.finder.changelog_paths]
+        probe_priorities = [priorities.index(name.lower()) for name in RAW_PROBE_FILES]
+        assert probe_priorities == list(range(len(RAW_PROBE_FILES)))
+
+    def test_find_root_changelog_file_falls_back_to_listing(self):
+        response = Mock(status_code=200)
+        response.json.return_value = [{"type": "file", "name": "RELEASE_NOTES.md", "path": "RELEASE_NOTES.md"}]
+        with (
+            patch.object(self.finder.session, "head", return_value=Mock(status_code=404, headers={})),
+            patch.object(self.finder.session, "get", return_value=response),
+        ):
+            file_info = self.finder._find_root_changelog_file("user", "repo")
+        assert file_info is not None
+        assert file_info["name"] == "RELEASE_NOTES.md"
+
+    def test_fetch_all_releases_projection(self):
+        response = Mock(status_code=200)
+        response.json.return_value = [
+            {"tag_name": "v1.2.0", "body": " New ", "published_at": "2024-02-01", "author": {"login": "user"}},
+            {"tag_name": "v1.1.0", "body": "Fixes", "published_at": "2024-01-01", "assets": [{"name": "x"}]},
+            {"tag_name": "v1.0.0", "body": "Initial", "published_at": "2023-12-01"},
+        ]
+        with patch.object(self.finder.session, "get", return_value=response):
+            releases = self.finder._fetch_all_releases("user", "repo", "1.0.0")
+        assert releases == [
+            Release("1.2.0", "New", "2024-02-01"),
+            Release("1.1.0", "Fixes", "2024-01-01"),
+            Release("1.0.0", "", "2023-12-01"),
+        ]
+
+    def test_github_releases_cached(self):
+        releases = [Release("1.1.0", "Fixes", "2024-01-01"), Release("1.0.0", "", "2023-12-01")]
+        with patch.object(self.finder, "_fetch_all_releases", return_value=releases) as mock_fetch:
+            first, _ = self.finder._fetch_from_github_releases("user", "repo", "1.0.0", "1.1.0")
+            second, releases_url = self.finder._fetch_from_github_releases("user", "repo", "1.0.0", "1.1.0")
+        mock_fetch.assert_called_once()
+        assert first == second == [ChangelogEntry(version="1.1.0", content="Fixes", date="2024-01-01")]
+        assert releases_url == "https://github.com/user/repo/releases"
+        cached = self.finder.cache.get_json("github-releases", "user/repo")
+        assert cached["releases"] == [releases[0]]
+        assert cached["oldest"] == "1.0.0"
+
+    def test_github_releases_cache_reused_for_overlapping_ranges(self):
+        releases = [Release("1.2.0", "New", "2024-02-01"), Release("1.1.0", "Fixes", "2024-01-01"), Release("1.0.0", "", None)]
+        with patch.object(self.finder, "_fetch_all_releases", return_value=releases) as mock_fetch:
+            self.finder._fetch_from_github_releases("user", "repo", "1.0.0", "1.2.0")
+            narrower, _ = self.finder._fetch_from_github_releases("user", "repo", "1.1.0", "1.2.0")
+            self.finder._fetch_from_github_releases("user", "repo", "0.9.0", "1.2.0")
+        assert [entry.version for entry in narrower] == ["1.2.0"]
+        assert mock_fetch.call_count == 2
+
+    def test_github_releases_cache_expires(self):
+        releases = [Release("1.1.0", "Fixes", "2024-01-01"), Release("1.0.0", "", None)]
+        with patch.object(self.finder, "_fetch_all_releases", return_value=releases) as mock_fetch:
+            self.finder._fetch_from_github_releases("user", "repo", "1.0.0", "1.1.0")
+            with patch("changelog_checker.research.changelog_finder.time.time", return_value=time.time() + RELEASES_TTL + 1):
+                self.finder._fetch_from_github_releases("user", "repo", "1.0.0", "1.1.0")
+        assert mock_fetch.call_count == 2
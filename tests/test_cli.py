@@ -1,8 +1,14 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
-from changelog_checker.cli import main
+from changelog_checker.cli import create_formatters, main, read_projects, validate_parser_name
 from changelog_checker.models import (
     ChangelogEntry,
     ChangeType,
@@ -10,6 +16,10 @@ from changelog_checker.models import (
     PackageInfo,
     PackageReport,
 )
+from changelog_checker.output import JSONFormatter
+from changelog_checker.serialization import report_to_dict
+from changelog_checker.server_defaults import DEFAULT_MEMORY_ENTRIES
+from changelog_checker.sharding import Shard
 
 
 class TestCLI:
@@ -49,16 +59,17 @@ class TestCLI:
             mock_checker_class.assert_called_once()
             mock_checker.check_dependencies.assert_called_once()
 
-    @patch("changelog_checker.core.UVParser")
+    @patch("changelog_checker.core.create_parser")
     def test_main_with_stdin(self, mock_parser):
         mock_parser_instance = Mock()
         mock_parser.return_value = mock_parser_instance
         mock_parser_instance.validate_output.return_value = True
-        mock_parser_instance.parse.return_value = []
+        mock_parser_instance.iter_parse.return_value = iter([])
         input_data = "- requests==2.28.0\n+ requests==2.29.0\n"
         result = self.runner.invoke(main, input=input_data)
         assert result.exit_code == 0
-        mock_parser_instance.parse.assert_called_once_with(input_data)
+        mock_parser_instance.iter_parse.assert_called_once()
+        assert "".join(mock_parser_instance.iter_parse.call_args.args[0]) == input_data
 
     def test_main_no_input(self):
         result = self.runner.invoke(main)
@@ -79,6 +90,31 @@ class TestCLI:
         formatter = call_args.kwargs["formatter"]
         assert formatter.__class__.__name__ == "HTMLFormatter"
 
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_with_html_dir_output_format(self, mock_checker_class):
+        mock_checker = Mock()
+        mock_checker_class.return_value = mock_checker
+        mock_checker.check_dependencies.return_value = []
+        input_data = "Resolved 1 package in 0.5ms\n"
+        result = self.runner.invoke(main, ["--output-format", "html-dir", "--output-file", "report.html"], input=input_data)
+        assert result.exit_code == 0
+        formatter = mock_checker_class.call_args.kwargs["formatter"]
+        assert formatter.__class__.__name__ == "HTMLDirFormatter"
+        assert formatter.output_dir == Path("report")
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_with_ndjson_output_format_default_file(self, mock_checker_class):
+        mock_checker = Mock()
+        mock_checker_class.return_value = mock_checker
+        mock_checker.check_dependencies.return_value = []
+        input_data = "Resolved 1 package in 0.5ms\n"
+        result = self.runner.invoke(main, ["--output-format", "ndjson"], input=input_data)
+        assert result.exit_code == 0
+        formatter = mock_checker_class.call_args.kwargs["formatter"]
+        assert formatter.__class__.__name__ == "JSONFormatter"
+        assert formatter.ndjson
+        assert formatter.output_file == Path("changelog_report.ndjson")
+
     @patch("changelog_checker.cli.ChangelogChecker")
     def test_main_with_terminal_output_format(self, mock_checker_class):
         mock_checker = Mock()
@@ -107,7 +143,7 @@ class TestCLI:
         formatter = call_args.kwargs["formatter"]
         assert formatter.__class__.__name__ == "RichFormatter"
 
-    @patch("changelog_checker.core.UVParser")
+    @patch("changelog_checker.core.create_parser")
     def test_main_invalid_parser_output(self, mock_parser):
         mock_parser_instance = Mock()
         mock_parser.return_value = mock_parser_instance
@@ -117,7 +153,7 @@ class TestCLI:
         assert result.exit_code != 0
         assert "doesn't appear to be from" in result.output
 
-    @patch("changelog_checker.core.UVParser")
+    @patch("changelog_checker.core.create_parser")
     @patch("changelog_checker.core.PackageFinder")
     @patch("changelog_checker.core.ChangelogFinder")
     @patch("changelog_checker.core.RichFormatter")
@@ -125,7 +161,7 @@ class TestCLI:
         mock_parser_instance = Mock()
         mock_parser.return_value = mock_parser_instance
         mock_parser_instance.validate_output.return_value = True
-        mock_parser_instance.parse.side_effect = Exception("Test error")
+        mock_parser_instance.iter_parse.side_effect = Exception("Test error")
         input_data = "- requests==2.28.0\n+ requests==2.29.0\n"
         result = self.runner.invoke(main, input=input_data)
         assert result.exit_code != 0
@@ -135,3 +171,242 @@ class TestCLI:
         result = self.runner.invoke(main, ["--input-file", "nonexistent.txt"])
         assert result.exit_code != 0
         assert "No such file" in result.output
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_save_results(self, mock_checker_class):
+        mock_checker = Mock()
+        mock_checker_class.return_value = mock_checker
+        mock_checker.check_dependencies.return_value = [
+            PackageReport(
+                dependency_change=DependencyChange(name="new-package", change_type=ChangeType.ADDED, new_version="1.0.0"),
+                package_info=None,
+                changelog_entries=[],
+            )
+        ]
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(main, ["--save-results", "results.json"], input="Resolved 1 package in 0.5ms\n")
+            assert result.exit_code == 0
+            document = json.loads(Path("results.json").read_text(encoding="utf-8"))
+            assert document["reports"][0]["dependency_change"]["name"] == "new-package"
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_render_from_saved_results(self, mock_checker_class):
+        report = PackageReport(
+            dependency_change=DependencyChange(
+                name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0"
+            ),
+            package_info=PackageInfo(name="requests", github_url="https://github.com/user/requests"),
+            changelog_entries=[ChangelogEntry(version="2.29.0", content="Bug fixes")],
+        )
+        with self.runner.isolated_filesystem():
+            Path("results.ndjson").write_text(json.dumps(report_to_dict(report)) + "\n", encoding="utf-8")
+            result = self.runner.invoke(
+                main, ["render", "--from", "results.ndjson", "-f", "html", "-o", "report.html", "--no-cache"]
+            )
+            assert result.exit_code == 0
+            assert "requests" in Path("report.html").read_text(encoding="utf-8")
+        mock_checker_class.assert_not_called()
+
+    def test_render_invalid_results(self):
+        with self.runner.isolated_filesystem():
+            Path("results.json").write_text("not json", encoding="utf-8")
+            result = self.runner.invoke(main, ["render", "--from", "results.json", "--no-cache"])
+            assert result.exit_code == 1
+            assert "Invalid saved results" in result.output
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_with_multiple_output_formats(self, mock_checker_class):
+        mock_checker = Mock()
+        mock_checker_class.return_value = mock_checker
+        mock_checker.check_dependencies.return_value = []
+        input_data = "Resolved 1 package in 0.5ms\n"
+        result = self.runner.invoke(
+            main, ["-f", "terminal", "-f", "html", "-f", "json", "-f", "html", "-o", "report.html"], input=input_data
+        )
+        assert result.exit_code == 0
+        formatter = mock_checker_class.call_args.kwargs["formatter"]
+        assert formatter.__class__.__name__ == "MultiFormatter"
+        assert [f.__class__.__name__ for f in formatter.formatters] == ["RichFormatter", "HTMLFormatter", "JSONFormatter"]
+        assert formatter.formatters[1].output_file == Path("report.html")
+        assert formatter.formatters[2].output_file == Path("report.json")
+        assert formatter.formatters[1].cache is formatter.formatters[0].cache
+
+    def test_main_multiple_output_formats_to_stdout(self):
+        result = self.runner.invoke(main, ["-f", "json", "-f", "ndjson", "-o", "-"], input="Resolved 1 package\n")
+        assert result.exit_code == 2
+        assert "single output format" in result.output
+
+    @patch("changelog_checker.cli.diff_git_range")
+    def test_main_git_range_multiple_output_formats_to_stdout(self, mock_diff_git_range):
+        mock_diff_git_range.return_value = {}
+        result = self.runner.invoke(main, ["--git-range", "main", "-f", "json", "-f", "ndjson", "-o", "-"])
+        assert result.exit_code == 2
+        assert "single output format" in result.output
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_with_lockfile_diff(self, mock_checker_class):
+        mock_checker = Mock()
+        mock_checker_class.return_value = mock_checker
+        mock_checker.check_changes.return_value = []
+        with self.runner.isolated_filesystem():
+            Path("old.lock").write_text('[[package]]\nname = "requests"\nversion = "2.28.0"\n', encoding="utf-8")
+            Path("new.lock").write_text('[[package]]\nname = "requests"\nversion = "2.29.0"\n', encoding="utf-8")
+            result = self.runner.invoke(main, ["--lockfile-diff", "old.lock", "new.lock"])
+        assert result.exit_code == 0
+        mock_checker.check_dependencies.assert_not_called()
+        mock_checker.check_changes.assert_called_once_with(
+            [DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0")]
+        )
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    @patch("changelog_checker.cli.diff_git_range")
+    def test_main_with_git_range(self, mock_diff_git_range, mock_checker_class):
+        backend_change = DependencyChange(name="pytest", change_type=ChangeType.ADDED, new_version="8.0.0")
+        root_change = DependencyChange(name="click", change_type=ChangeType.ADDED, new_version="8.1.0")
+        mock_diff_git_range.return_value = {"backend/uv.lock": [backend_change], "uv.lock": [root_change]}
+        mock_checker_class.return_value.check_changes.side_effect = lambda changes: [
+            PackageReport(dependency_change=change, package_info=None, changelog_entries=[]) for change in changes
+        ]
+        with (
+            self.runner.isolated_filesystem(),
+            patch("changelog_checker.cli.create_formatters", wraps=create_formatters) as mock_create_formatters,
+        ):
+            result = self.runner.invoke(main, ["--git-range", "main..HEAD", "-f", "json", "-o", "report.json"])
+            assert result.exit_code == 0
+            mock_diff_git_range.assert_called_once_with("main..HEAD")
+            assert [call.args[1] for call in mock_create_formatters.call_args_list] == [
+                "report-backend-uv-lock.json",
+                "report-uv-lock.json",
+            ]
+            backend_document = json.loads(Path("report-backend-uv-lock.json").read_text(encoding="utf-8"))
+            root_document = json.loads(Path("report-uv-lock.json").read_text(encoding="utf-8"))
+        assert [report["dependency_change"]["name"] for report in backend_document["reports"]] == ["pytest"]
+        assert [report["dependency_change"]["name"] for report in root_document["reports"]] == ["click"]
+
+    @patch("changelog_checker.cli.diff_git_range")
+    def test_main_with_git_range_without_changes(self, mock_diff_git_range):
+        mock_diff_git_range.return_value = {}
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(main, ["--git-range", "main", "-f", "ndjson"])
+            assert result.exit_code == 0
+            assert Path("changelog_report.ndjson").read_text(encoding="utf-8") == ""
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_with_pip_report_installed_file(self, mock_checker_class):
+        mock_checker = Mock()
+        mock_checker_class.return_value = mock_checker
+        mock_checker.check_dependencies.return_value = []
+        with self.runner.isolated_filesystem():
+            Path("installed.txt").write_text("requests==2.31.0\n", encoding="utf-8")
+            result = self.runner.invoke(
+                main, ["-p", "pip-report", "--installed-file", "installed.txt"], input='{"version": "1", "install": []}'
+            )
+        assert result.exit_code == 0
+        parser = mock_checker.check_dependencies.call_args.args[1]
+        assert parser.__class__.__name__ == "PipReportParser"
+        assert parser.installed_versions == {"requests": "2.31.0"}
+
+    @patch("changelog_checker.cli.get_parser_names")
+    def test_validate_parser_name_only_looks_up_plugins_for_other_names(self, mock_get_parser_names):
+        mock_get_parser_names.return_value = ["uv", "pip", "pip-report", "conda"]
+        assert validate_parser_name(Mock(), Mock(), "pip-report") == "pip-report"
+        assert validate_parser_name(Mock(), Mock(), "auto") == "auto"
+        mock_get_parser_names.assert_not_called()
+        assert validate_parser_name(Mock(), Mock(), "conda") == "conda"
+        with pytest.raises(click.BadParameter, match="'npm' is not one of uv, pip, pip-report, conda, auto"):
+            validate_parser_name(Mock(), Mock(), "npm")
+
+    def test_parsers_imported_when_used(self):
+        code = (
+            "import sys, changelog_checker.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('changelog_checker.parsers.') and m.endswith('_parser')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "['changelog_checker.parsers.requirements_parser']"
+
+    def test_server_imported_when_serving(self):
+        code = "import sys, changelog_checker.cli; print('changelog_checker.server' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    @patch("changelog_checker.cli.ChangelogChecker.check_changes")
+    def test_batch(self, mock_check_changes):
+        mock_check_changes.side_effect = lambda changes: [
+            PackageReport(dependency_change=change, package_info=None, changelog_entries=[]) for change in changes
+        ]
+        with self.runner.isolated_filesystem():
+            Path("a.txt").write_text("Resolved 2 packages\n - requests==2.31.0\n + requests==2.32.3\n", encoding="utf-8")
+            Path("b.txt").write_text("Resolved 2 packages\n - requests==2.30.0\n + requests==2.32.3\n", encoding="utf-8")
+            result = self.runner.invoke(main, ["batch", "a.txt", "b.txt", "-f", "json", "-o", "report.json", "--no-cache"])
+            assert result.exit_code == 0, result.output
+            a_document = json.loads(Path("report-a-txt.json").read_text(encoding="utf-8"))
+            b_document = json.loads(Path("report-b-txt.json").read_text(encoding="utf-8"))
+        mock_check_changes.assert_called_once_with(
+            [DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.30.0", new_version="2.32.3")]
+        )
+        assert a_document["reports"][0]["dependency_change"]["old_version"] == "2.31.0"
+        assert b_document["reports"][0]["dependency_change"]["old_version"] == "2.30.0"
+
+    @patch("changelog_checker.cli.diff_git_range")
+    def test_read_projects_keeps_input_files_named_like_lockfiles(self, mock_diff_git_range):
+        input_change = DependencyChange(name="requests", change_type=ChangeType.ADDED, new_version="2.32.3")
+        git_change = DependencyChange(name="anyio", change_type=ChangeType.ADDED, new_version="4.4.0")
+        mock_diff_git_range.return_value = {"uv.lock": [git_change], "docs/uv.lock": [git_change]}
+        checker = Mock()
+        checker.parse_changes.return_value = [input_change]
+        with self.runner.isolated_filesystem():
+            Path("uv.lock").write_text("Resolved 1 package\n + requests==2.32.3\n", encoding="utf-8")
+            projects = read_projects(checker, [Path("uv.lock")], "auto", "main..HEAD")
+        assert projects == {"uv.lock": [input_change], "main..HEAD:uv.lock": [git_change], "docs/uv.lock": [git_change]}
+
+    def test_batch_without_inputs(self):
+        result = self.runner.invoke(main, ["batch"])
+        assert result.exit_code != 0
+        assert "Give input files or --git-range" in result.output
+
+    @patch("changelog_checker.cli.ChangelogChecker")
+    def test_main_with_shard(self, mock_checker_class):
+        mock_checker_class.return_value.check_dependencies.return_value = []
+        with self.runner.isolated_filesystem():
+            Path("input.txt").write_text("Resolved 1 package\n + new==1.0\n", encoding="utf-8")
+            result = self.runner.invoke(main, ["--shard", "2/3", "-i", "input.txt", "-f", "json"])
+        assert result.exit_code == 0
+        assert mock_checker_class.call_args.kwargs["shard"] == Shard(2, 3)
+
+    def test_main_with_invalid_shard(self):
+        result = self.runner.invoke(main, ["--shard", "4/3"])
+        assert result.exit_code != 0
+        assert "i must be between 1 and n" in result.output
+
+    def test_merge(self):
+        reports = [
+            PackageReport(
+                dependency_change=DependencyChange(name=name, change_type=ChangeType.ADDED, new_version="1.0"),
+                package_info=None,
+                changelog_entries=[],
+            )
+            for name in ("requests", "click")
+        ]
+        with self.runner.isolated_filesystem():
+            JSONFormatter(output_file="shard-1.json").display_results(reports[:1])
+            JSONFormatter(output_file="shard-2.ndjson", ndjson=True).display_results(reports[1:])
+            result = self.runner.invoke(main, ["merge", "shard-1.json", "shard-2.ndjson", "-f", "json", "-o", "report.json"])
+            assert result.exit_code == 0, result.output
+            document = json.loads(Path("report.json").read_text(encoding="utf-8"))
+        assert [report["dependency_change"]["name"] for report in document["reports"]] == ["requests", "click"]
+
+    @patch("changelog_checker.server.ChangelogServer")
+    def test_serve(self, mock_server_class):
+        mock_server = mock_server_class.return_value
+        mock_server.server_address = ("127.0.0.1", 8123)
+        result = self.runner.invoke(
+            main, ["serve", "--port", "8123", "--no-cache", "--pypi-url", "http://localhost:9000", "--report-ttl", "60"]
+        )
+        assert result.exit_code == 0, result.output
+        service, host, port = mock_server_class.call_args.args
+        assert (host, port) == ("127.0.0.1", 8123)
+        assert service.pypi_url == "http://localhost:9000"
+        assert service.reports.ttl == 60
+        assert service.cache.max_memory_entries == DEFAULT_MEMORY_ENTRIES
+        mock_server.serve_forever.assert_called_once()
+        assert "Serving changelog checks on http://127.0.0.1:8123" in result.output
@@ -0,0 +1,91 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from changelog_checker.core import VALIDATE_HEAD_LINES, ChangelogChecker
+from changelog_checker.models import ChangeType, DependencyChange, PackageReport
+from changelog_checker.parsers import BaseParser, UVParser
+from changelog_checker.sharding import Shard
+from changelog_checker.utils import ParserError
+
+
+class TestChangelogChecker:
+    def setup_method(self):
+        self.formatter = Mock()
+        self.checker = ChangelogChecker(formatter=self.formatter)
+
+    def _generate_report(self, change):
+        return PackageReport(dependency_change=change, package_info=None, changelog_entries=[])
+
+    def test_check_dependencies_streams_lines(self):
+        read_lines = []
+        processed_while_reading = []
+
+        def lines():
+            for line in ["Resolved 3 packages in 1ms\n", " - requests==2.28.0\n", " + requests==2.29.0\n", " + new==1.0\n"]:
+                read_lines.append(line)
+                yield line
+
+        def generate_report(change):
+            processed_while_reading.append((change.name, len(read_lines)))
+            return self._generate_report(change)
+
+        with patch.object(self.checker, "_generate_package_report", side_effect=generate_report):
+            reports = self.checker.check_dependencies(lines())
+        assert [report.dependency_change.name for report in reports] == ["requests", "new"]
+        assert processed_while_reading == [("requests", 3), ("new", 4)]
+        assert self.checker.stats.snapshot().total == 2
+        self.formatter.display_progress.assert_any_call("Processing requests (1/?)...")
+
+    def test_check_dependencies_stream_validated(self):
+        lines = ["not package manager output\n"] * (VALIDATE_HEAD_LINES + 1)
+        with pytest.raises(ParserError, match="doesn't appear to be from uv"):
+            self.checker.check_dependencies(iter(lines))
+
+    def test_stream_head_validated_when_lines_double(self):
+        lines = ["building\n"] * 4 + ["Resolved 1 package\n", " + new==1.0\n"]
+        parser = UVParser()
+        with patch.object(parser, "validate_output", wraps=parser.validate_output) as validate_output:
+            head = self.checker._read_validated_head(parser, iter(lines))
+        assert [len(call.args[0].splitlines()) for call in validate_output.call_args_list] == [1, 2, 4, 6]
+        assert head == lines
+
+    def test_check_dependencies_text(self):
+        with patch.object(self.checker, "_generate_package_report", side_effect=self._generate_report):
+            reports = self.checker.check_dependencies("Resolved 1 package\n + new==1.0\n")
+        assert [report.dependency_change.name for report in reports] == ["new"]
+        self.formatter.display_progress.assert_any_call("Processing new (1/1)...")
+
+    def test_unsupported_parser_type(self):
+        with pytest.raises(ParserError, match="Unsupported parser type"):
+            self.checker.check_dependencies("output", "npm")
+
+    def test_check_dependencies_auto_detects_parser(self):
+        lines = ["Package Version Latest Type\n", "------- ------- ------ -----\n", "requests 2.28.0 2.29.0 wheel\n"]
+        with patch.object(self.checker, "_generate_package_report", side_effect=self._generate_report):
+            reports = self.checker.check_dependencies(iter(lines), "auto")
+            text_reports = self.checker.check_dependencies("".join(lines), "auto")
+        assert [report.dependency_change.old_version for report in reports] == ["2.28.0"]
+        assert [report.dependency_change.old_version for report in text_reports] == ["2.28.0"]
+
+    def test_parser_instance(self):
+        parser = Mock(spec=BaseParser)
+        parser.validate_output.return_value = True
+        parser.parse.return_value = []
+        assert self.checker.check_dependencies("output", parser) == []
+        parser.parse.assert_called_once_with("output")
+
+    def test_check_changes_with_shard(self):
+        changes = [DependencyChange(name=f"package{i}", change_type=ChangeType.ADDED, new_version="1.0") for i in range(20)]
+        shard_reports = []
+        for index in (1, 2):
+            checker = ChangelogChecker(formatter=Mock(), shard=Shard(index, 2))
+            with patch.object(checker, "_generate_package_report", side_effect=self._generate_report):
+                shard_reports.append(checker.check_changes(changes))
+                streamed_reports = checker.check_changes(iter(changes))
+            assert [report.dependency_change for report in streamed_reports] == [
+                report.dependency_change for report in shard_reports[-1]
+            ]
+        names = [report.dependency_change.name for reports in shard_reports for report in reports]
+        assert sorted(names) == sorted(change.name for change in changes)
+        assert all(shard_reports)
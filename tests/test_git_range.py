@@ -0,0 +1,92 @@
+import subprocess
+
+import pytest
+
+from changelog_checker.git_range import diff_git_range, get_lockfile_parser, parse_git_range
+from changelog_checker.models import ChangeType, DependencyChange
+from changelog_checker.parsers import PoetryLockParser, RequirementsParser, UVLockParser
+from changelog_checker.utils import GitError
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(repo, files, message):
+    for path, content in files.items():
+        file_path = repo / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+def _uv_lock(version):
+    return f'version = 1\n\n[[package]]\nname = "requests"\nversion = "{version}"\n'
+
+
+class TestGitRange:
+    @pytest.fixture
+    def repo(self, tmp_path):
+        _git(tmp_path, "init", "-q", "-b", "main")
+        _commit(
+            tmp_path,
+            {
+                "uv.lock": _uv_lock("2.28.0"),
+                "backend/requirements-dev.txt": "pytest==7.0.0\n",
+                "docs/requirements.in": "sphinx\n",
+                "README.md": "readme\n",
+            },
+            "initial",
+        )
+        _git(tmp_path, "checkout", "-q", "-b", "feature")
+        _commit(
+            tmp_path,
+            {
+                "uv.lock": _uv_lock("2.29.0"),
+                "backend/requirements-dev.txt": "pytest==8.0.0\n",
+                "poetry.lock": '[[package]]\nname = "click"\nversion = "8.1.0"\n',
+                "README.md": "changed\n",
+            },
+            "update",
+        )
+        return tmp_path
+
+    def test_get_lockfile_parser(self):
+        assert isinstance(get_lockfile_parser("uv.lock"), UVLockParser)
+        assert isinstance(get_lockfile_parser("app/poetry.lock"), PoetryLockParser)
+        assert isinstance(get_lockfile_parser("requirements/requirements-dev.txt"), RequirementsParser)
+        assert get_lockfile_parser("requirements.in") is None
+        assert get_lockfile_parser("notes.txt") is None
+
+    def test_parse_git_range(self, repo):
+        assert parse_git_range("main..feature") == ("main", "feature")
+        assert parse_git_range("main..") == ("main", "HEAD")
+        assert parse_git_range("main") == ("main", "HEAD")
+        merge_base = subprocess.run(
+            ["git", "rev-parse", "main"], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+        assert parse_git_range("main...feature", cwd=str(repo)) == (merge_base, "feature")
+
+    def test_diff_git_range(self, repo):
+        assert diff_git_range("main..feature", cwd=str(repo)) == {
+            "backend/requirements-dev.txt": [
+                DependencyChange(name="pytest", change_type=ChangeType.UPDATED, old_version="7.0.0", new_version="8.0.0")
+            ],
+            "poetry.lock": [DependencyChange(name="click", change_type=ChangeType.ADDED, new_version="8.1.0")],
+            "uv.lock": [
+                DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0")
+            ],
+        }
+
+    def test_diff_git_range_without_changes(self, repo):
+        assert diff_git_range("feature..feature", cwd=str(repo)) == {}
+
+    def test_unknown_revision(self, repo):
+        with pytest.raises(GitError, match="failed"):
+            diff_git_range("missing..feature", cwd=str(repo))
@@ -0,0 +1,70 @@
+import json
+from unittest.mock import patch
+
+from changelog_checker.models import ChangelogEntry
+from changelog_checker.output.html_dir_formatter import HTMLDirFormatter
+
+
+class TestHTMLDirFormatter:
+    def test_writes_index_and_package_pages(self, make_report, tmp_path):
+        formatter = HTMLDirFormatter(output_dir=str(tmp_path / "report"))
+        report = make_report("Foo.Bar", [ChangelogEntry(version="2.0.0", content="- Fixed bug")])
+        missing = make_report("no-changelog", [])
+        formatter.display_results([report, missing])
+        index = (tmp_path / "report" / "index.html").read_text()
+        page = (tmp_path / "report" / "packages" / "foo-bar.html").read_text()
+        assert 'href="packages/foo-bar.html"' in index
+        assert "View changelog (1 version)" in index
+        assert "Fixed bug" not in index
+        assert "Missing Changelogs" in index
+        assert "Fixed bug" in page
+        assert "1.0.0 → 2.0.0" in page
+        assert 'href="../index.html"' in page
+        assert not (tmp_path / "report" / "packages" / "no-changelog.html").exists()
+
+    def test_unchanged_pages_not_rewritten(self, make_report, tmp_path):
+        output_dir = tmp_path / "report"
+        foo = make_report("foo", [ChangelogEntry(version="2.0.0", content="- Fixed bug")])
+        bar = make_report("bar", [ChangelogEntry(version="2.0.0", content="- Old note")])
+        HTMLDirFormatter(output_dir=str(output_dir)).display_results([foo, bar])
+        bar_updated = make_report("bar", [ChangelogEntry(version="2.0.0", content="- New note")])
+        formatter = HTMLDirFormatter(output_dir=str(output_dir))
+        with patch.object(formatter, "_write_changelog_entries", wraps=formatter._write_changelog_entries) as mock_write:
+            formatter.display_results([foo, bar_updated])
+        assert [call.args[1] for call in mock_write.call_args_list] == [bar_updated]
+        assert "New note" in (output_dir / "packages" / "bar.html").read_text()
+        assert "Fixed bug" in (output_dir / "packages" / "foo.html").read_text()
+
+    def test_stale_pages_removed(self, make_report, tmp_path):
+        output_dir = tmp_path / "report"
+        foo = make_report("foo", [ChangelogEntry(version="2.0.0", content="- Fixed bug")])
+        bar = make_report("bar", [ChangelogEntry(version="2.0.0", content="- Note")])
+        HTMLDirFormatter(output_dir=str(output_dir)).display_results([foo, bar])
+        HTMLDirFormatter(output_dir=str(output_dir)).display_results([foo])
+        assert (output_dir / "packages" / "foo.html").exists()
+        assert not (output_dir / "packages" / "bar.html").exists()
+        manifest = json.loads((output_dir / "manifest.json").read_text())
+        assert list(manifest["pages"]) == ["foo.html"]
+
+    def test_corrupted_manifest_ignored(self, make_report, tmp_path):
+        output_dir = tmp_path / "report"
+        output_dir.mkdir()
+        (output_dir / "manifest.json").write_text("not json")
+        foo = make_report("foo", [ChangelogEntry(version="2.0.0", content="- Fixed bug")])
+        HTMLDirFormatter(output_dir=str(output_dir)).display_results([foo])
+        assert "Fixed bug" in (output_dir / "packages" / "foo.html").read_text()
+
+    def test_several_changes_of_one_package(self, make_report, tmp_path):
+        output_dir = tmp_path / "report"
+        first = make_report(
+            "numpy", [ChangelogEntry(version="1.26.4", content="- First line")], old_version="1.26.0", new_version="1.26.4"
+        )
+        second = make_report(
+            "numpy", [ChangelogEntry(version="2.0.0", content="- Second line")], old_version="1.25.0", new_version="2.0.0"
+        )
+        HTMLDirFormatter(output_dir=str(output_dir)).display_results([first, second])
+        index = (output_dir / "index.html").read_text()
+        assert 'href="packages/numpy.html"' in index
+        assert 'href="packages/numpy-1.25.0-2.0.0.html"' in index
+        assert "First line" in (output_dir / "packages" / "numpy.html").read_text()
+        assert "Second line" in (output_dir / "packages" / "numpy-1.25.0-2.0.0.html").read_text()
@@ -1,7 +1,13 @@
+import base64
+import re
 import tempfile
+import zlib
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from changelog_checker.cache import Cache
 from changelog_checker.models import (
     ChangelogEntry,
     ChangeType,
@@ -9,7 +15,7 @@ from changelog_checker.models import (
     PackageInfo,
     PackageReport,
 )
-from changelog_checker.output.html_formatter import HTMLFormatter
+from changelog_checker.output.html_formatter import RENDER_CACHE_NAMESPACE, HTMLFormatter
 from changelog_checker.utils import get_packages_with_missing_changelogs
 
 
@@ -104,7 +110,7 @@ class TestHTMLFormatter:
     def test_format_changelog_content_html_markdown(self):
         markdown_content = "# Header\n- List item"
         with patch("changelog_checker.output.html_formatter.markdown", create=True) as mock_md:
-            mock_md.markdown.return_value = "<h1>Header</h1><ul><li>List item</li></ul>"
+            mock_md.Markdown.return_value.convert.return_value = "<h1>Header</h1><ul><li>List item</li></ul>"
             result = self.formatter._format_changelog_content_html(markdown_content)
             assert result == "<h1>Header</h1><ul><li>List item</li></ul>"
 
@@ -131,10 +137,13 @@ Header
             patch("changelog_checker.output.html_formatter.HAS_MARKDOWN_SUPPORT", True),
             patch("changelog_checker.output.html_formatter.markdown", create=True) as mock_md,
         ):
-            mock_md.markdown.side_effect = Exception("Rendering error")
+            mock_md.Markdown.return_value.convert.side_effect = Exception("Rendering error")
             result = self.formatter._format_changelog_content_html(markdown_content)
             assert "<h1>Header</h1>" in result
             assert "<li>List item</li>" in result
+        cache_key = self.formatter._get_render_cache_key(markdown_content, "markdown")
+        assert self.formatter.cache.get_bytes(RENDER_CACHE_NAMESPACE, cache_key) is None
+        assert self.formatter.render_fallbacks[0].reason == "rendering failed with Exception"
 
     def test_get_packages_with_missing_changelogs(self):
         change1 = DependencyChange(
@@ -198,7 +207,7 @@ Header
         """Test that markdown links get target='_blank' added."""
         markdown_content = "# Header\nCheck out [this link](https://example.com) for more info."
         with patch("changelog_checker.output.html_formatter.markdown", create=True) as mock_md:
-            mock_md.markdown.return_value = (
+            mock_md.Markdown.return_value.convert.return_value = (
                 '<h1>Header</h1><p>Check out <a href="https://example.com">this link</a> for more info.</p>'
             )
             result = self.formatter._format_changelog_content_html(markdown_content)
@@ -225,3 +234,130 @@ Check out `this link <https://example.com>`__ for more info.
             }
             result = self.formatter._format_changelog_content_html(rst_content)
             assert 'target="_blank"' in result
+
+    @patch("changelog_checker.output.html_formatter.HAS_MARKDOWN_SUPPORT", True)
+    def test_rendered_content_cached(self):
+        markdown_content = "# Header\n- List item"
+        with patch("changelog_checker.output.html_formatter.markdown", create=True) as mock_md:
+            mock_md.Markdown.return_value.convert.return_value = "<h1>Header</h1>"
+            first = self.formatter._format_changelog_content_html(markdown_content, "markdown")
+            second = self.formatter._format_changelog_content_html(markdown_content, "markdown")
+        assert first == second == "<h1>Header</h1>"
+        mock_md.Markdown.assert_called_once()
+        mock_md.Markdown.return_value.convert.assert_called_once_with(markdown_content)
+
+    def test_rendered_content_cached_on_disk(self, tmp_path):
+        content = "- Fixed bug"
+        formatter = HTMLFormatter(output_file=self.temp_file.name, cache=Cache(tmp_path))
+        rendered = formatter._format_changelog_content_html(content, "plain")
+        other_formatter = HTMLFormatter(output_file=self.temp_file.name, cache=Cache(tmp_path))
+        with patch.object(other_formatter, "_format_as_plain_text_html") as mock_render:
+            assert other_formatter._format_changelog_content_html(content, "plain") == rendered
+        mock_render.assert_not_called()
+
+    def test_display_report_writes_progressively(self):
+        change = DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0")
+        info = PackageInfo(name="requests", github_url="https://github.com/user/requests")
+        entries = [ChangelogEntry(version="2.29.0", content="- Fixed bug")]
+        report = PackageReport(dependency_change=change, package_info=info, changelog_entries=entries)
+        Path(self.temp_file.name).write_text("previous report")
+        self.formatter.display_report(report)
+        partial = self.formatter._temp_file.read_text()
+        assert self.formatter._temp_file.parent == Path(self.temp_file.name).parent
+        assert "Updated Packages" in partial
+        assert "Fixed bug" in partial
+        assert "</html>" not in partial
+        assert Path(self.temp_file.name).read_text() == "previous report"
+        temp_file = self.formatter._temp_file
+        self.formatter.display_results([report])
+        content = Path(self.temp_file.name).read_text()
+        assert content.count("Fixed bug") == 1
+        assert content.endswith("</html>")
+        assert not temp_file.exists()
+
+    def test_failed_report_keeps_previous_output(self):
+        Path(self.temp_file.name).write_text("previous report")
+        change = DependencyChange(name="new-package", change_type=ChangeType.ADDED, new_version="1.0.0")
+        self.formatter.display_report(PackageReport(dependency_change=change, package_info=None, changelog_entries=[]))
+        temp_file = self.formatter._temp_file
+        with (
+            patch.object(self.formatter, "_generate_summary_html", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            self.formatter.display_results([])
+        assert Path(self.temp_file.name).read_text() == "previous report"
+        assert not temp_file.exists()
+        assert self.formatter._stream is None
+
+    def test_reports_written_by_display_report_counted(self):
+        changes = [DependencyChange(name=f"pkg{i}", change_type=ChangeType.ADDED, new_version="1.0.0") for i in range(3)]
+        reports = [PackageReport(dependency_change=change, package_info=None, changelog_entries=[]) for change in changes]
+        self.formatter.display_report(reports[0])
+        self.formatter.display_results(reports)
+        content = Path(self.temp_file.name).read_text()
+        assert [content.count(f"pkg{i}") for i in range(3)] == [1, 1, 1]
+
+    def test_summary_written_after_streamed_reports(self):
+        updated = PackageReport(
+            dependency_change=DependencyChange(
+                name="no-changelog", change_type=ChangeType.UPDATED, old_version="1.0.0", new_version="1.1.0"
+            ),
+            package_info=PackageInfo(name="no-changelog"),
+            changelog_entries=[],
+        )
+        added = PackageReport(
+            dependency_change=DependencyChange(name="new-package", change_type=ChangeType.ADDED, new_version="1.0.0"),
+            package_info=None,
+            changelog_entries=[],
+        )
+        for report in (updated, added):
+            self.formatter.display_report(report)
+        partial = Path(self.temp_file.name).read_text()
+        assert "new-package" not in partial
+        assert 'class="section summary"' not in partial
+        self.formatter.display_results([updated, added])
+        content = Path(self.temp_file.name).read_text()
+        assert content.index("Missing Changelogs</h2>") < content.index('class="section summary"')
+        assert '<div class="summary-number">1</div>' in content
+        assert '<div class="summary-number">0</div>' in content
+        assert content.count("new-package") == 1
+
+    def test_display_report_deferred_with_render_workers(self):
+        formatter = HTMLFormatter(output_file=self.temp_file.name, render_workers=2)
+        change = DependencyChange(name="new-package", change_type=ChangeType.ADDED, new_version="1.0.0")
+        report = PackageReport(dependency_change=change, package_info=None, changelog_entries=[])
+        Path(self.temp_file.name).write_text("")
+        formatter.display_report(report)
+        assert Path(self.temp_file.name).read_text() == ""
+        formatter.display_results([report])
+        assert "new-package" in Path(self.temp_file.name).read_text()
+
+    def test_client_render_embeds_compressed_content(self):
+        formatter = HTMLFormatter(output_file=self.temp_file.name, client_render=True)
+        change = DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0")
+        entries = [
+            ChangelogEntry(version="2.29.0", content="# Changes\n- Fixed <bug>"),
+            ChangelogEntry(version="2.28.1", content=""),
+        ]
+        report = PackageReport(dependency_change=change, package_info=PackageInfo(name="requests"), changelog_entries=entries)
+        with patch.object(formatter, "_render_changelog_content") as mock_render:
+            formatter.display_results([report])
+        mock_render.assert_not_called()
+        content = Path(self.temp_file.name).read_text()
+        assert "Fixed <bug>" not in content
+        assert "Show changelog (2 versions)" in content
+        assert "DecompressionStream" in content
+        assert "<script src" not in content
+        assert "innerHTML" not in content
+        match = re.search(r'data-format="markdown" data-content="([^"]+)"', content)
+        assert zlib.decompress(base64.b64decode(match.group(1))).decode() == "# Changes\n- Fixed <bug>"
+
+    def test_client_render_skips_render_pool(self):
+        formatter = HTMLFormatter(output_file=self.temp_file.name, client_render=True, render_workers=4)
+        change = DependencyChange(name="new-package", change_type=ChangeType.ADDED, new_version="1.0.0")
+        report = PackageReport(dependency_change=change, package_info=None, changelog_entries=[])
+        with patch("changelog_checker.output.html_formatter.prerender_changelog_content") as mock_prerender:
+            formatter.display_report(report)
+            formatter.display_results([report])
+        mock_prerender.assert_not_called()
+        assert Path(self.temp_file.name).read_text().count("new-package") == 1
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from changelog_checker.models import ChangelogEntry, ChangeType
+from changelog_checker.output.json_formatter import JSONFormatter
+from changelog_checker.serialization import FORMAT_VERSION, load_reports, report_to_dict
+from changelog_checker.utils import ChangelogCheckerError
+
+
+@pytest.fixture
+def updated_report(make_report):
+    entry = ChangelogEntry(version="2.29.0", content="- Fixed bug ✓", date="2024-01-15")
+    return make_report("requests", [entry], old_version="2.28.0", new_version="2.29.0", duration=0.5, changelog_found=True)
+
+
+@pytest.fixture
+def added_report(make_report):
+    return make_report("new-package", change_type=ChangeType.ADDED, new_version="1.0.0")
+
+
+class TestJSONFormatter:
+    def test_report_to_dict(self, updated_report):
+        assert report_to_dict(updated_report) == {
+            "dependency_change": {
+                "name": "requests",
+                "change_type": "updated",
+                "old_version": "2.28.0",
+                "new_version": "2.29.0",
+            },
+            "package_info": {
+                "name": "requests",
+                "github_url": "https://github.com/user/requests",
+                "pypi_url": None,
+                "changelog_url": None,
+                "changelog_found": True,
+            },
+            "changelog_entries": [
+                {"version": "2.29.0", "date": "2024-01-15", "content_format": "markdown", "content": "- Fixed bug ✓"}
+            ],
+            "error_message": None,
+            "duration": 0.5,
+        }
+
+    def test_json_document(self, updated_report, added_report, tmp_path):
+        output_file = tmp_path / "report.json"
+        formatter = JSONFormatter(output_file=str(output_file))
+        reports = [updated_report, added_report]
+        formatter.display_results(reports)
+        document = json.loads(output_file.read_text(encoding="utf-8"))
+        assert [report["dependency_change"]["name"] for report in document["reports"]] == ["requests", "new-package"]
+        assert document["summary"] == {"updated": 1, "added": 1, "removed": 0, "missing": 0}
+        assert "generated_at" in document
+
+    def test_json_document_empty(self, tmp_path):
+        output_file = tmp_path / "report.json"
+        JSONFormatter(output_file=str(output_file)).display_results([])
+        assert json.loads(output_file.read_text())["reports"] == []
+
+    def test_ndjson_written_per_report(self, updated_report, added_report, tmp_path):
+        output_file = tmp_path / "report.ndjson"
+        formatter = JSONFormatter(output_file=str(output_file), ndjson=True)
+        formatter.display_report(updated_report)
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["dependency_change"]["name"] for line in lines] == ["requests"]
+        formatter.display_results([updated_report, added_report])
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["dependency_change"]["name"] for line in lines] == ["requests", "new-package"]
+        assert all(json.loads(line)["format_version"] == FORMAT_VERSION for line in lines)
+
+    def test_stdout_output(self, added_report, capsys):
+        formatter = JSONFormatter(output_file="-", ndjson=True)
+        formatter.display_progress("Processing requests (1/1)...")
+        formatter.display_results([added_report])
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)["dependency_change"]["name"] == "new-package"
+        assert "Processing requests" in captured.err
+
+
+class TestLoadReports:
+    def test_load_json_document(self, updated_report, added_report, tmp_path):
+        output_file = tmp_path / "report.json"
+        reports = [updated_report, added_report]
+        JSONFormatter(output_file=str(output_file)).display_results(reports)
+        document = json.loads(output_file.read_text(encoding="utf-8"))
+        assert document["format_version"] == FORMAT_VERSION
+        loaded = load_reports(output_file.read_text(encoding="utf-8"))
+        assert [report_to_dict(report) for report in loaded] == [report_to_dict(report) for report in reports]
+
+    def test_load_ndjson(self, updated_report, added_report, tmp_path):
+        output_file = tmp_path / "report.ndjson"
+        reports = [updated_report, added_report]
+        JSONFormatter(output_file=str(output_file), ndjson=True).display_results(reports)
+        loaded = load_reports(output_file.read_text(encoding="utf-8"))
+        assert [report_to_dict(report) for report in loaded] == [report_to_dict(report) for report in reports]
+        assert loaded[0].changelog_entries[0].content_format == "markdown"
+
+    def test_load_single_report(self, added_report):
+        assert load_reports(json.dumps(report_to_dict(added_report))) == [added_report]
+
+    def test_newer_format_version_rejected(self):
+        text = json.dumps({"format_version": FORMAT_VERSION + 1, "reports": []})
+        with pytest.raises(ChangelogCheckerError, match="Unsupported results format version"):
+            load_reports(text)
+
+    def test_newer_ndjson_format_version_rejected(self, updated_report, added_report):
+        lines = [
+            {"format_version": FORMAT_VERSION, **report_to_dict(added_report)},
+            {"format_version": FORMAT_VERSION + 1, **report_to_dict(updated_report)},
+        ]
+        with pytest.raises(ChangelogCheckerError, match="Unsupported results format version"):
+            load_reports("\n".join(json.dumps(line) for line in lines))
+
+    @pytest.mark.parametrize("text", ["not json", '{"reports": [{"package_info": null}]}', "[1, 2]"])
+    def test_invalid_results(self, text):
+        with pytest.raises(ChangelogCheckerError, match="Invalid saved results"):
+            load_reports(text)
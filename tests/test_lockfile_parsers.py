@@ -0,0 +1,77 @@
+from changelog_checker.models import ChangeType, DependencyChange
+from changelog_checker.parsers import PoetryLockParser, RequirementsParser
+
+
+class TestRequirementsParser:
+    def setup_method(self):
+        self.parser = RequirementsParser()
+
+    def test_load_packages(self):
+        content = """
+# This file was autogenerated by uv via the following command:
+#    uv pip compile requirements.in -o requirements.txt
+-r base.txt
+--index-url https://pypi.org/simple
+Django==4.2.0
+    # via -r requirements.in
+requests[socks]==2.28.0 \\
+    --hash=sha256:abc \\
+    --hash=sha256:def
+typing_extensions===4.5.0 ; python_version < "3.11"  # comment
+click>=8.0
+"""
+        packages = self.parser.load_packages(content)
+        assert [(package.name, package.version, package.markers) for package in packages] == [
+            ("django", "4.2.0", ()),
+            ("requests", "2.28.0", ()),
+            ("typing-extensions", "4.5.0", ('python_version < "3.11"',)),
+        ]
+
+    def test_diff(self):
+        assert self.parser.diff("requests==2.28.0\nsix==1.16.0\n", "Requests==2.29.0\ncertifi==2024.2.2\n") == [
+            DependencyChange(name="certifi", change_type=ChangeType.ADDED, new_version="2024.2.2"),
+            DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0"),
+            DependencyChange(name="six", change_type=ChangeType.REMOVED, old_version="1.16.0"),
+        ]
+
+
+class TestPoetryLockParser:
+    def setup_method(self):
+        self.parser = PoetryLockParser()
+
+    def test_get_package_manager_name(self):
+        assert self.parser.get_package_manager_name() == "poetry"
+
+    def test_diff_skips_local_packages(self):
+        old_lock = """
+[[package]]
+name = "Requests"
+version = "2.28.0"
+
+[[package]]
+name = "local-lib"
+version = "0.1.0"
+
+[package.source]
+type = "directory"
+url = "libs/local-lib"
+"""
+        new_lock = """
+[[package]]
+name = "requests"
+version = "2.29.0"
+
+[[package]]
+name = "local-lib"
+version = "0.2.0"
+
+[package.source]
+type = "directory"
+url = "libs/local-lib"
+
+[metadata]
+lock-version = "2.0"
+"""
+        assert self.parser.diff(old_lock, new_lock) == [
+            DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0")
+        ]
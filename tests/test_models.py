@@ -1,5 +1,6 @@
 from changelog_checker.models import (
     ChangelogEntry,
+    ChangelogText,
     ChangeType,
     DependencyChange,
     PackageInfo,
@@ -113,3 +114,24 @@ class TestPackageReport:
         assert report.package_info == package_info
         assert report.changelog_entries == []
         assert report.error_message == "Package not found on PyPI"
+
+
+class TestChangelogText:
+    def test_decoded_on_access(self):
+        buffer = b"## 1.1.0\n- Fix\n-----\n- Feature\n## 1.0.0\n"
+        text = ChangelogText(buffer, [(9, 22)])
+        entry = ChangelogEntry(version="1.1.0", content=text)
+        assert entry._content is text
+        assert entry.content == "- Fix\n- Feature"
+        assert entry._content == "- Fix\n- Feature"
+
+    def test_shared_between_entries(self):
+        text = ChangelogText(memoryview(b"  shared  "), [(0, 10)])
+        first = ChangelogEntry(version="1.1.0", content=text)
+        second = ChangelogEntry(version="1.0.1", content=text)
+        assert first.content == second.content == "shared"
+
+    def test_plain_string_content(self):
+        entry = ChangelogEntry(version="1.0.0", content="Bug fixes")
+        assert entry.content == "Bug fixes"
+        assert entry == ChangelogEntry(version="1.0.0", content="Bug fixes")
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+
+from changelog_checker.models import ChangeType
+from changelog_checker.output import HTMLFormatter, JSONFormatter, MultiFormatter, RichFormatter
+
+
+class TestMultiFormatter:
+    def setup_method(self):
+        self.json_formatter = Mock(spec=JSONFormatter)
+        self.rich_formatter = Mock(spec=RichFormatter)
+        self.formatter = MultiFormatter([self.json_formatter, self.rich_formatter])
+
+    def test_reports_passed_to_every_formatter(self, make_report):
+        report = make_report("new-package", change_type=ChangeType.ADDED, new_version="1.0.0")
+        self.formatter.display_report(report)
+        self.formatter.display_results([report])
+        for formatter in (self.json_formatter, self.rich_formatter):
+            formatter.display_report.assert_called_once_with(report)
+            formatter.display_results.assert_called_once_with([report])
+
+    def test_progress_shown_by_terminal_formatter_only(self):
+        stats = Mock()
+        self.formatter.start_progress(stats)
+        self.formatter.display_progress("Processing new-package (1/1)...")
+        self.formatter.display_error("failed")
+        self.formatter.finish_progress()
+        self.rich_formatter.start_progress.assert_called_once_with(stats)
+        self.rich_formatter.display_progress.assert_called_once_with("Processing new-package (1/1)...")
+        self.rich_formatter.display_error.assert_called_once_with("failed")
+        self.rich_formatter.finish_progress.assert_called_once()
+        self.json_formatter.display_progress.assert_not_called()
+        self.json_formatter.start_progress.assert_not_called()
+
+    def test_progress_formatter_defaults_to_first(self):
+        html_formatter = Mock(spec=HTMLFormatter)
+        formatter = MultiFormatter([html_formatter, self.json_formatter])
+        assert formatter.progress_formatter is html_formatter
+
+    def test_requires_formatters(self):
+        with pytest.raises(ValueError):
+            MultiFormatter([])
+
+    def test_files_written_by_each_formatter(self, make_report, tmp_path):
+        report = make_report("new-package", change_type=ChangeType.ADDED, new_version="1.0.0")
+        formatter = MultiFormatter(
+            [
+                HTMLFormatter(output_file=str(tmp_path / "report.html")),
+                JSONFormatter(output_file=str(tmp_path / "report.json")),
+            ]
+        )
+        formatter.display_report(report)
+        formatter.display_results([report])
+        assert "new-package" in (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert "new-package" in (tmp_path / "report.json").read_text(encoding="utf-8")
@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+import pytest
+
+from changelog_checker.parsers import registry
+from changelog_checker.parsers.pip_parser import PipParser
+from changelog_checker.parsers.pip_report_parser import PipReportParser
+from changelog_checker.parsers.registry import create_parser, detect_parser, get_parser_class, get_parser_names
+from changelog_checker.parsers.uv_parser import UVParser
+from changelog_checker.utils import ParserError
+
+PLUGIN_ENTRY_POINT = EntryPoint(
+    name="poetry-show", value="changelog_checker.parsers.pip_parser:PipParser", group=registry.ENTRY_POINT_GROUP
+)
+
+
+class TestParserRegistry:
+    def setup_method(self):
+        registry._get_plugin_entry_points.cache_clear()
+
+    def teardown_method(self):
+        registry._get_plugin_entry_points.cache_clear()
+
+    def test_builtin_parsers(self):
+        assert get_parser_names()[:3] == ["uv", "pip", "pip-report"]
+        assert get_parser_class("uv") is UVParser
+        assert isinstance(create_parser("pip-report"), PipReportParser)
+
+    def test_unknown_parser(self):
+        with pytest.raises(ParserError, match="Unsupported parser type: npm"):
+            create_parser("npm")
+
+    @patch("changelog_checker.parsers.registry.entry_points")
+    def test_plugin_parsers(self, mock_entry_points):
+        overriding = EntryPoint(name="uv", value="changelog_checker.parsers.pip_parser:PipParser", group="")
+        mock_entry_points.return_value = [PLUGIN_ENTRY_POINT, overriding]
+        assert get_parser_names() == ["uv", "pip", "pip-report", "poetry-show"]
+        assert get_parser_class("poetry-show") is PipParser
+        assert get_parser_class("uv") is UVParser
+        mock_entry_points.assert_called_once_with(group=registry.ENTRY_POINT_GROUP)
+
+    @patch("changelog_checker.parsers.registry.entry_points")
+    def test_plugin_must_be_parser(self, mock_entry_points):
+        mock_entry_points.return_value = [
+            EntryPoint(name="broken", value="changelog_checker.utils:ParserError", group=""),
+            EntryPoint(name="missing", value="changelog_checker.missing:Parser", group=""),
+        ]
+        with pytest.raises(ParserError, match="not a BaseParser subclass"):
+            get_parser_class("broken")
+        with pytest.raises(ParserError, match="Failed to load parser missing"):
+            get_parser_class("missing")
+
+    @pytest.mark.parametrize(
+        ("output", "parser_class"),
+        [
+            ("Resolved 10 packages in 1.2s\n - requests==2.28.0\n + requests==2.29.0\n", UVParser),
+            ("Update anyio v4.3.0 -> v4.4.0\n", UVParser),
+            ("Package Version Latest Type\n------- ------- ------ -----\nrequests 2.28.0 2.29.0 wheel\n", PipParser),
+            (json.dumps({"version": "1", "pip_version": "24.0", "install": []}), PipReportParser),
+        ],
+    )
+    def test_detect_parser(self, output, parser_class):
+        assert type(detect_parser(output)) is parser_class
+
+    def test_detect_parser_unknown_output(self):
+        with pytest.raises(ParserError, match="Could not detect"):
+            detect_parser("npm WARN deprecated\n")
+        with pytest.raises(ParserError, match="Could not detect"):
+            detect_parser("")
+
+    def test_parsers_imported_lazily(self):
+        code = (
+            "import sys, changelog_checker.cli, changelog_checker.parsers as parsers;"
+            "assert 'changelog_checker.parsers.uv_parser' not in sys.modules;"
+            "parsers.UVParser;"
+            "assert 'changelog_checker.parsers.uv_parser' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
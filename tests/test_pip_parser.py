@@ -69,3 +69,11 @@ distlib            0.3.9           0.4.0           wheel
         output = ""
         changes = self.parser.parse(output)
         assert changes == []
+
+    def test_parse_without_separator_line(self):
+        output = """Package            Version         Latest          Type
+requests           2.32.4          2.32.5          wheel
+"""
+        changes = self.parser.parse(output)
+        assert len(changes) == 1
+        assert changes[0].name == "requests"
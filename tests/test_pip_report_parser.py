@@ -0,0 +1,101 @@
+import json
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from changelog_checker.models import ChangeType, DependencyChange
+from changelog_checker.parsers.pip_report_parser import PipReportParser, get_installed_versions, load_installed_versions
+from changelog_checker.utils import ParserError
+
+REPORT = {
+    "version": "1",
+    "pip_version": "24.0",
+    "install": [
+        {
+            "download_info": {"url": "https://files.pythonhosted.org/requests-2.32.0-py3-none-any.whl"},
+            "is_direct": False,
+            "requested": True,
+            "metadata": {"name": "Requests", "version": "2.32.0", "description": "Long description"},
+        },
+        {"metadata": {"name": "charset_normalizer", "version": "3.3.2"}},
+        {"metadata": {"name": "new-package", "version": "1.0.0"}},
+        {"download_info": {}},
+    ],
+    "environment": {"python_version": f"{sys.version_info.major}.{sys.version_info.minor}"},
+}
+
+
+class TestPipReportParser:
+    def setup_method(self):
+        self.parser = PipReportParser({"requests": "2.31.0", "charset-normalizer": "3.3.2"})
+
+    def test_get_package_manager_name(self):
+        assert self.parser.get_package_manager_name() == "pip"
+
+    def test_validate_output(self):
+        assert self.parser.validate_output(json.dumps(REPORT, indent=2))
+        assert not self.parser.validate_output("Package Version Latest Type")
+        assert not self.parser.validate_output('{"reports": []}')
+
+    def test_parse(self):
+        assert self.parser.parse(json.dumps(REPORT, indent=2)) == [
+            DependencyChange(name="Requests", change_type=ChangeType.UPDATED, old_version="2.31.0", new_version="2.32.0"),
+            DependencyChange(name="new-package", change_type=ChangeType.ADDED, new_version="1.0.0"),
+        ]
+
+    def test_parse_compact_report(self):
+        assert len(self.parser.parse(json.dumps(REPORT, separators=(",", ":")))) == 2
+
+    def test_parse_empty_install(self):
+        assert self.parser.parse('{"version": "1", "install": []}') == []
+
+    def test_unsupported_version(self):
+        with pytest.raises(ParserError, match="Unsupported pip installation report version"):
+            self.parser.parse('{"version": "2", "install": []}')
+
+    @pytest.mark.parametrize("output", ["", "[]", '{"install": [{"metadata": {}}', '{"install": {"a": 1}}'])
+    def test_invalid_report(self, output):
+        with pytest.raises(ParserError, match="Invalid pip installation report"):
+            self.parser.parse(output)
+
+    @patch.dict("os.environ", clear=True)
+    @patch("changelog_checker.parsers.pip_report_parser.distributions")
+    def test_defaults_to_installed_packages(self, mock_distributions):
+        mock_distributions.return_value = [Mock(metadata={"Name": "Requests"}, version="2.31.0")]
+        assert get_installed_versions() == {"requests": "2.31.0"}
+        changes = PipReportParser().parse(json.dumps(REPORT))
+        assert changes[0].old_version == "2.31.0"
+
+    @patch.dict("os.environ", clear=True)
+    @patch("changelog_checker.parsers.pip_report_parser.distributions")
+    def test_report_of_another_environment(self, mock_distributions):
+        report = {**REPORT, "environment": {"python_version": "2.7", "sys_platform": sys.platform}}
+        with pytest.raises(ParserError, match="python_version 2.7 instead of .*--installed-file"):
+            PipReportParser().parse(json.dumps(report))
+        mock_distributions.assert_not_called()
+
+    @patch("changelog_checker.parsers.pip_report_parser.distributions")
+    def test_reads_active_virtual_environment(self, mock_distributions, tmp_path):
+        site_packages = tmp_path / "lib" / "python3.12" / "site-packages"
+        site_packages.mkdir(parents=True)
+        mock_distributions.return_value = [Mock(metadata={"Name": "requests"}, version="2.30.0")]
+        report = {**REPORT, "environment": {"python_version": "3.12"}}
+        with patch.dict("os.environ", {"VIRTUAL_ENV": str(tmp_path)}):
+            changes = PipReportParser().parse(json.dumps(report))
+        mock_distributions.assert_called_once_with(path=[str(site_packages)])
+        assert changes[0].old_version == "2.30.0"
+
+
+class TestLoadInstalledVersions:
+    def test_pip_list_json(self):
+        content = json.dumps([{"name": "Requests", "version": "2.31.0"}, {"name": "typing_extensions", "version": "4.5.0"}])
+        assert load_installed_versions(content) == {"requests": "2.31.0", "typing-extensions": "4.5.0"}
+
+    def test_pip_freeze(self):
+        content = "# comment\nRequests==2.31.0\n-e git+https://github.com/user/project#egg=project\nsix==1.16.0\n"
+        assert load_installed_versions(content) == {"requests": "2.31.0", "six": "1.16.0"}
+
+    def test_invalid_json(self):
+        with pytest.raises(ParserError):
+            load_installed_versions('[{"name": "requests"}]')
@@ -0,0 +1,134 @@
+import io
+import signal
+import time
+from unittest.mock import patch
+
+from rich.console import Console
+
+from changelog_checker.output.html_formatter import RENDER_CACHE_NAMESPACE, HTMLFormatter
+from changelog_checker.output.rendering import (
+    RENDER_MAX_CHARS,
+    RenderBudget,
+    RenderFallback,
+    RenderResult,
+    describe_render_fallbacks,
+    prerender_changelog_content,
+    render_in_processes,
+)
+from changelog_checker.output.rich_formatter import RichFormatter
+
+
+class TestRendering:
+    def setup_method(self):
+        self.formatter = HTMLFormatter(render_workers=2)
+
+    def test_render_in_processes_matches_serial(self):
+        items = [("# Header\n- item", "markdown"), ("Plain text", "plain"), ("- **bold**", "markdown")]
+        rendered = render_in_processes(HTMLFormatter, items, 2)
+        assert rendered == [self.formatter._render_changelog_content(content, fmt) for content, fmt in items]
+        assert all(result.fallback is None for result in rendered)
+
+    def test_prerender_stores_missing_entries(self, make_report):
+        reports = [make_report("alpha", ["# Alpha\n- one", "", "Plain text"]), make_report("beta", ["# Alpha\n- one"])]
+        with patch(
+            "changelog_checker.output.rendering.render_in_processes",
+            return_value=[RenderResult("<h1>a</h1>"), RenderResult("<p>b</p>")],
+        ) as mock_render:
+            prerender_changelog_content(self.formatter, reports, RENDER_CACHE_NAMESPACE)
+        mock_render.assert_called_once()
+        assert list(mock_render.call_args[0][1]) == [("# Alpha\n- one", "markdown"), ("Plain text", "plain")]
+        assert self.formatter._format_changelog_content_html("# Alpha\n- one") == "<h1>a</h1>"
+        assert self.formatter._format_changelog_content_html("Plain text") == "<p>b</p>"
+
+    def test_prerender_skips_cached_entries(self, make_report):
+        self.formatter._format_changelog_content_html("# Alpha\n- one")
+        self.formatter._format_changelog_content_html("Plain text")
+        reports = [make_report("alpha", ["# Alpha\n- one", "Plain text"])]
+        with patch("changelog_checker.output.rendering.render_in_processes") as mock_render:
+            prerender_changelog_content(self.formatter, reports, RENDER_CACHE_NAMESPACE)
+        mock_render.assert_not_called()
+
+    def test_prerender_does_not_cache_fallbacks(self, make_report):
+        fallback = RenderFallback(content_format="markdown", size=14, reason="rendering took longer than 2.0s")
+        reports = [make_report("alpha", ["# Alpha\n- one", "# Beta\n- two"])]
+        with patch(
+            "changelog_checker.output.rendering.render_in_processes",
+            return_value=[RenderResult("<p>a</p>", fallback), RenderResult("<h1>b</h1>")],
+        ):
+            uncached = prerender_changelog_content(self.formatter, reports, RENDER_CACHE_NAMESPACE)
+        key = self.formatter._get_render_cache_key("# Alpha\n- one", "markdown")
+        assert uncached == {key: "<p>a</p>"}
+        assert self.formatter.cache.get_bytes(RENDER_CACHE_NAMESPACE, key) is None
+        assert self.formatter.render_fallbacks == [fallback]
+
+    def test_fallback_not_cached_and_shown_in_summary(self, make_report, tmp_path):
+        formatter = HTMLFormatter(output_file=str(tmp_path / "report.html"))
+        content = "# Header\n- item\n- item"
+        with patch("changelog_checker.output.rendering.RENDER_MAX_CHARS", 10):
+            formatter.display_results([make_report("alpha", [content])])
+        key = formatter._get_render_cache_key(content, "markdown")
+        assert formatter.cache.get_bytes(RENDER_CACHE_NAMESPACE, key) is None
+        assert "1 changelog entry was shown as plain text" in (tmp_path / "report.html").read_text()
+        assert formatter.render_fallbacks == []
+
+    def test_rich_fallback_shown_after_results(self, make_report):
+        console = Console(file=io.StringIO(), width=80)
+        formatter = RichFormatter(console=console)
+        with patch("changelog_checker.output.rendering.RENDER_MAX_CHARS", 10):
+            formatter.display_results([make_report("alpha", ["# Header\n- item\n- item"])])
+        assert "1 changelog entry was shown as plain text" in console.file.getvalue()
+
+    def test_display_results_serial_without_workers(self, make_report, tmp_path):
+        formatter = HTMLFormatter(output_file=str(tmp_path / "report.html"))
+        reports = [make_report("alpha", ["# Alpha\n- one", "Plain text"])]
+        with patch("changelog_checker.output.html_formatter.prerender_changelog_content") as mock_prerender:
+            formatter.display_results(reports)
+        mock_prerender.assert_not_called()
+        assert (tmp_path / "report.html").exists()
+
+    def test_render_falls_back_when_too_large(self):
+        content = "# Header\n" + "- item\n" * RENDER_MAX_CHARS
+        with patch.object(self.formatter, "_format_as_markdown_html") as mock_markdown:
+            result = self.formatter._render_changelog_content(content, "markdown")
+        mock_markdown.assert_not_called()
+        assert result.rendered.startswith("<h1>Header</h1>")
+        assert result.fallback.content_format == "markdown"
+
+    def test_render_falls_back_when_too_slow(self):
+        formatter = RichFormatter(render_timeout=0.05)
+
+        def slow_render(content, content_format):
+            time.sleep(5)
+            return "rendered"
+
+        with patch.object(formatter, "_build_changelog_renderable", side_effect=slow_render):
+            started = time.monotonic()
+            result = formatter._render_changelog_content("# Header\n- item", "markdown")
+        assert time.monotonic() - started < 2
+        assert result == RenderResult(
+            "# Header\n  - item",
+            RenderFallback(content_format="markdown", size=15, reason="rendering took longer than 0.05s"),
+        )
+
+    def test_render_fallback_recorded_when_renderer_swallows_timeout(self):
+        formatter = HTMLFormatter(render_timeout=0.05)
+        with patch("changelog_checker.output.html_formatter.publish_parts", side_effect=lambda *a, **k: time.sleep(5)):
+            result = formatter._render_changelog_content("Title\n=====\n\ntext", "rst")
+        assert "<p>text</p>" in result.rendered
+        assert result.fallback is not None
+
+    def test_describe_render_fallbacks(self):
+        fallbacks = [
+            RenderFallback(content_format="markdown", size=10, reason="slow"),
+            RenderFallback(content_format="rst", size=20, reason="slow"),
+            RenderFallback(content_format="rst", size=30, reason="large"),
+        ]
+        assert describe_render_fallbacks([]) == ""
+        assert describe_render_fallbacks(fallbacks) == "3 changelog entries were shown as plain text: slow (2), large (1)"
+
+    def test_render_budget_not_triggered_for_fast_render(self):
+        with RenderBudget(1.0) as budget:
+            pass
+        time.sleep(0.01)
+        assert not budget.expired
+        assert signal.getsignal(signal.SIGALRM) is signal.SIG_DFL
@@ -1,5 +1,13 @@
-from unittest.mock import Mock, patch
+import io
+import logging
+from unittest.mock import patch
 
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.panel import Panel
+from rich.text import Text
+
+from changelog_checker.cache import Cache
 from changelog_checker.models import (
     ChangelogEntry,
     ChangeType,
@@ -7,8 +15,16 @@ from changelog_checker.models import (
     PackageInfo,
     PackageReport,
 )
-from changelog_checker.output.rich_formatter import RichFormatter
-from changelog_checker.utils import detect_content_format
+from changelog_checker.output.rich_formatter import RENDER_CACHE_NAMESPACE, RichFormatter
+from changelog_checker.stats import RunStats
+from changelog_checker.utils import CONTENT_FORMAT_SAMPLE_LINES, StderrHandler, detect_content_format, get_entry_format
+
+
+def _render_text(renderable):
+    console = Console(width=100)
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
 
 
 class TestRichFormatter:
@@ -87,7 +103,7 @@ Regular text
         ]
 
     @patch("changelog_checker.output.rich_formatter.HAS_RST_SUPPORT", True)
-    def test_format_changelog_content_rst_with_support(self):
+    def test_changelog_renderable_rst_with_support(self):
         rst_content = """
 package v1.2.3 (2024-01-15)
 ---------------------------
@@ -97,17 +113,14 @@ Features
 
 - New feature
 """
-        with patch("changelog_checker.output.rich_formatter.RestructuredText") as mock_rst:
-            mock_rst.return_value = Mock()
-            with patch("changelog_checker.output.rich_formatter.Console") as mock_console:
-                mock_capture = Mock()
-                mock_capture.get.return_value = "Formatted RST content"
-                mock_console.return_value.capture.return_value.__enter__.return_value = mock_capture
-                result = self.formatter._format_changelog_content(rst_content)
-                assert result == "Formatted RST content"
+        with patch("changelog_checker.output.rich_formatter.RestructuredText", create=True) as mock_rst:
+            mock_rst.return_value = Text("Formatted RST content")
+            result = _render_text(self.formatter._get_changelog_renderable(rst_content))
+        assert result.strip() == "Formatted RST content"
+        mock_rst.assert_called_once_with(rst_content, show_errors=False)
 
     @patch("changelog_checker.output.rich_formatter.HAS_RST_SUPPORT", False)
-    def test_format_changelog_content_rst_without_support(self):
+    def test_changelog_renderable_rst_without_support(self):
         rst_content = """
 package v1.2.3 (2024-01-15)
 ---------------------------
@@ -117,10 +130,10 @@ Features
 
 - New feature
 """
-        result = self.formatter._format_changelog_content(rst_content)
+        result = _render_text(self.formatter._get_changelog_renderable(rst_content))
         assert "- New feature" in result
 
-    def test_format_changelog_content_markdown(self):
+    def test_changelog_renderable_markdown(self):
         markdown_content = """
 # Version 1.2.3
 
@@ -129,27 +142,27 @@ Features
 - **Bold feature**
 """
         with patch("changelog_checker.output.rich_formatter.Markdown") as mock_md:
-            mock_md.return_value = Mock()
-            with patch("changelog_checker.output.rich_formatter.Console") as mock_console:
-                mock_capture = Mock()
-                mock_capture.get.return_value = "Formatted markdown content"
-                mock_console.return_value.capture.return_value.__enter__.return_value = mock_capture
-                result = self.formatter._format_changelog_content(markdown_content)
-                assert result == "Formatted markdown content"
-
-    def test_format_changelog_content_empty(self):
-        result = self.formatter._format_changelog_content("")
-        assert result == "[dim]No changelog content found[/dim]"
-        result = self.formatter._format_changelog_content("   \n  \n  ")
-        assert result == "[dim]No changelog content found[/dim]"
-
-    def test_format_changelog_content_fallback_on_error(self):
+            mock_md.return_value = Text("Formatted markdown content")
+            result = _render_text(self.formatter._get_changelog_renderable(markdown_content))
+        assert result.strip() == "Formatted markdown content"
+        mock_md.assert_called_once_with(markdown_content)
+
+    def test_changelog_renderable_empty(self):
+        result = self.formatter._get_changelog_renderable("")
+        assert result == Text("No changelog content found", style="dim")
+        result = self.formatter._get_changelog_renderable("   \n  \n  ")
+        assert result == Text("No changelog content found", style="dim")
+
+    def test_changelog_renderable_fallback_on_error(self):
         markdown_content = "# Header\n- List item"
         with patch("changelog_checker.output.rich_formatter.Markdown") as mock_md:
             mock_md.side_effect = Exception("Rendering error")
-            result = self.formatter._format_changelog_content(markdown_content)
-            assert "[bold]# Header[/bold]" in result
-            assert "  - List item" in result
+            result = self.formatter._render_changelog_content(markdown_content, "markdown")
+            assert result.rendered == "# Header\n  - List item"
+            assert result.fallback is not None
+            assert "- List item" in _render_text(self.formatter._get_changelog_renderable(markdown_content))
+        cache_key = self.formatter._get_render_cache_key(markdown_content, "markdown")
+        assert self.formatter.cache.get_bytes(RENDER_CACHE_NAMESPACE, cache_key) is None
 
     def test_display_results_empty(self):
         with patch.object(self.formatter.console, "print") as mock_print:
@@ -165,9 +178,9 @@ Features
         with patch.object(self.formatter.console, "print") as mock_print:
             self.formatter._display_package_report(report)
             mock_print.assert_called()
-            panel_call = mock_print.call_args_list[0]
+            panel_call = next(call for call in mock_print.call_args_list if call[0] and isinstance(call[0][0], Panel))
             panel = panel_call[0][0]
-            assert "Version 2.29.0" in str(panel.renderable)
+            assert "Version 2.29.0" in _render_text(panel.renderable)
 
     def test_display_package_report_with_changelog_url(self):
         change = DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0")
@@ -181,7 +194,7 @@ Features
         with patch.object(self.formatter.console, "print") as mock_print:
             self.formatter._display_package_report(report)
             mock_print.assert_called()
-            panel_call = mock_print.call_args_list[0]
+            panel_call = next(call for call in mock_print.call_args_list if call[0] and isinstance(call[0][0], Panel))
             panel = panel_call[0][0]
             title = str(panel.title)
             assert "GitHub" in title
@@ -217,7 +230,7 @@ Features
             mock_print.assert_called()
             panel_call = mock_print.call_args_list[0]
             panel = panel_call[0][0]
-            content = str(panel.renderable)
+            content = _render_text(panel.renderable)
             assert "Package removed from dependencies" in content
             assert "Changelog not found" not in content
 
@@ -230,7 +243,7 @@ Features
             mock_print.assert_called()
             panel_call = mock_print.call_args_list[0]
             panel = panel_call[0][0]
-            content = str(panel.renderable)
+            content = _render_text(panel.renderable)
             assert "Package added to dependencies" in content
             assert "Changelog not found" not in content
 
@@ -243,5 +256,83 @@ Features
             mock_print.assert_called()
             panel_call = mock_print.call_args_list[0]
             panel = panel_call[0][0]
-            content = str(panel.renderable)
+            content = _render_text(panel.renderable)
             assert "Changelog not found in repository" in content
+
+    def test_detect_content_format_samples_long_content(self):
+        content = "plain line\n" * CONTENT_FORMAT_SAMPLE_LINES + "# Header\n- item\n"
+        assert detect_content_format(content) == "plain"
+
+    def test_entry_format_detected_once(self):
+        entry = ChangelogEntry(version="1.0.0", content="# Header\n- item")
+        with patch("changelog_checker.utils.detect_content_format", return_value="markdown") as mock_detect:
+            assert get_entry_format(entry) == "markdown"
+            assert get_entry_format(entry) == "markdown"
+        mock_detect.assert_called_once_with("# Header\n- item")
+        assert entry.content_format == "markdown"
+
+    def test_changelog_renderable_uses_console_width(self):
+        self.formatter.console = Console(width=160)
+        content = "- " + " ".join(["word"] * 60)
+        rendered = _render_text(self.formatter._get_changelog_renderable(content, "markdown"))
+        assert max(len(line) for line in rendered.splitlines()) > 80
+        assert max(len(line) for line in rendered.splitlines()) <= 156
+
+    def test_changelog_renderable_rendered_once(self):
+        with patch("changelog_checker.output.rich_formatter.Markdown", wraps=Markdown) as mock_md:
+            renderable = self.formatter._get_changelog_renderable("# Header\n- item", "markdown")
+        mock_md.assert_called_once_with("# Header\n- item")
+        assert "Header" in _render_text(renderable)
+
+    def test_changelog_renderable_cached(self):
+        with patch("changelog_checker.output.rich_formatter.Markdown", wraps=Markdown) as mock_md:
+            first = _render_text(self.formatter._get_changelog_renderable("# Header\n- item", "markdown"))
+            second = _render_text(self.formatter._get_changelog_renderable("# Header\n- item", "markdown"))
+        mock_md.assert_called_once_with("# Header\n- item")
+        assert [line.rstrip() for line in first.splitlines()] == [line.rstrip() for line in second.splitlines()]
+
+    def test_changelog_renderable_escapes_plain_markup(self):
+        renderable = self.formatter._get_changelog_renderable("Fixed [bold] handling [/link]", "plain")
+        assert "Fixed [bold] handling [/link]" in _render_text(renderable)
+
+    def test_progress_printed_as_lines_without_terminal(self):
+        stats = RunStats()
+        self.formatter.start_progress(stats)
+        with patch.object(self.formatter.console, "print") as mock_print:
+            self.formatter.display_progress("Processing requests (1/2)...")
+        self.formatter.finish_progress()
+        assert self.formatter._live is None
+        mock_print.assert_called_once_with("[dim]Processing requests (1/2)...[/dim]")
+
+    def test_progress_dashboard_on_terminal(self):
+        self.formatter.console = Console(force_terminal=True, width=100)
+        stats = RunStats(cache=Cache())
+        stats.start(2)
+        stats.package_completed()
+        stats.request_started("api.github.com")
+        with patch("changelog_checker.output.rich_formatter.Live") as mock_live:
+            self.formatter.start_progress(stats)
+            self.formatter.display_progress("Processing requests (2/2)...")
+            mock_live.return_value.start.assert_called_once()
+            dashboard = _render_text(self.formatter._render_progress_dashboard())
+            self.formatter.finish_progress()
+        mock_live.return_value.stop.assert_called_once()
+        assert "1/2" in dashboard
+        assert "packages/s" in dashboard
+        assert "api.github.com: 1" in dashboard
+        assert "Processing requests (2/2)..." in dashboard
+        assert "unknown requests remaining" in dashboard
+
+    def test_log_records_printed_above_progress_dashboard(self):
+        output = io.StringIO()
+        self.formatter.console = Console(file=output, force_terminal=True, width=100)
+        logger = logging.getLogger("changelog_checker.test_live")
+        handler = StderrHandler()
+        logger.addHandler(handler)
+        try:
+            self.formatter.start_progress(RunStats(cache=Cache()))
+            logger.warning("Showing markdown changelog content as plain text")
+            self.formatter.finish_progress()
+        finally:
+            logger.removeHandler(handler)
+        assert "Showing markdown changelog content as plain text" in output.getvalue()
@@ -0,0 +1,219 @@
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from changelog_checker.models import ChangeType, DependencyChange, PackageReport
+from changelog_checker.server import ChangelogServer, ChangelogService, ReportCache, SingleFlight
+from changelog_checker.utils import NetworkError
+
+UV_OUTPUT = b"Resolved 2 packages in 1ms\n - widget==1.0.0\n + widget==1.1.0\n"
+
+
+class StandInAdapter(BaseAdapter):
+    """Answers requests to a stand-in PyPI and GitHub API with the responses for the widget package."""
+
+    responses = {
+        "/pypi/widget/json": {"info": {"project_urls": {"Source": "https://github.com/acme/widget"}}},
+        "/repos/acme/widget/releases": [
+            {"tag_name": "v1.1.0", "body": "Faster widgets", "published_at": "2024-02-01T00:00:00Z"},
+            {"tag_name": "v1.0.0", "body": "First release", "published_at": "2024-01-01T00:00:00Z"},
+        ],
+        "/pypi/gadget/json": {"info": {"project_urls": {"Source": "https://github.com/acme/gadget"}}},
+        "/repos/acme/gadget/releases": [],
+        "/repos/acme/gadget/contents/": [
+            {
+                "type": "file",
+                "name": "CHANGELOG.md",
+                "path": "CHANGELOG.md",
+                "sha": "abc",
+                "download_url": "http://stand-in/raw/acme/gadget/CHANGELOG.md",
+            }
+        ],
+    }
+    files = {"/raw/acme/gadget/CHANGELOG.md": b"## 2.0.0\n- Shinier gadgets\n\n## 1.0.0\n- First release\n"}
+
+    def __init__(self):
+        super().__init__()
+        self.requests = Counter()
+        self.hosts = set()
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        path = url.path
+        self.requests[path] += 1
+        self.hosts.add(url.netloc)
+        response = requests.Response()
+        if path in self.files:
+            response.status_code = 200
+            response._content = self.files[path]
+        else:
+            response.status_code = 200 if path in self.responses else 404
+            response._content = json.dumps(self.responses.get(path, {"message": "Not Found"})).encode()
+            response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+        follower.start()
+        follower.join(0.2)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+        assert results == ["result", "result"]
+        assert len(calls) == 1
+        assert flight.do("key", lambda: "again") == "again"
+
+
+class TestReportCache:
+    def setup_method(self):
+        self.change = DependencyChange(name="Widget", change_type=ChangeType.UPDATED, old_version="1.0", new_version="1.1")
+
+    def test_reuses_reports(self):
+        cache = ReportCache()
+        generate = Mock(side_effect=lambda change: PackageReport(change, None, []))
+        first = cache.get(self.change, generate)
+        other_spelling = DependencyChange(name="widget", change_type=ChangeType.UPDATED, old_version="1.0", new_version="1.1")
+        second = cache.get(other_spelling, generate)
+        generate.assert_called_once()
+        assert second.dependency_change is other_spelling
+        assert first is not second
+
+    def test_keeps_max_size_reports(self):
+        cache = ReportCache(max_size=2)
+        generate = Mock(side_effect=lambda change: PackageReport(change, None, []))
+        changes = [DependencyChange(name=name, change_type=ChangeType.ADDED, new_version="1.0") for name in "abc"]
+        for change in changes:
+            cache.get(change, generate)
+        assert len(cache) == 2
+        cache.get(changes[0], generate)
+        assert generate.call_count == 4
+
+    def test_drops_expired_reports(self):
+        cache = ReportCache(ttl=10)
+        generate = Mock(side_effect=lambda change: PackageReport(change, None, []))
+        with patch("changelog_checker.server.time.monotonic", return_value=100.0):
+            cache.get(self.change, generate)
+        other = DependencyChange(name="other", change_type=ChangeType.ADDED, new_version="1.0")
+        with patch("changelog_checker.server.time.monotonic", return_value=200.0):
+            cache.get(other, generate)
+        assert len(cache) == 1
+
+    def test_does_not_keep_errors(self):
+        cache = ReportCache()
+        generate = Mock(side_effect=lambda change: PackageReport(change, None, [], error_message="Network error"))
+        cache.get(self.change, generate)
+        cache.get(self.change, generate)
+        assert generate.call_count == 2
+        assert len(cache) == 0
+
+
+class TestChangelogService:
+    def setup_method(self):
+        self.stand_in = StandInAdapter()
+        self.adapter_patch = patch("changelog_checker.stats.TrackedSession.get_adapter", return_value=self.stand_in)
+        self.adapter_patch.start()
+        self.service = ChangelogService(pypi_url="http://stand-in", github_api_url="http://stand-in/")
+
+    def teardown_method(self):
+        self.adapter_patch.stop()
+        self.service.close()
+
+    def test_check_with_warm_caches(self):
+        responses = [self.service.handle("POST", "/check?parser=uv", UV_OUTPUT) for _ in range(2)]
+        other_response = self.service.handle("POST", "/check", b"Resolved 1 package\n - widget==1.0.0\n + widget==1.1.0\n")
+        for response in [*responses, other_response]:
+            assert response.status == 200
+            document = json.loads(response.body)
+            entries = document["reports"][0]["changelog_entries"]
+            assert [entry["version"] for entry in entries] == ["1.1.0"]
+            assert entries[0]["content"] == "Faster widgets"
+        assert self.stand_in.requests == {"/pypi/widget/json": 1, "/repos/acme/widget/releases": 1}
+
+    def test_changelog_file_of_package_without_releases(self):
+        response = self.service.handle("POST", "/check?parser=uv", b"Resolved 1 package\n - gadget==1.0.0\n + gadget==2.0.0\n")
+        assert response.status == 200
+        entries = json.loads(response.body)["reports"][0]["changelog_entries"]
+        assert [(entry["version"], entry["content"]) for entry in entries] == [("2.0.0", "- Shinier gadgets")]
+        assert self.stand_in.hosts == {"stand-in"}
+
+    def test_prunes_cache_periodically(self):
+        self.service.cache.prune_if_due = Mock()
+        now = self.service._next_prune_check
+        with patch("changelog_checker.server.time.monotonic", side_effect=[now - 1, now, now + 1]):
+            for _ in range(3):
+                self.service.handle("GET", "/health")
+        for thread in threading.enumerate():
+            if thread.name == "cache-prune":
+                thread.join(5)
+        self.service.cache.prune_if_due.assert_called_once()
+
+    def test_check_html(self):
+        response = self.service.handle("POST", "/check?format=html", UV_OUTPUT)
+        assert response.status == 200
+        assert response.content_type.startswith("text/html")
+        assert b"Faster widgets" in response.body
+
+    def test_html_rendered_in_shared_pool(self):
+        formatter = self.service._create_formatter("html", Path("report.html"))
+        assert formatter.render_pool is not None
+        assert self.service._create_formatter("html", Path("other.html")).render_pool is formatter.render_pool
+        assert ChangelogService(render_workers=0)._create_formatter("html", Path("report.html")).render_pool is None
+
+    def test_server_close_stops_render_pool(self):
+        with patch.object(self.service, "close") as mock_close:
+            ChangelogServer(self.service, port=0).server_close()
+        mock_close.assert_called_once()
+
+    @patch("changelog_checker.server.PooledChecker.check_dependencies", side_effect=NetworkError("PyPI is down"))
+    def test_network_error_is_bad_gateway(self, mock_check_dependencies):
+        response = self.service.handle("POST", "/check?parser=uv", UV_OUTPUT)
+        assert response.status == 502
+        assert json.loads(response.body) == {"error": "PyPI is down"}
+
+    def test_diff(self):
+        old_lockfile = 'version = 1\n\n[[package]]\nname = "widget"\nversion = "1.0.0"\n'
+        new_lockfile = 'version = 1\n\n[[package]]\nname = "widget"\nversion = "1.1.0"\n'
+        body = json.dumps({"old": old_lockfile, "new": new_lockfile}).encode()
+        response = self.service.handle("POST", "/diff?lockfile=uv.lock&format=ndjson", body)
+        assert response.status == 200
+        report = json.loads(response.body.splitlines()[0])
+        assert report["dependency_change"]["old_version"] == "1.0.0"
+
+    def test_errors(self):
+        assert json.loads(self.service.handle("GET", "/health").body) == {"status": "ok"}
+        assert self.service.handle("GET", "/unknown").status == 404
+        assert self.service.handle("GET", "/check").status == 405
+        assert self.service.handle("POST", "/check?format=xml", UV_OUTPUT).status == 400
+        response = self.service.handle("POST", "/check?parser=uv", b"not package manager output")
+        assert response.status == 400
+        assert "doesn't appear to be from uv" in json.loads(response.body)["error"]
+        assert self.service.handle("POST", "/diff?lockfile=package.json", b"{}").status == 400
+        assert self.service.handle("POST", "/diff", b"[]").status == 400
@@ -0,0 +1,63 @@
+import pytest
+
+from changelog_checker.models import ChangeType, DependencyChange, PackageReport
+from changelog_checker.sharding import Shard, get_shard_key, merge_results
+
+
+def added(name, version="1.0"):
+    return DependencyChange(name=name, change_type=ChangeType.ADDED, new_version=version)
+
+
+class TestShard:
+    def setup_method(self):
+        self.changes = [added(f"package-{i}") for i in range(50)] + [added(f"library{i}") for i in range(50)]
+
+    def test_parse(self):
+        assert Shard.parse("2/4") == Shard(2, 4)
+        assert str(Shard.parse("1/1")) == "1/1"
+
+    @pytest.mark.parametrize("value", ["0/4", "5/4", "1", "a/b", "1/0", "-1/4"])
+    def test_parse_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            Shard.parse(value)
+
+    def test_shards_partition_changes(self):
+        shards = [Shard(index, 3) for index in range(1, 4)]
+        selected = [list(shard.select(self.changes)) for shard in shards]
+        assert sorted(change.name for changes in selected for change in changes) == sorted(
+            change.name for change in self.changes
+        )
+        assert all(changes for changes in selected)
+
+    def test_shard_key_is_normalized_name(self):
+        assert get_shard_key("OpenTelemetry_API") == "opentelemetry-api"
+        shard_indexes = {
+            index
+            for index in range(1, 5)
+            for name in ["Django_Filter", "django-filter", "django.filter"]
+            if Shard(index, 4).contains(added(name))
+        }
+        assert len(shard_indexes) == 1
+
+    def test_shared_prefixes_spread_over_shards(self):
+        names = [f"django-{i}" for i in range(20)]
+        assert all(any(Shard(index, 4).contains(added(name)) for name in names) for index in range(1, 5))
+
+    def test_shard_is_deterministic(self):
+        assert Shard(1, 2).contains(added("requests")) == (not Shard(2, 2).contains(added("requests")))
+        assert [change.name for change in Shard(2, 3).select(self.changes)] == [
+            change.name for change in Shard(2, 3).select(reversed(self.changes))
+        ][::-1]
+
+
+class TestMergeResults:
+    def test_merge_results_drops_duplicates(self):
+        reports = [PackageReport(dependency_change=added(name), package_info=None, changelog_entries=[]) for name in "abc"]
+        duplicate = PackageReport(dependency_change=added("b"), package_info=None, changelog_entries=[])
+        merged = merge_results([[reports[0], reports[1]], [duplicate, reports[2]]])
+        assert merged == reports
+
+    def test_merge_results_drops_differently_spelled_duplicates(self):
+        report = PackageReport(dependency_change=added("Foo_Bar"), package_info=None, changelog_entries=[])
+        duplicate = PackageReport(dependency_change=added("foo-bar"), package_info=None, changelog_entries=[])
+        assert merge_results([[report], [duplicate]]) == [report]
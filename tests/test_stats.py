@@ -0,0 +1,57 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from changelog_checker.cache import Cache
+from changelog_checker.stats import RunStats, TrackedSession
+
+
+class TestRunStats:
+    def setup_method(self):
+        self.cache = Cache()
+        self.stats = RunStats(cache=self.cache)
+
+    def test_snapshot_rate_and_eta(self):
+        self.stats.start(4)
+        self.stats.package_completed()
+        with patch("changelog_checker.stats.time.monotonic", return_value=self.stats._started_at + 2):
+            snapshot = self.stats.snapshot()
+        assert snapshot.completed == 1
+        assert snapshot.rate == 0.5
+        assert snapshot.eta == 6
+
+    def test_eta_unknown_before_first_package(self):
+        self.stats.start(4)
+        assert self.stats.snapshot().eta is None
+
+    def test_cache_hits_and_misses(self):
+        self.cache.get_bytes("namespace", "key")
+        self.cache.set_bytes("namespace", "key", b"data")
+        self.cache.get_bytes("namespace", "key")
+        snapshot = self.stats.snapshot()
+        assert snapshot.cache_hits == 1
+        assert snapshot.cache_misses == 1
+
+    def test_tracked_session_records_requests(self):
+        session = TrackedSession(self.stats)
+        response = Mock(headers={"X-RateLimit-Remaining": "4999"})
+
+        def request(*args, **kwargs):
+            assert self.stats.snapshot().in_flight == {"api.github.com": 1}
+            return response
+
+        with patch.object(requests.Session, "request", side_effect=request):
+            assert session.get("https://api.github.com/repos/owner/repo") is response
+        snapshot = self.stats.snapshot()
+        assert snapshot.in_flight == {}
+        assert snapshot.rate_limit_remaining == 4999
+
+    def test_tracked_session_records_failed_requests(self):
+        session = TrackedSession(self.stats)
+        with (
+            patch.object(requests.Session, "request", side_effect=requests.exceptions.ConnectionError()),
+            pytest.raises(requests.exceptions.ConnectionError),
+        ):
+            session.get("https://pypi.org/pypi/requests/json")
+        assert self.stats.snapshot().in_flight == {}
@@ -0,0 +1,146 @@
+import pytest
+
+from changelog_checker.models import ChangeType, DependencyChange
+from changelog_checker.parsers.uv_lock_parser import UVLockParser
+from changelog_checker.utils import ParserError
+
+OLD_LOCK = """
+version = 1
+requires-python = ">=3.10"
+resolution-markers = [
+    "python_full_version >= '3.12'",
+    "python_full_version < '3.12'",
+]
+
+[[package]]
+name = "myproject"
+version = "0.1.0"
+source = { editable = "." }
+
+[[package]]
+name = "numpy"
+version = "1.26.4"
+source = { registry = "https://pypi.org/simple" }
+resolution-markers = ["python_full_version < '3.12'"]
+
+[[package]]
+name = "numpy"
+version = "2.0.0"
+source = { registry = "https://pypi.org/simple" }
+resolution-markers = ["python_full_version >= '3.12'"]
+
+[[package]]
+name = "requests"
+version = "2.28.0"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "six"
+version = "1.16.0"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "urllib3"
+version = "2.0.0"
+source = { registry = "https://pypi.org/simple" }
+"""
+
+NEW_LOCK = """
+version = 1
+requires-python = ">=3.10"
+
+[[package]]
+name = "myproject"
+version = "0.2.0"
+source = { editable = "." }
+
+[[package]]
+name = "certifi"
+version = "2024.2.2"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "numpy"
+version = "1.26.4"
+source = { registry = "https://pypi.org/simple" }
+resolution-markers = ["python_full_version < '3.12'"]
+
+[[package]]
+name = "numpy"
+version = "2.1.0"
+source = { registry = "https://pypi.org/simple" }
+resolution-markers = ["python_full_version >= '3.12'"]
+
+[[package]]
+name = "requests"
+version = "2.29.0"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "urllib3"
+version = "2.0.0"
+source = { registry = "https://pypi.org/simple" }
+"""
+
+
+class TestUVLockParser:
+    def setup_method(self):
+        self.parser = UVLockParser()
+
+    def test_get_package_manager_name(self):
+        assert self.parser.get_package_manager_name() == "uv"
+
+    def test_load_packages_skips_local_sources(self):
+        packages = self.parser.load_packages(OLD_LOCK)
+        assert [package.name for package in packages] == ["numpy", "numpy", "requests", "six", "urllib3"]
+        assert packages[0].markers == ("python_full_version < '3.12'",)
+
+    def test_diff(self):
+        assert self.parser.diff(OLD_LOCK, NEW_LOCK) == [
+            DependencyChange(name="certifi", change_type=ChangeType.ADDED, new_version="2024.2.2"),
+            DependencyChange(name="numpy", change_type=ChangeType.UPDATED, old_version="2.0.0", new_version="2.1.0"),
+            DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0"),
+            DependencyChange(name="six", change_type=ChangeType.REMOVED, old_version="1.16.0"),
+        ]
+
+    def test_diff_identical_lockfiles(self):
+        assert self.parser.diff(OLD_LOCK, OLD_LOCK) == []
+
+    def test_diff_pairs_versions_in_order_when_markers_change(self):
+        old_lock = """
+[[package]]
+name = "numpy"
+version = "1.26.4"
+resolution-markers = ["python_full_version < '3.12'"]
+
+[[package]]
+name = "numpy"
+version = "2.0.0"
+resolution-markers = ["python_full_version >= '3.12'"]
+"""
+        new_lock = """
+[[package]]
+name = "numpy"
+version = "2.1.0"
+resolution-markers = ["python_full_version >= '3.13'"]
+
+[[package]]
+name = "numpy"
+version = "1.26.5"
+resolution-markers = ["python_full_version < '3.13'"]
+
+[[package]]
+name = "numpy"
+version = "2.2.0"
+resolution-markers = ["python_full_version >= '3.14'"]
+"""
+        changes = self.parser.diff(old_lock, new_lock)
+        assert [(change.change_type, change.old_version, change.new_version) for change in changes] == [
+            (ChangeType.UPDATED, "1.26.4", "1.26.5"),
+            (ChangeType.UPDATED, "2.0.0", "2.1.0"),
+            (ChangeType.ADDED, None, "2.2.0"),
+        ]
+
+    def test_invalid_lockfile(self):
+        with pytest.raises(ParserError, match="Invalid uv.lock file"):
+            self.parser.load_packages("[[package]\nname =")
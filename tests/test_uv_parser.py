@@ -1,4 +1,4 @@
-from changelog_checker.models import ChangeType
+from changelog_checker.models import ChangeType, DependencyChange
 from changelog_checker.parsers.uv_parser import UVParser
 
 
@@ -149,3 +149,92 @@ class TestUVParser:
         assert changes[0].change_type == ChangeType.UPDATED
         assert changes[1].name == "new-package"
         assert changes[1].change_type == ChangeType.ADDED
+
+    def test_parse_lock_upgrade_dry_run(self):
+        output = """
+        Resolved 42 packages in 1.23s
+        Update anyio v4.3.0 -> v4.4.0
+        Add sniffio v1.3.1
+        Remove old-package v0.9.0
+        Would update certifi v2024.2.2 -> v2024.6.2
+        """
+        assert self.parser.validate_output(output)
+        assert self.parser.parse(output) == [
+            DependencyChange(name="anyio", change_type=ChangeType.UPDATED, old_version="4.3.0", new_version="4.4.0"),
+            DependencyChange(name="sniffio", change_type=ChangeType.ADDED, new_version="1.3.1"),
+            DependencyChange(name="old-package", change_type=ChangeType.REMOVED, old_version="0.9.0"),
+            DependencyChange(name="certifi", change_type=ChangeType.UPDATED, old_version="2024.2.2", new_version="2024.6.2"),
+        ]
+
+    def test_parse_lock_upgrade_multiple_versions(self):
+        output = "Updated numpy v1.26.4, v2.0.0 -> v1.26.4, v2.1.0\n"
+        assert self.parser.parse(output) == [
+            DependencyChange(name="numpy", change_type=ChangeType.UPDATED, old_version="2.0.0", new_version="2.1.0")
+        ]
+
+    def test_parse_pip_compile_diff(self):
+        output = """
+        --- a/requirements.txt
+        +++ b/requirements.txt
+        @@ -1,6 +1,6 @@
+        -requests==2.28.0 \\
+        +requests==2.29.0 \\
+             --hash=sha256:abc
+        -urllib3[socks]==1.26.0 ; python_version < "3.12"
+        +urllib3[socks]==2.0.0 ; python_version < "3.12"
+        +certifi==2024.2.2
+             # via requests
+        """
+        assert self.parser.validate_output(output)
+        assert self.parser.parse(output) == [
+            DependencyChange(name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0"),
+            DependencyChange(name="urllib3", change_type=ChangeType.UPDATED, old_version="1.26.0", new_version="2.0.0"),
+            DependencyChange(name="certifi", change_type=ChangeType.ADDED, new_version="2024.2.2"),
+        ]
+
+    def test_iter_parse_yields_updates_before_end_of_output(self):
+        read_lines = []
+
+        def lines():
+            for line in ["Resolved 3 packages in 1ms\n", " - requests==2.28.0\n", " + requests==2.29.0\n", " + new==1.0\n"]:
+                read_lines.append(line)
+                yield line
+
+        changes = self.parser.iter_parse(lines())
+        assert next(changes) == DependencyChange(
+            name="requests", change_type=ChangeType.UPDATED, old_version="2.28.0", new_version="2.29.0"
+        )
+        assert len(read_lines) == 3
+        assert list(changes) == [DependencyChange(name="new", change_type=ChangeType.ADDED, new_version="1.0")]
+
+    def test_iter_parse_matches_parse(self):
+        output = """
+        - requests==2.28.0
+        + requests==2.29.0
+        - old-package==1.0.0
+        + new-package==1.0.0
+        Update anyio v4.3.0 -> v4.4.0
+        """
+        streamed = list(self.parser.iter_parse(output.splitlines(keepends=True)))
+        assert sorted(streamed, key=lambda change: change.name) == sorted(
+            self.parser.parse(output), key=lambda change: change.name
+        )
+
+    def test_marker_only_diff_ignored(self):
+        output = """
+-colorama==0.4.6 ; sys_platform == 'win32'
++colorama==0.4.6 ; platform_system == 'Windows'
+-requests[socks]==2.28.0
++requests==2.28.0
+"""
+        assert self.parser.parse(output) == []
+        assert list(self.parser.iter_parse(output.splitlines())) == []
+
+    def test_names_normalized_when_pairing(self):
+        output = """
+-Foo_Bar==1.0.0
++foo-bar==1.1.0
+"""
+        expected = [DependencyChange(name="Foo_Bar", change_type=ChangeType.UPDATED, old_version="1.0.0", new_version="1.1.0")]
+        assert self.parser.parse(output) == expected
+        assert list(self.parser.iter_parse(output.splitlines())) == expected